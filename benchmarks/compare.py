@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+This module compares two sets of benchmark results saved by benchmarks.run, such as
+those of two commits, for example:
+
+    python -m benchmarks.compare benchmarks/results/<base>.json benchmarks/results/<new>.json
+
+Benchmarks are matched by name and number of rows, and compared by their minimum time,
+which is the least affected by other activity on the machine. The exit status is 1 if
+any benchmark got slower by more than the threshold.
+"""
+
+import json
+import sys
+from argparse import ArgumentParser
+
+from benchmarks.run import RESULTS_FORMAT
+from meteorite_filter.tui.table import TablePrinter
+
+
+def load_results(path: str) -> dict:
+    """
+    Loads a set of benchmark results.
+
+    Args:
+        path (str): The path of the JSON file saved by benchmarks.run.
+
+    Raises:
+        ValueError: If the file is not in a format this module understands.
+
+    Returns:
+        dict: The results.
+    """
+    with open(path, encoding='utf-8') as file:
+        report = json.load(file)
+
+    if report.get('format') != RESULTS_FORMAT:
+        raise ValueError
+
+    return report
+
+
+def compare(base: dict, new: dict) -> list[dict]:
+    """
+    Compares the benchmarks two sets of results have in common.
+
+    Args:
+        base (dict): The results to compare against.
+        new (dict): The results to compare.
+
+    Returns:
+        list[dict]: A comparison for each benchmark in both sets of results, in the order of the
+            new results, with its name, number of rows, minimum times, and the change in time as
+            a fraction of the base time (positive if it got slower).
+    """
+    base_times = {(result['benchmark'], result['rows']): result['min'] for result in base['results']}
+    comparisons = []
+
+    for result in new['results']:
+        base_time = base_times.get((result['benchmark'], result['rows']))
+
+        if base_time is None:
+            continue
+
+        comparisons.append({
+            'benchmark': result['benchmark'],
+            'rows': result['rows'],
+            'base': base_time,
+            'new': result['min'],
+            'change': (result['min'] - base_time) / base_time if base_time > 0 else 0.0
+        })
+
+    return comparisons
+
+
+def comparison_table(comparisons: list[dict], threshold: float) -> TablePrinter:
+    """
+    Creates a table to print a comparison to the terminal.
+
+    Args:
+        comparisons (list[dict]): The comparisons, as returned by compare.
+        threshold (float): The change at which a benchmark is marked as slower or faster.
+
+    Returns:
+        TablePrinter: The table.
+    """
+    def verdict(change: float) -> str:
+        if change > threshold:
+            return 'slower'
+
+        return 'faster' if change < -threshold else ''
+
+    entries = [(
+        comparison['benchmark'],
+        comparison['rows'],
+        round(comparison['base'], 4),
+        round(comparison['new'], 4),
+        f'{comparison["change"]:+.1%}',
+        verdict(comparison['change'])
+    ) for comparison in comparisons]
+    return TablePrinter(('BENCHMARK', 'ROWS', 'BASE (s)', 'NEW (s)', 'CHANGE', ''), entries)
+
+
+def _commit(report: dict) -> str:
+    commit = report['environment']['commit']
+    name = commit[:12] if commit is not None else 'unknown commit'
+    return name + (' (with uncommitted changes)' if report['environment']['dirty'] else '')
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser(description='Compare two sets of benchmark results.')
+    parser.add_argument('base', help='the results to compare against')
+    parser.add_argument('new', help='the results to compare')
+    parser.add_argument('-t', '--threshold', type=float, default=0.1, help='the fraction by which a benchmark must change to count as slower or faster (default: 0.1)')
+    args = parser.parse_args(argv)
+
+    try:
+        base, new = load_results(args.base), load_results(args.new)
+    except (OSError, ValueError) as error:
+        parser.error(f'could not load results: {str(error) or "unknown format"}')
+
+    comparisons = compare(base, new)
+    print(f'Comparing {_commit(new)} against {_commit(base)}')
+    print(comparison_table(comparisons, args.threshold))
+
+    return int(any(comparison['change'] > args.threshold for comparison in comparisons))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
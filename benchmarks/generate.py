@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+This module generates synthetic meteorite landings files for benchmarking.
+
+The files use the same 12 tab-separated fields as data/meteorite_landings_data.txt, and
+each field's null rate and distribution of values is modelled on that file (45,716 rows):
+
+    name         Collection area and id (such as "Yamato 01234") for 93% of rows, otherwise a place
+    id           Increasing, with gaps
+    nametype     Valid, or Relict for 0.16% of rows
+    recclass     The 25 most common classes at their observed rates, then a long tail
+    mass (g)     Log-normal (log10 mean 1.64, standard deviation 1.09), empty for 0.3% of rows
+    fall         Fell for 2.4% of rows, otherwise Found
+    year         Weighted by period, most from 1970 to 2009, empty for 0.6% of rows
+    reclat,      Empty for 16% of rows, (0, 0) for 13.6%, one of the large Antarctic
+    reclong,       finds for 21.7%, otherwise spread across deserts and the rest of the globe
+    GeoLocation
+    States,      Both set for 3.6% of rows, otherwise empty
+    Counties
+
+The fields are generated independently of each other. The same row count and seed always
+produce the same file.
+"""
+
+import random
+from argparse import ArgumentParser
+from collections.abc import Iterator
+from itertools import accumulate
+
+
+FIELDNAMES = ['name', 'id', 'nametype', 'recclass', 'mass (g)', 'fall', 'year', 'reclat', 'reclong', 'GeoLocation', 'States', 'Counties']
+
+AREAS = {
+    'Yamato': 7269, 'Northwest Africa': 4499, 'Queen Alexandra Range': 3444, 'Grove Mountains': 2494,
+    'Elephant Moraine': 2187, 'Miller Range': 2038, 'Lewis Cliff': 1870, 'Allan Hills': 1754,
+    'LaPaz Icefield': 1550, 'Asuka': 1509, 'Dhofar': 1404, 'Meteorite Hills': 1130, 'Dar al Gani': 1047,
+    'MacAlpine Hills': 1026, 'Dominion Range': 846, 'Frontier Mountain': 782, 'Larkman Nunatak': 700,
+    'Jiddat al Harasis': 696, 'Pecora Escarpment': 633, 'Sayh al Uhaymir': 471, 'Grosvenor Mountains': 403,
+    'Acfer': 394, 'Graves Nunataks': 352, 'Hammadah al Hamra': 341, 'Sahara': 291, 'Ramlat as Sahmah': 239,
+    'Roberts Massif': 229, 'Patuxent Range': 181
+}
+
+# The number of rows named after a place rather than a collection area and number
+UNNUMBERED_WEIGHT = 3296
+
+CLASSES = {
+    'L6': 8285, 'H5': 7142, 'L5': 4796, 'H6': 4528, 'H4': 4211, 'LL5': 2766, 'LL6': 2043, 'L4': 1253,
+    'H4/5': 428, 'CM2': 416, 'H3': 386, 'L3': 365, 'CO3': 335, 'Ureilite': 300, '"Iron, IIIAB"': 285,
+    'LL4': 268, 'CV3': 256, 'Diogenite': 241, 'Howardite': 240, 'LL': 225, 'Eucrite': 221,
+    'Eucrite-pmict': 207, 'E3': 206, 'H5/6': 193, 'Mesosiderite': 137
+}
+
+# Less common classes, which share the rows not in one of the classes above
+RARE_CLASSES = [
+    'L4-6', 'H3.8', 'CK4', 'CR2', 'LL3', 'EH3', 'L3.6', 'H3-6', 'L/LL6', 'R3.8', 'CI1', 'C2-ung',
+    'Acapulcoite', 'Lodranite', 'Pallasite', 'Angrite', 'Aubrite', 'Winonaite', '"Iron, IIAB"',
+    '"Iron, IAB-MG"', '"Iron, ungrouped"', 'Martian (shergottite)', 'Lunar (anorth)'
+]
+RARE_CLASSES_WEIGHT = 5983
+
+# (first year, last year, number of rows)
+YEARS = [(860, 1799, 80), (1800, 1899, 668), (1900, 1969, 1566), (1970, 1979, 4969), (1980, 1989, 6822), (1990, 1999, 11619), (2000, 2009, 17757), (2010, 2013, 1963)]
+
+# ((latitude, longitude), number of rows), where None is an empty location and the last entry is spread out
+LOCATIONS = [(None, 7315), ((0.0, 0.0), 6214), ((-71.5, 35.66667), 4761), ((-84.0, 168.0), 3040), ((-72.0, 26.0), 1505), ((-79.68333, 159.75), 657), ('spread', 22224)]
+
+MASS_LOG_MEAN = 1.635
+MASS_LOG_STDEV = 1.094
+NULL_MASS_RATE = 0.0029
+NULL_YEAR_RATE = 0.006
+RELICT_RATE = 0.0016
+FELL_RATE = 0.024
+STATES_RATE = 0.036
+ID_GAP_RATE = 0.25
+
+_SYLLABLES = ['ba', 'ca', 'de', 'el', 'ga', 'hol', 'ka', 'la', 'ma', 'nor', 'o', 'pe', 'ra', 'san', 'ta', 'ur', 'vil', 'win', 'zu']
+
+
+def generate_lines(count: int, seed: int = 0) -> Iterator[str]:
+    """
+    Generates the lines of a landings file, starting with the header.
+
+    Args:
+        count (int): The number of rows, not counting the header.
+        seed (int, optional): The seed of the random number generator. Defaults to 0.
+
+    Raises:
+        ValueError: If the count is negative.
+
+    Returns:
+        Iterator[str]: The lines, without newlines.
+    """
+    if count < 0:
+        raise ValueError
+
+    rand = random.Random(seed)
+    random_ = rand.random
+    choices = rand.choices
+    gauss = rand.gauss
+    uniform = rand.uniform
+    randint = rand.randint
+
+    areas = list(AREAS) + [None]
+    area_weights = list(accumulate(list(AREAS.values()) + [UNNUMBERED_WEIGHT]))
+    classes = list(CLASSES) + [None]
+    class_weights = list(accumulate(list(CLASSES.values()) + [RARE_CLASSES_WEIGHT]))
+    year_weights = list(accumulate(weight for _, _, weight in YEARS))
+    location_weights = list(accumulate(weight for _, weight in LOCATIONS))
+
+    yield '\t'.join(FIELDNAMES)
+
+    row_id = 0
+    for _ in range(count):
+        row_id += 1 + (random_() < ID_GAP_RATE)
+
+        area = choices(areas, cum_weights=area_weights)[0]
+        name = f'{area} {row_id:05d}' if area is not None else _place_name(rand)
+
+        recclass = choices(classes, cum_weights=class_weights)[0]
+        if recclass is None:
+            recclass = RARE_CLASSES[randint(0, len(RARE_CLASSES) - 1)]
+
+        if random_() < NULL_MASS_RATE:
+            mass = ''
+        else:
+            grams = 10 ** gauss(MASS_LOG_MEAN, MASS_LOG_STDEV)
+            mass = str(round(grams)) if grams >= 100 else f'{round(grams, 1 if grams >= 1 else 2):g}'
+
+        if random_() < NULL_YEAR_RATE:
+            year = ''
+        else:
+            first, last, _ = YEARS[choices(range(len(YEARS)), cum_weights=year_weights)[0]]
+            year = str(randint(first, last))
+
+        location = LOCATIONS[choices(range(len(LOCATIONS)), cum_weights=location_weights)[0]][0]
+        if location is None:
+            lat = long = geolocation = ''
+        else:
+            if location == 'spread':
+                if random_() < 0.5: # Hot deserts of North Africa and the Middle East
+                    location = (round(uniform(18, 35), 5), round(uniform(-15, 60), 5))
+                else:
+                    location = (round(uniform(-85, 75), 5), round(uniform(-180, 180), 5))
+
+            lat, long = repr(location[0]), repr(location[1])
+            geolocation = f'"({lat}, {long})"'
+
+        if random_() < STATES_RATE:
+            states, counties = str(randint(1, 51)), str(randint(1, 3210))
+        else:
+            states = counties = ''
+
+        yield '\t'.join((
+            name,
+            str(row_id),
+            'Relict' if random_() < RELICT_RATE else 'Valid',
+            recclass,
+            mass,
+            'Fell' if random_() < FELL_RATE else 'Found',
+            year,
+            lat,
+            long,
+            geolocation,
+            states,
+            counties
+        ))
+
+
+def write_landings(path: str, count: int, seed: int = 0) -> None:
+    """
+    Writes a synthetic landings file.
+
+    Args:
+        path (str): The path of the file to write.
+        count (int): The number of rows, not counting the header.
+        seed (int, optional): The seed of the random number generator. Defaults to 0.
+
+    Raises:
+        ValueError: If the count is negative.
+    """
+    with open(path, 'w', encoding='utf-8', newline='\n') as file:
+        for line in generate_lines(count, seed):
+            file.write(line)
+            file.write('\n')
+
+
+def _place_name(rand: random.Random) -> str:
+    """
+    Generates the name of a meteorite named after the place it was found, such as "Halora".
+
+    Args:
+        rand (random.Random): The random number generator.
+
+    Returns:
+        str: The name.
+    """
+    return ''.join(rand.choice(_SYLLABLES) for _ in range(rand.randint(2, 4))).capitalize()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = ArgumentParser(description='Generate a synthetic meteorite landings file.')
+    parser.add_argument('path', help='the path of the file to write')
+    parser.add_argument('-n', '--rows', type=int, default=10_000, help='the number of rows (default: 10,000)')
+    parser.add_argument('-s', '--seed', type=int, default=0, help='the seed of the random number generator (default: 0)')
+    args = parser.parse_args(argv)
+
+    if args.rows < 0:
+        parser.error('the number of rows cannot be negative')
+
+    write_landings(args.path, args.rows, args.seed)
+
+
+if __name__ == "__main__":
+    main()
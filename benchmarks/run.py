@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+This module times each stage of the application on synthetic landings files and saves
+the results as JSON, so they can be compared between commits with benchmarks.compare.
+
+Each stage is timed separately, several times, on files of each requested size:
+
+    parse_text      Parsing every row with DSVDictReader in text mode
+    parse_binary    Parsing every row with DSVDictReader in binary (memory-mapped) mode
+    parse_parallel  Parsing every row into a MeteoriteTable with read_table_parallel, using
+                    a worker process per CPU
+    filter_mass     filter_data on a MeteoriteTable, for masses from 10 g to 1 kg
+    filter_year     filter_data on a MeteoriteTable, for years from 1950 to 2000
+    write_dsv       Writing every row to a tab-separated file with DSVDictWriter
+    write_xls       Writing every row to an xls file with ExcelDictWriter
+    render_table    Rendering a TablePrinter of the name and mass of every row with a mass
+    render_page     Rendering the first page of the same table with a Pager
+
+The ExcelDictWriter benchmark is skipped on files of over 1,000,000 rows (see ROW_LIMITS).
+
+Run it from the root of the repository, with the meteorite_filter package installed or
+on the path, for example:
+
+    PYTHONPATH=src python -m benchmarks.run --rows 10000 100000
+"""
+
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+from argparse import ArgumentParser
+from collections import deque
+from collections.abc import Callable, Sequence
+from datetime import datetime, timezone
+from functools import cached_property
+from importlib.util import find_spec
+from pathlib import Path
+from time import perf_counter
+
+from benchmarks.generate import FIELDNAMES, write_landings
+from meteorite_filter.constants import TYPE_MAP
+from meteorite_filter.dsv.columnar import MeteoriteTable
+from meteorite_filter.dsv.parallel import read_table_parallel
+from meteorite_filter.dsv.reader import DSVDictReader
+from meteorite_filter.dsv.writer import DSVDictWriter
+from meteorite_filter.filter_data import filter_data
+from meteorite_filter.output import _NumberedEntries
+from meteorite_filter.tui.pager import Pager
+from meteorite_filter.tui.table import TablePrinter
+
+
+RESULTS_FORMAT = 1
+
+BENCHMARKS_PATH = Path(__file__).parent
+DEFAULT_DATA_DIR = BENCHMARKS_PATH / 'data'
+DEFAULT_RESULTS_DIR = BENCHMARKS_PATH / 'results'
+
+# The largest files some benchmarks are run on. ExcelDictWriter holds every cell in memory
+# until the file is saved, about 1.8 KB per row, so larger files are skipped.
+ROW_LIMITS = {
+    'write_xls': 1_000_000
+}
+
+TABLE_HEADER = ('', 'NAME', 'MASS (g)')
+PAGE_SIZE = 50
+
+
+class Workload:
+    """
+    The inputs shared by the benchmarks for one data file. Each input is only created the
+    first time a benchmark needs it, and is not included in any timing.
+    """
+    def __init__(self, path: str, tmp_dir: str) -> None:
+        """
+        Initializes an instance of the Workload class.
+
+        Args:
+            path (str): The path of the landings file.
+            tmp_dir (str): A directory for the files written by the benchmarks.
+        """
+        self.path = path
+        self.tmp_dir = tmp_dir
+
+
+    @cached_property
+    def table(self) -> MeteoriteTable:
+        """
+        Get every row of the file as a MeteoriteTable, as the application loads it.
+
+        Returns:
+            MeteoriteTable: The table.
+        """
+        return MeteoriteTable.from_reader(DSVDictReader(self.path, '\t', type_map=TYPE_MAP, mode='rb'))
+
+
+    @cached_property
+    def entries(self) -> Sequence[tuple]:
+        """
+        Get the table entries TerminalOutput displays for a query on the full range of masses:
+        the number, name, and mass of every row with a known mass.
+
+        Returns:
+            Sequence[tuple]: The entries.
+        """
+        return _NumberedEntries(filter_data(self.table, 'mass (g)'), 'mass (g)')
+
+
+def _parse(workload: Workload, mode: str) -> Callable[[], object]:
+    return lambda: deque(DSVDictReader(workload.path, '\t', type_map=TYPE_MAP, mode=mode), maxlen=0)
+
+
+def _parse_parallel(workload: Workload) -> Callable[[], object]:
+    return lambda: read_table_parallel(workload.path, '\t', TYPE_MAP)
+
+
+def _filter(workload: Workload, field: str, min_val, max_val) -> Callable[[], object]:
+    table = workload.table
+    return lambda: filter_data(table, field, min_val, max_val)
+
+
+def _write_dsv(workload: Workload) -> Callable[[], object]:
+    table = workload.table
+    path = str(Path(workload.tmp_dir) / 'bench.txt')
+
+    def write():
+        with DSVDictWriter(path, FIELDNAMES, delimiter='\t', buffer_size=1024 * 1024) as writer: # As TextFileOutput writes
+            writer.writeheader()
+            writer.writerows(table)
+
+    return write
+
+
+def _write_xls(workload: Workload) -> Callable[[], object]:
+    from meteorite_filter.dsv.excel import ExcelDictWriter
+    table = workload.table
+    path = str(Path(workload.tmp_dir) / 'bench.xls')
+
+    def write():
+        writer = ExcelDictWriter(path, FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(table)
+        writer.save()
+
+    return write
+
+
+def _render_table(workload: Workload) -> Callable[[], object]:
+    entries = workload.entries
+    return lambda: str(TablePrinter(TABLE_HEADER, entries))
+
+
+def _render_page(workload: Workload) -> Callable[[], object]:
+    entries = workload.entries
+    return lambda: Pager(TablePrinter(TABLE_HEADER, entries), PAGE_SIZE).render()
+
+
+# Each benchmark prepares its inputs from a workload, and returns the function to time
+BENCHMARKS: dict[str, Callable[[Workload], Callable[[], object]]] = {
+    'parse_text': lambda workload: _parse(workload, 'r'),
+    'parse_binary': lambda workload: _parse(workload, 'rb'),
+    'parse_parallel': _parse_parallel,
+    'filter_mass': lambda workload: _filter(workload, 'mass (g)', 10, 1000),
+    'filter_year': lambda workload: _filter(workload, 'year', 1950, 2000),
+    'write_dsv': _write_dsv,
+    'write_xls': _write_xls,
+    'render_table': _render_table,
+    'render_page': _render_page
+}
+
+
+def time_function(func: Callable[[], object], repeat: int) -> list[float]:
+    """
+    Times several calls of a function. Garbage is collected before each call.
+
+    Args:
+        func (Callable[[], object]): The function.
+        repeat (int): The number of calls.
+
+    Returns:
+        list[float]: The time taken by each call, in seconds.
+    """
+    samples = []
+
+    for _ in range(repeat):
+        gc.collect()
+        start = perf_counter()
+        func()
+        samples.append(perf_counter() - start)
+
+    return samples
+
+
+def run_benchmarks(path: str, rows: int, names: list[str], repeat: int) -> list[dict]:
+    """
+    Times benchmarks on a landings file.
+
+    Args:
+        path (str): The path of the landings file.
+        rows (int): The number of rows in the file.
+        names (list[str]): The benchmarks to run, keys of BENCHMARKS.
+        repeat (int): The number of times to time each benchmark.
+
+    Raises:
+        ValueError: If a benchmark is unknown, or the repeat count is not positive.
+
+    Returns:
+        list[dict]: A result for each benchmark, with its name, the number of rows, every
+            time taken, the minimum and median times, and the rows per second at the minimum.
+            Benchmarks are skipped on files larger than their limit in ROW_LIMITS.
+    """
+    if repeat <= 0 or any(name not in BENCHMARKS for name in names):
+        raise ValueError
+
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workload = Workload(path, tmp_dir)
+
+        for name in names:
+            if rows > ROW_LIMITS.get(name, rows):
+                continue
+
+            samples = time_function(BENCHMARKS[name](workload), repeat)
+            results.append({
+                'benchmark': name,
+                'rows': rows,
+                'samples': samples,
+                'min': min(samples),
+                'median': statistics.median(samples),
+                'rows_per_second': rows / min(samples) if min(samples) > 0 else None
+            })
+
+    return results
+
+
+def landings_file(data_dir: Path, rows: int, seed: int) -> Path:
+    """
+    Get the path of a synthetic landings file, generating it if it does not exist yet.
+
+    Args:
+        data_dir (Path): The directory the generated files are kept in.
+        rows (int): The number of rows.
+        seed (int): The seed of the random number generator.
+
+    Returns:
+        Path: The path of the file.
+    """
+    path = data_dir / f'landings_{rows}_seed{seed}.txt'
+
+    if not path.exists():
+        data_dir.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix('.partial')
+        write_landings(str(partial), rows, seed)
+        partial.replace(path) # Only complete files are reused
+
+    return path
+
+
+def environment() -> dict:
+    """
+    Get a description of the code and machine being benchmarked.
+
+    Returns:
+        dict: The git commit (or None outside a repository) and whether the working tree had
+            changes, the Python version and implementation, the platform, the number of CPUs
+            (which parse_parallel starts a worker process for each of), and the NumPy version
+            (or None if it is not installed).
+    """
+    def git(*args: str) -> str | None:
+        try:
+            return subprocess.run(['git', *args], cwd=BENCHMARKS_PATH, capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    commit = git('rev-parse', 'HEAD')
+    status = git('status', '--porcelain', '--untracked-files=no')
+
+    numpy = None
+    if find_spec('numpy') is not None:
+        import numpy
+        numpy = numpy.__version__
+
+    return {
+        'commit': commit,
+        'dirty': bool(status) if commit is not None else None,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'numpy': numpy
+    }
+
+
+def results_table(results: list[dict]) -> TablePrinter:
+    """
+    Creates a table to print benchmark results to the terminal.
+
+    Args:
+        results (list[dict]): The results, as returned by run_benchmarks.
+
+    Returns:
+        TablePrinter: The table.
+    """
+    entries = [(
+        result['benchmark'],
+        result['rows'],
+        round(result['min'], 4),
+        round(result['median'], 4),
+        round(result['rows_per_second']) if result['rows_per_second'] is not None else ''
+    ) for result in results]
+    return TablePrinter(('BENCHMARK', 'ROWS', 'MIN (s)', 'MEDIAN (s)', 'ROWS/s'), entries)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = ArgumentParser(description='Time each stage of the application on synthetic landings files.')
+    parser.add_argument('-n', '--rows', type=int, nargs='+', default=[10_000, 100_000], help='the numbers of rows to benchmark (default: 10000 100000)')
+    parser.add_argument('-b', '--benchmark', dest='benchmarks', choices=list(BENCHMARKS), nargs='+', default=list(BENCHMARKS), help='the benchmarks to run (default: all)')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='the number of times to time each benchmark (default: 3)')
+    parser.add_argument('-s', '--seed', type=int, default=0, help='the seed of the generated data (default: 0)')
+    parser.add_argument('--data-dir', type=Path, default=DEFAULT_DATA_DIR, help='where generated data files are kept between runs (default: benchmarks/data)')
+    parser.add_argument('-o', '--output', type=Path, help='the JSON file to save the results to (default: benchmarks/results/<commit>.json)')
+    args = parser.parse_args(argv)
+
+    if args.repeat <= 0 or any(rows <= 0 for rows in args.rows):
+        parser.error('the numbers of rows and the repeat count must be positive')
+
+    report = {
+        'format': RESULTS_FORMAT,
+        'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'environment': environment(),
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'results': []
+    }
+
+    for rows in args.rows:
+        path = landings_file(args.data_dir, rows, args.seed)
+        results = run_benchmarks(str(path), rows, args.benchmarks, args.repeat)
+        report['results'].extend(results)
+
+        print(results_table(results))
+
+        skipped = [name for name in args.benchmarks if rows > ROW_LIMITS.get(name, rows)]
+        if skipped:
+            print(f'Skipped {", ".join(skipped)} at {rows:,} rows, as it would use too much memory\n')
+
+    output = args.output
+    if output is None:
+        commit = report['environment']['commit']
+        name = (commit[:12] if commit is not None else 'results') + ('-dirty' if report['environment']['dirty'] else '')
+        output = DEFAULT_RESULTS_DIR / f'{name}.json'
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+    print(f'Saved {output}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+"""
+This module contains grouped summary statistics, histograms, and prefix sums over meteorite data.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from math import floor
+
+from meteorite_filter.dsv.writer import DSVDictWriter
+from meteorite_filter.tui.table import TablePrinter
+
+
+GROUPINGS = {
+    'year': {
+        'menu_desc': 'By year',
+        'field': 'year',
+        'width': 1
+    },
+    'decade': {
+        'menu_desc': 'By decade',
+        'field': 'year',
+        'width': 10
+    },
+    'recclass': {
+        'menu_desc': 'By class (recclass)',
+        'field': 'recclass',
+        'width': None
+    }
+}
+
+
+class GroupStats:
+    """
+    Running summary statistics of a field's values within a group of rows.
+    """
+    __slots__ = ('count', 'known', 'total', 'minimum', 'maximum')
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty instance of the GroupStats class.
+        """
+        self.count = 0
+        self.known = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+
+
+    def add(self, value) -> None:
+        """
+        Adds a row's value to the statistics.
+
+        Args:
+            value: The value, or None if the row has no value.
+        """
+        self.count += 1
+
+        if value is None:
+            return
+
+        self.known += 1
+        self.total += value
+
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+
+    @property
+    def mean(self) -> float | None:
+        """
+        Get the mean of the known values.
+
+        Returns:
+            float | None: The mean, or None if there are no known values.
+        """
+        return self.total / self.known if self.known else None
+
+
+def group_key(row: dict, grouping: str):
+    """
+    Get the group a row belongs to.
+
+    Args:
+        row (dict): The row.
+        grouping (str): The grouping, a key of GROUPINGS.
+
+    Returns:
+        The group's key: the start of its range for numeric groupings, or the field's value
+            otherwise. None if the row has no value for the grouping's field.
+    """
+    value = row[GROUPINGS[grouping]['field']]
+    width = GROUPINGS[grouping]['width']
+
+    if value is None or width is None:
+        return value
+
+    return value // width * width
+
+
+def aggregate(rows: Iterable[dict], groupings: Iterable[str], value_field: str = 'mass (g)') -> dict[str, dict]:
+    """
+    Calculates summary statistics of a field for each group of several groupings, in a single pass over the rows.
+
+    Args:
+        rows (Iterable[dict]): The rows.
+        groupings (Iterable[str]): The groupings, keys of GROUPINGS.
+        value_field (str, optional): The field to summarize. Defaults to 'mass (g)'.
+
+    Raises:
+        ValueError: If a grouping is unknown.
+
+    Returns:
+        dict[str, dict]: The statistics of each grouping, mapping group keys to GroupStats. Rows
+            with no value for a grouping's field are grouped under None.
+    """
+    groupings = list(groupings)
+
+    if any(grouping not in GROUPINGS for grouping in groupings):
+        raise ValueError
+
+    results = {grouping: {} for grouping in groupings}
+
+    for row in rows:
+        value = row[value_field]
+
+        for grouping in groupings:
+            key = group_key(row, grouping)
+
+            if (stats := results[grouping].get(key)) is None:
+                stats = results[grouping][key] = GroupStats()
+
+            stats.add(value)
+
+    return results
+
+
+def histogram(rows: Iterable[dict], field: str, bin_width: float, origin: float = 0) -> dict[float, int]:
+    """
+    Counts the rows in fixed-width bins of a field's values, in a single pass. Rows where the field is None are ignored.
+
+    Args:
+        rows (Iterable[dict]): The rows.
+        field (str): The field.
+        bin_width (float): The width of each bin.
+        origin (float, optional): The start of one of the bins. Defaults to 0.
+
+    Raises:
+        ValueError: If the bin width is not positive.
+
+    Returns:
+        dict[float, int]: The number of rows in each non-empty bin, by the start of the bin
+            (inclusive), in ascending order.
+    """
+    if bin_width <= 0:
+        raise ValueError
+
+    counts = {}
+
+    for row in rows:
+        if (value := row[field]) is not None:
+            start = origin + floor((value - origin) / bin_width) * bin_width
+            counts[start] = counts.get(start, 0) + 1
+
+    return dict(sorted(counts.items()))
+
+
+class PrefixSums:
+    """
+    Cumulative counts and totals of a field's values, ordered by a key field, for O(1)
+    range queries after an O(n log n) build.
+
+    For an integer key field such as year, the sums are kept for every key between the
+    smallest and largest (unless the keys are too sparse), so queries with integer limits
+    take constant time. Other key fields and limits fall back to a binary search over the
+    distinct keys.
+    """
+    def __init__(self, data: Iterable[dict], key_field: str = 'year', value_field: str = 'mass (g)') -> None:
+        """
+        Initializes an instance of the PrefixSums class.
+
+        Args:
+            data (Iterable[dict]): The rows. Rows where the key field is None are ignored.
+            key_field (str, optional): The field the ranges are on. Defaults to 'year'.
+            value_field (str, optional): The field to total. Defaults to 'mass (g)'.
+        """
+        stats = {}
+        for row in data:
+            if (key := row[key_field]) is not None:
+                stats.setdefault(key, GroupStats()).add(row[value_field])
+
+        self._keys = sorted(stats)
+        self._dense = all(isinstance(key, int) for key in self._keys) and (not self._keys or self._keys[-1] - self._keys[0] < 2 * len(self._keys) + 1024)
+
+        if self._dense and self._keys:
+            self._keys = list(range(self._keys[0], self._keys[-1] + 1))
+
+        self._counts = [0]
+        self._totals = [0]
+
+        for key in self._keys:
+            group = stats.get(key)
+            self._counts.append(self._counts[-1] + (group.count if group is not None else 0))
+            self._totals.append(self._totals[-1] + (group.total if group is not None else 0))
+
+
+    def _bounds(self, min_val, max_val) -> tuple[int, int]:
+        """
+        Get the prefix positions bounding a range of keys.
+
+        Args:
+            min_val: The minimum key (inclusive).
+            max_val: The maximum key (inclusive).
+
+        Returns:
+            tuple[int, int]: The start and stop positions in the prefix sums.
+        """
+        if self._dense and isinstance(min_val, int) and isinstance(max_val, int):
+            first = self._keys[0] if self._keys else 0
+            start = min(max(min_val - first, 0), len(self._keys))
+            stop = min(max(max_val - first + 1, 0), len(self._keys))
+        else:
+            start = bisect_left(self._keys, min_val)
+            stop = bisect_right(self._keys, max_val)
+
+        return start, max(start, stop)
+
+
+    def count(self, min_val=float('-inf'), max_val=float('inf')) -> int:
+        """
+        Counts the rows whose key falls within a range.
+
+        Args:
+            min_val (optional): The minimum key (inclusive). Defaults to negative infinity.
+            max_val (optional): The maximum key (inclusive). Defaults to positive infinity.
+
+        Returns:
+            int: The number of rows.
+        """
+        start, stop = self._bounds(min_val, max_val)
+        return self._counts[stop] - self._counts[start]
+
+
+    def total(self, min_val=float('-inf'), max_val=float('inf')):
+        """
+        Totals the value field of the rows whose key falls within a range. Rows with no value are ignored.
+
+        Args:
+            min_val (optional): The minimum key (inclusive). Defaults to negative infinity.
+            max_val (optional): The maximum key (inclusive). Defaults to positive infinity.
+
+        Returns:
+            The total.
+        """
+        start, stop = self._bounds(min_val, max_val)
+        return self._totals[stop] - self._totals[start]
+
+
+def summary_rows(groups: dict, grouping: str, value_field: str = 'mass (g)') -> list[dict]:
+    """
+    Converts the statistics of a grouping into rows, ordered by group. The group of rows with no value is last.
+
+    Args:
+        groups (dict): The grouping's statistics, as returned by aggregate.
+        grouping (str): The grouping, a key of GROUPINGS.
+        value_field (str, optional): The summarized field. Defaults to 'mass (g)'.
+
+    Returns:
+        list[dict]: A row for each group, with its key, number of rows, and statistics of the summarized field.
+    """
+    return [{
+        grouping: '' if key is None else key,
+        'count': stats.count,
+        f'known {value_field}': stats.known,
+        f'total {value_field}': stats.total,
+        f'min {value_field}': stats.minimum,
+        f'max {value_field}': stats.maximum,
+        f'mean {value_field}': stats.mean
+    } for key, stats in sorted(groups.items(), key=lambda item: (item[0] is None, item[0] if item[0] is not None else 0))]
+
+
+def summary_table(rows: list[dict], title: str | None = None) -> TablePrinter:
+    """
+    Creates a table to print summary rows to the terminal.
+
+    Args:
+        rows (list[dict]): The rows, as returned by summary_rows.
+        title (str | None, optional): The title of the table. Defaults to None.
+
+    Returns:
+        TablePrinter: The table. Missing values are left blank and means are rounded to two decimal places.
+    """
+    header = tuple(field.upper() for field in rows[0]) if rows else ()
+    entries = [tuple('' if value is None else round(value, 2) if isinstance(value, float) else value for value in row.values()) for row in rows]
+    return TablePrinter(header, entries, title)
+
+
+def write_summary(rows: list[dict], path: str, delimiter: str = '\t') -> None:
+    """
+    Writes summary rows to a DSV file.
+
+    Args:
+        rows (list[dict]): The rows, as returned by summary_rows.
+        path (str): The path of the file to write.
+        delimiter (str, optional): The delimiter. Defaults to a tab.
+    """
+    if not rows:
+        return
+
+    with DSVDictWriter(path, list(rows[0]), delimiter=delimiter) as writer:
+        writer.writeheader()
+        writer.writerows(rows)
@@ -0,0 +1,141 @@
+"""
+This module is a non-interactive command line interface to filter a meteorite data file,
+for scripts and batch jobs. For example, to save the meteorites which fell from 1900 to
+1950 to a text file:
+
+    meteorite-filter --file data/meteorite_landings_data.txt --field year --min 1900 --max 1950 --format txt
+
+No menus or prompts are shown. The data file is loaded (using its parsed data cache, as
+the interactive application does), filtered with filter_data, and written with the same
+output classes. The tsv-stdout format writes the results to standard output as they are
+produced, so they can be piped to another program. With --stream, the file is instead
+filtered in a single pass without loading it into memory.
+"""
+
+import os
+import sys
+from argparse import ArgumentParser
+
+from meteorite_filter.constants import FILTER_OPTIONS, TYPE_MAP
+from meteorite_filter.dsv.reader import DSVDictReader
+from meteorite_filter.filter_data import filter_data, filter_file, load_data, widen_data
+from meteorite_filter.output import ExcelFileOutput, StdoutOutput, TextFileOutput, XlsxFileOutput
+
+
+FIELDS = {
+    'mass': 'mass (g)',
+    **{field: field for field in FILTER_OPTIONS}
+}
+
+FORMATS = {
+    'txt': TextFileOutput.output,
+    'xls': ExcelFileOutput.output,
+    'xlsx': XlsxFileOutput.output,
+    'tsv-stdout': StdoutOutput.output
+}
+
+
+def parse_args(argv: list[str] | None = None):
+    """
+    Parses the command line arguments.
+
+    Args:
+        argv (list[str] | None, optional): The command line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        argparse.Namespace: The parsed arguments, with the field converted to its name in the data file.
+    """
+    parser = ArgumentParser(prog='meteorite-filter', description='Filter a meteorite landings data file by mass or year, without any menus or prompts.')
+    parser.add_argument('--file', required=True, help='the tab-separated meteorite landings data file to filter')
+    parser.add_argument('--field', required=True, choices=list(FIELDS), help='the field to filter on')
+    parser.add_argument('--min', type=float, default=float('-inf'), help='the lower limit (inclusive). Defaults to no limit')
+    parser.add_argument('--max', type=float, default=float('inf'), help='the upper limit (inclusive). Defaults to no limit')
+    parser.add_argument('--format', required=True, choices=list(FORMATS), help='save the results to a text, xls, or xlsx file, or write them to standard output as tab-separated values')
+    parser.add_argument('--output', metavar='PATH', help='the file to save the results to. Defaults to a name based on the current date and time')
+    parser.add_argument('--binary', action='store_true', help='memory-map the data file and parse it as bytes')
+    parser.add_argument('--no-cache', action='store_true', help='do not read or write the parsed data cache')
+    parser.add_argument('--workers', type=int, metavar='N', help='parse the data file in N worker processes instead of on a single thread')
+    parser.add_argument('--stream', action='store_true', help='filter the file in a single pass instead of loading it, holding only the matching rows in memory')
+    parser.add_argument('--unordered', action='store_true', help='with --stream, write the matching rows in file order as soon as they are read')
+    parser.add_argument('--memory-budget', type=int, metavar='MB', help='with --stream, sort results larger than this many megabytes on disk')
+    args = parser.parse_args(argv)
+
+    if args.min > args.max:
+        parser.error('the lower limit cannot be greater than the upper limit')
+
+    if args.output is not None and args.format == 'tsv-stdout':
+        parser.error('--output cannot be used with the tsv-stdout format')
+
+    if not args.stream and (args.unordered or args.memory_budget is not None):
+        parser.error('--unordered and --memory-budget can only be used with --stream')
+
+    if args.memory_budget is not None and args.memory_budget <= 0:
+        parser.error('the memory budget must be positive')
+
+    if args.workers is not None and args.workers < 1:
+        parser.error('the number of workers must be positive')
+
+    if args.stream and args.workers is not None:
+        parser.error('--workers cannot be used with --stream')
+
+    args.field = FIELDS[args.field]
+    return args
+
+
+def run(args) -> None:
+    """
+    Filters the data file and writes the results, as described by the parsed arguments.
+
+    Args:
+        args (argparse.Namespace): The arguments, as returned by parse_args.
+
+    Raises:
+        OSError: If the data file cannot be read, or the output cannot be written.
+        KeyError: If the data file is missing a field.
+        ValueError: If a value in the data file cannot be parsed.
+    """
+    output = FORMATS[args.format]
+    output_func = output if args.output is None else lambda data, field: output(data, field, args.output)
+    mode = 'rb' if args.binary else 'r'
+
+    if args.stream:
+        memory_budget = args.memory_budget * 1024 * 1024 if args.memory_budget is not None else None
+        filter_file(args.file, args.field, args.min, args.max, output_func, ordered=not args.unordered, mode=mode, memory_budget=memory_budget)
+        return
+
+    reader = DSVDictReader(args.file, delimiter='\t', type_map=TYPE_MAP, mode=mode)
+    data = load_data(reader, use_cache=not args.no_cache, workers=args.workers)
+    widen_data(data, reader.path, reader.mode, use_cache=not args.no_cache) # A cache saved by an interactive session may only hold some columns
+    output_func(filter_data(data, args.field, args.min, args.max), args.field)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Runs the command line interface.
+
+    Args:
+        argv (list[str] | None, optional): The command line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit status: 0 on success, or 1 if the data file could not be filtered or the results could not be written.
+    """
+    args = parse_args(argv)
+
+    try:
+        run(args)
+        sys.stdout.flush()
+    except BrokenPipeError: # The program reading standard output exited early
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno()) # Stop the interpreter failing to flush it again on exit
+        return 1
+    except OSError as error:
+        print(f'meteorite-filter: error: {error.strerror}: {error.filename}' if error.filename else f'meteorite-filter: error: {error}', file=sys.stderr)
+        return 1
+    except (KeyError, ValueError): # A field is missing or cannot be parsed
+        print(f'meteorite-filter: error: {args.file} is not a correctly formatted meteorite landings data file', file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
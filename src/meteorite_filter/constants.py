@@ -2,7 +2,7 @@
 This module contains string constants for use in the therminal interface.
 """
 
-from meteorite_filter.output import ExcelFileOutput, TerminalOutput, TextFileOutput
+from meteorite_filter.output import ExcelFileOutput, SummaryTerminalOutput, SummaryTextFileOutput, TerminalOutput, TextFileOutput, XlsxFileOutput
 from meteorite_filter.tui.utils import TERM_FG_RED, term_format
 
 
@@ -36,7 +36,7 @@ OPEN_MODES = [
     },
     {
         'param': 'w',
-        'desc': f'open for writing, truncating the file first {term_format('(WARNING: This will delete\n    all contents of the file)', TERM_FG_RED)}',
+        'desc': 'open for writing, truncating the file first ' + term_format('(WARNING: This will delete\n    all contents of the file)', TERM_FG_RED),
         'short_desc': 'write (truncate)'
     },
     {
@@ -61,7 +61,7 @@ OPEN_FORMATS = [
     },
     {
         'param': 'b',
-        'desc': 'binary mode',
+        'desc': 'binary mode, memory-mapping the file',
         'short_desc': 'binary'
     }
 ]
@@ -89,12 +89,16 @@ FILTER_OPTIONS = {
     'mass (g)': {
         'menu_desc': 'Meteorite mass',
         'input_desc': "the meteorite's mass in grams",
-        'header': 'MASS (g)'
+        'header': 'MASS (g)',
+        'largest_desc': 'Heaviest meteorites',
+        'smallest_desc': 'Lightest meteorites'
     },
     'year': {
         'menu_desc': 'Year meteorite fell',
         'input_desc': 'the year the meteorite fell',
-        'header': 'YEAR'
+        'header': 'YEAR',
+        'largest_desc': 'Most recent falls',
+        'smallest_desc': 'Oldest falls'
     }
 }
 
@@ -105,10 +109,28 @@ OUTPUT_OPTIONS = {
     },
     'text': {
         'menu_desc': 'Save to a text (.txt) file',
-        'func': TextFileOutput.output
+        'func': TextFileOutput.output,
+        'full_rows': True
     },
     'excel': {
         'menu_desc': 'Save to an Excel (.xls) file',
-        'func': ExcelFileOutput.output
+        'func': ExcelFileOutput.output,
+        'full_rows': True
+    },
+    'xlsx': {
+        'menu_desc': 'Save to an Excel workbook (.xlsx) file',
+        'func': XlsxFileOutput.output,
+        'full_rows': True
+    }
+}
+
+SUMMARY_OUTPUT_OPTIONS = {
+    'terminal': {
+        'menu_desc': 'Display on screen',
+        'func': SummaryTerminalOutput.output
+    },
+    'text': {
+        'menu_desc': 'Save to a text (.txt) file',
+        'func': SummaryTextFileOutput.output
     }
 }
@@ -3,5 +3,6 @@ This package provides functionality for parsing delimited files.
 """
 
 from .reader import DSVReader, DSVDictReader
+from .columnar import MeteoriteTable, MeteoriteRow
 
-__all__ = ['DSVReader', 'DSVDictReader']
+__all__ = ['DSVReader', 'DSVDictReader', 'MeteoriteTable', 'MeteoriteRow']
@@ -0,0 +1,250 @@
+"""The dsv.cache module provides a persistent, binary sidecar cache of a
+parsed DSV file.
+
+Parsing a large DSV file and converting its fields is the slowest part of
+starting the application. The TableCache class saves the already-typed
+columns of a MeteoriteTable next to the source file (as "<file>.mfcache")
+so later runs can skip parsing entirely.
+
+The cache file starts with a short magic string and a JSON header, followed
+by one block per column: the raw bytes of the array and null bitmap of each
+numeric column, and the newline-joined UTF-8 text of each string column
+(DSV fields cannot contain newlines, and tables with string values which do
+are not cached). Loading memory-maps the file and copies each block straight
+into its array.
+
+The header records the source file's path, size, modification time and
+SHA-256 hash, as well as the delimiter and column types used to parse it.
+If any of these no longer match, the cache is stale and is ignored.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import sys
+from array import array
+from sys import intern
+
+from .columnar import MeteoriteTable
+
+
+CACHE_EXTENSION = '.mfcache'
+
+_MAGIC = b'MFCACHE1'
+_HEADER_LEN_SIZE = 8
+
+
+class TableCache:
+    """
+    A sidecar file caching the parsed contents of a DSV file.
+    """
+
+    def __init__(self, dsv_path: str, delimiter: str = ',', type_map: dict | None = None) -> None:
+        """
+        Initializes a TableCache object.
+
+        Args:
+            dsv_path (str): The path to the source DSV file.
+            delimiter (str, optional): The delimiter used to parse the source file. Defaults to ','.
+            type_map (dict | None, optional): The type map used to parse the source file. Defaults to None.
+        """
+        self._source = os.path.abspath(dsv_path)
+        self._path = self._source + CACHE_EXTENSION
+        self._delimiter = delimiter
+        self._types = {} if type_map is None else {field: getattr(type_func, '__name__', repr(type_func)) for field, type_func in type_map.items()}
+
+
+    @property
+    def path(self) -> str:
+        """
+        Get the path of the cache file.
+
+        Returns:
+            str: The path of the cache file.
+        """
+        return self._path
+
+
+    def load(self) -> MeteoriteTable | None:
+        """
+        Loads the cached table if the cache exists and is up to date with the source file.
+
+        Returns:
+            MeteoriteTable | None: The cached table, or None if the cache is missing, stale or unreadable.
+        """
+        try:
+            with open(self._path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                header, body_start = _read_header(buffer)
+                if header is None or header['key'] != self._key(header['key']):
+                    return None
+
+                return _table_from_blocks(header, buffer, body_start)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+
+    def save(self, table: MeteoriteTable) -> bool:
+        """
+        Saves a table parsed from the source file to the cache.
+
+        Args:
+            table (MeteoriteTable): The table to save.
+
+        Returns:
+            bool: True if the cache was written, or False if it could not be (e.g. the folder is read-only,
+                or a string value contains a newline, which would split it in two when loaded).
+        """
+        columns, nulls = table.buffers()
+        blocks: list[bytes] = []
+        layout = []
+
+        for field in table.fieldnames:
+            column = columns[field]
+            entry = {'field': field}
+
+            if isinstance(column, array):
+                entry['typecode'] = column.typecode
+                blocks.append(column.tobytes())
+                blocks.append(bytes(nulls[field]))
+            else:
+                text = '\n'.join(column)
+                if text.count('\n') != max(len(column) - 1, 0):
+                    return False
+
+                blocks.append(text.encode('utf-8'))
+
+            entry['sizes'] = [len(block) for block in blocks[-2 if isinstance(column, array) else -1:]]
+            layout.append(entry)
+
+        tmp_path = self._path + '.tmp'
+        try:
+            header = json.dumps({
+                'key': self._key(),
+                'byteorder': sys.byteorder,
+                'fieldnames': table.fieldnames,
+                'length': len(table),
+                'columns': layout
+            }).encode('utf-8')
+
+            with open(tmp_path, 'wb') as file:
+                file.write(_MAGIC)
+                file.write(len(header).to_bytes(_HEADER_LEN_SIZE, 'little'))
+                file.write(header)
+                for block in blocks:
+                    file.write(block)
+
+            os.replace(tmp_path, self._path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+        return True
+
+
+    def clear(self) -> bool:
+        """
+        Deletes the cache file.
+
+        Returns:
+            bool: True if a cache file was deleted, or False if there was none.
+        """
+        try:
+            os.remove(self._path)
+        except FileNotFoundError:
+            return False
+
+        return True
+
+
+    def _key(self, stored: dict | None = None) -> dict:
+        """
+        Builds the key identifying the current source file and parsing options.
+
+        Args:
+            stored (dict | None, optional): The key recorded in an existing cache. The source file is
+                only hashed if everything else matches this key, since otherwise the cache is already
+                known to be stale. Defaults to None, which always hashes the file.
+
+        Raises:
+            OSError: If the source file cannot be read.
+
+        Returns:
+            dict: The cache key.
+        """
+        stat = os.stat(self._source)
+        key = {
+            'source': self._source,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'delimiter': self._delimiter,
+            'types': self._types
+        }
+
+        if stored is not None and any(stored.get(name) != value for name, value in key.items()):
+            return key
+
+        with open(self._source, 'rb') as file:
+            key['sha256'] = hashlib.file_digest(file, 'sha256').hexdigest()
+
+        return key
+
+
+def _read_header(buffer: mmap.mmap) -> tuple[dict | None, int]:
+    """
+    Reads the JSON header of a cache file.
+
+    Args:
+        buffer (mmap.mmap): The memory-mapped cache file.
+
+    Returns:
+        tuple[dict | None, int]: The header, or None if the file is not a usable cache, and the offset of the first column block.
+    """
+    if buffer[:len(_MAGIC)] != _MAGIC:
+        return None, 0
+
+    header_start = len(_MAGIC) + _HEADER_LEN_SIZE
+    header_len = int.from_bytes(buffer[len(_MAGIC):header_start], 'little')
+    header = json.loads(buffer[header_start:header_start + header_len])
+
+    if header['byteorder'] != sys.byteorder:
+        return None, 0
+
+    return header, header_start + header_len
+
+
+def _table_from_blocks(header: dict, buffer: mmap.mmap, offset: int) -> MeteoriteTable:
+    """
+    Rebuilds a table from the column blocks of a cache file.
+
+    Args:
+        header (dict): The cache file's header.
+        buffer (mmap.mmap): The memory-mapped cache file.
+        offset (int): The offset of the first column block.
+
+    Raises:
+        ValueError: If the blocks do not match the header.
+
+    Returns:
+        MeteoriteTable: The cached table.
+    """
+    length = header['length']
+    columns = {}
+    nulls = {}
+
+    for entry in header['columns']:
+        field = entry['field']
+        sizes = entry['sizes']
+
+        if 'typecode' in entry:
+            column = array(entry['typecode'])
+            column.frombytes(buffer[offset:offset + sizes[0]])
+            columns[field] = column
+            nulls[field] = bytearray(buffer[offset + sizes[0]:offset + sizes[0] + sizes[1]])
+        else:
+            columns[field] = list(map(intern, buffer[offset:offset + sizes[0]].decode('utf-8').split('\n'))) if length else []
+
+        offset += sum(sizes)
+
+    return MeteoriteTable.from_buffers(header['fieldnames'], length, columns, nulls)
@@ -0,0 +1,381 @@
+"""The dsv.columnar module provides a column-oriented, in-memory table for
+the rows of a DSV file.
+
+Holding a file as a list of dictionaries costs one dict per row, with every
+value boxed and a copy of the key table in each. The MeteoriteTable class
+instead stores each column once: fields parsed as int or float by the
+type map live in compact array buffers with a null bitmap, and all other
+fields live in plain lists of interned strings so repeated values (such as
+the class or fall columns) are only stored once.
+
+Rows are exposed through MeteoriteRow, a read-only mapping view which
+behaves like the dictionaries returned by DSVDictReader, so existing code
+that indexes rows by field name works unchanged.
+
+Measured with tracemalloc on data/meteorite_landings_data.txt (45,716 rows,
+12 fields) using constants.TYPE_MAP:
+
+    list of dicts (list(DSVDictReader)):    ~878 bytes/row  (40.1 MB)
+    MeteoriteTable.from_reader(...):        ~238 bytes/row  (10.9 MB)
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from sys import intern
+
+
+_TYPECODES = {
+    int: 'q',
+    float: 'd'
+}
+
+
+class MeteoriteTable(Sequence):
+    """
+    A column-oriented table of typed DSV rows.
+
+    Numeric columns (those mapped to int or float in the type map) are stored in
+    array buffers alongside a bitmap marking null values. All other columns are
+    stored as lists of interned strings.
+    """
+
+    def __init__(self, fieldnames: list[str], type_map: dict | None = None) -> None:
+        """
+        Initializes an empty MeteoriteTable.
+
+        Args:
+            fieldnames (list[str]): The names of the table's columns, in order.
+            type_map (dict | None, optional): A dictionary mapping fieldnames to the functions used
+                to parse them. Columns mapped to int or float are stored in typed arrays. Defaults to None.
+        """
+        self._fieldnames = list(fieldnames)
+        self._columns: dict[str, array | list] = {}
+        self._nulls: dict[str, bytearray] = {}
+        self._len = 0
+
+        type_map = {} if type_map is None else type_map
+        for field in self._fieldnames:
+            typecode = _TYPECODES.get(type_map.get(field)) # type: ignore
+            if typecode is None:
+                self._columns[field] = []
+            else:
+                self._columns[field] = array(typecode)
+                self._nulls[field] = bytearray()
+
+
+    @classmethod
+    def from_reader(cls, reader) -> 'MeteoriteTable':
+        """
+        Creates a table holding every remaining row of a DSVDictReader. Only the
+        reader's projected columns (see DSVDictReader.usecols) are included.
+
+        Args:
+            reader (DSVDictReader): The reader to consume.
+
+        Returns:
+            MeteoriteTable: The populated table.
+        """
+        table = cls(reader.fieldnames if reader.usecols is None else reader.usecols, reader.type_map)
+        table.extend(reader)
+        return table
+
+
+    @classmethod
+    def from_buffers(cls, fieldnames: list[str], length: int, columns: dict[str, array | list], nulls: dict[str, bytearray]) -> 'MeteoriteTable':
+        """
+        Creates a table directly from column buffers, such as those returned by buffers().
+
+        Args:
+            fieldnames (list[str]): The names of the table's columns, in order.
+            length (int): The number of rows in the columns.
+            columns (dict[str, array | list]): A dictionary mapping every fieldname to its column. Numeric
+                columns are arrays and all other columns are lists.
+            nulls (dict[str, bytearray]): A dictionary mapping every numeric fieldname to its null bitmap.
+
+        Raises:
+            ValueError: If the buffers do not match the fieldnames or the length.
+
+        Returns:
+            MeteoriteTable: The table. It takes ownership of the buffers.
+        """
+        if columns.keys() != set(fieldnames) or any(len(column) != length for column in columns.values()):
+            raise ValueError
+
+        if nulls.keys() != {field for field, column in columns.items() if isinstance(column, array)} or any(len(bitmap) != (length + 7) >> 3 for bitmap in nulls.values()):
+            raise ValueError
+
+        table = cls(fieldnames)
+        table._columns = {field: columns[field] for field in fieldnames}
+        table._nulls = dict(nulls)
+        table._len = length
+        return table
+
+
+    @property
+    def fieldnames(self) -> list[str]:
+        """
+        Get the names of the table's columns.
+
+        Returns:
+            list[str]: The field names.
+        """
+        return self._fieldnames
+
+
+    def append(self, row: dict) -> None:
+        """
+        Appends a row to the end of the table.
+
+        Args:
+            row (dict): A dictionary mapping every fieldname to its (already parsed) value.
+        """
+        pos = self._len
+        if pos & 7 == 0:
+            for nulls in self._nulls.values():
+                nulls.append(0)
+
+        for field, column in self._columns.items():
+            value = row[field]
+            nulls = self._nulls.get(field)
+
+            if nulls is None:
+                column.append(intern(value) if isinstance(value, str) else value)
+            elif value is None:
+                nulls[pos >> 3] |= 1 << (pos & 7)
+                column.append(0)
+            else:
+                column.append(value)
+
+        self._len += 1
+
+
+    def extend(self, rows: Iterable[dict]) -> None:
+        """
+        Appends every row of an iterable to the end of the table.
+
+        Args:
+            rows (Iterable[dict]): The rows to append.
+        """
+        for row in rows:
+            self.append(row)
+
+
+    def extend_columns(self, columns: dict[str, list]) -> None:
+        """
+        Appends rows to the end of the table, given column by column.
+
+        Args:
+            columns (dict[str, list]): A dictionary mapping every fieldname to a list of its
+                (already parsed) values. All lists must be the same length.
+
+        Raises:
+            ValueError: If the columns do not match the table's fieldnames or are not all the same length.
+        """
+        lengths = {len(values) for values in columns.values()}
+        if columns.keys() != self._columns.keys() or len(lengths) > 1:
+            raise ValueError
+
+        start = self._len
+        count = lengths.pop() if lengths else 0
+
+        for field, column in self._columns.items():
+            values = columns[field]
+            nulls = self._nulls.get(field)
+
+            if nulls is None:
+                column.extend([intern(value) if isinstance(value, str) else value for value in values])
+                continue
+
+            nulls.extend(bytes(((start + count + 7) >> 3) - len(nulls)))
+            column.extend([0 if value is None else value for value in values])
+
+            for pos in (start + offset for offset, value in enumerate(values) if value is None):
+                nulls[pos >> 3] |= 1 << (pos & 7)
+
+        self._len += count
+
+
+    def widen(self, reader) -> bool:
+        """
+        Adds the columns of a freshly opened DSVDictReader which the table does not yet have,
+        so a table loaded with a column projection can later be given its remaining columns.
+
+        The reader's projection is set to the missing columns, so no other fields are parsed.
+        Afterwards, the table's fieldnames follow the order of the reader's fieldnames.
+
+        Args:
+            reader (DSVDictReader): A reader over the same file the table was loaded from,
+                positioned at its first row.
+
+        Raises:
+            ValueError: If the reader does not have the same number of rows as the table.
+
+        Returns:
+            bool: True if any columns were added.
+        """
+        missing = [field for field in reader.fieldnames if field not in self._columns]
+        if not missing:
+            return False
+
+        reader.usecols = missing
+        extra = MeteoriteTable.from_reader(reader)
+        if len(extra) != self._len:
+            raise ValueError
+
+        self._columns.update(extra._columns)
+        self._nulls.update(extra._nulls)
+        self._fieldnames = [field for field in reader.fieldnames if field in self._columns] + [field for field in self._fieldnames if field not in reader.fieldnames]
+        self._columns = {field: self._columns[field] for field in self._fieldnames}
+        return True
+
+
+    def buffers(self) -> tuple[dict[str, array | list], dict[str, bytearray]]:
+        """
+        Get the table's underlying column buffers.
+
+        Returns:
+            tuple[dict[str, array | list], dict[str, bytearray]]: The columns (arrays for numeric fields
+                and lists for all others), and the null bitmaps of the numeric columns.
+        """
+        return self._columns, self._nulls
+
+
+    def value(self, pos: int, field: str):
+        """
+        Get a single value from the table.
+
+        Args:
+            pos (int): The row position.
+            field (str): The field name.
+
+        Returns:
+            The value, or None if it is null.
+        """
+        nulls = self._nulls.get(field)
+        if nulls is not None and nulls[pos >> 3] & (1 << (pos & 7)):
+            return None
+
+        return self._columns[field][pos]
+
+
+    def __len__(self) -> int:
+        """
+        Get the number of rows in the table.
+
+        Returns:
+            int: The number of rows.
+        """
+        return self._len
+
+
+    def __getitem__(self, key):
+        """
+        Get a row view, or a list of row views for a slice.
+
+        Args:
+            key (int | slice): The row position or slice.
+
+        Raises:
+            IndexError: If the position is out of range.
+
+        Returns:
+            MeteoriteRow | list[MeteoriteRow]: The row view(s).
+        """
+        if isinstance(key, slice):
+            return [MeteoriteRow(self, pos) for pos in range(*key.indices(self._len))]
+
+        if key < 0:
+            key += self._len
+
+        if key < 0 or key >= self._len:
+            raise IndexError('table index out of range')
+
+        return MeteoriteRow(self, key)
+
+
+    def __iter__(self) -> Iterator['MeteoriteRow']:
+        """
+        Iterate over views of the table's rows.
+
+        Returns:
+            Iterator[MeteoriteRow]: An iterator over the rows.
+        """
+        return (MeteoriteRow(self, pos) for pos in range(self._len))
+
+
+class MeteoriteRow(Mapping):
+    """
+    A read-only dictionary-like view of a single row of a MeteoriteTable.
+    """
+    __slots__ = ('_table', '_pos')
+
+    def __init__(self, table: MeteoriteTable, pos: int) -> None:
+        """
+        Initializes a view of a table row.
+
+        Args:
+            table (MeteoriteTable): The table the row belongs to.
+            pos (int): The position of the row in the table.
+        """
+        self._table = table
+        self._pos = pos
+
+
+    @property
+    def pos(self) -> int:
+        """
+        Get the position of the row in its table.
+
+        Returns:
+            int: The row position.
+        """
+        return self._pos
+
+
+    def __getitem__(self, field: str):
+        """
+        Get the value of a field.
+
+        Args:
+            field (str): The field name.
+
+        Raises:
+            KeyError: If the table has no such field.
+
+        Returns:
+            The value, or None if it is null.
+        """
+        try:
+            return self._table.value(self._pos, field)
+        except KeyError:
+            raise KeyError(field) from None
+
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over the row's field names.
+
+        Returns:
+            Iterator[str]: An iterator over the field names.
+        """
+        return iter(self._table.fieldnames)
+
+
+    def __len__(self) -> int:
+        """
+        Get the number of fields in the row.
+
+        Returns:
+            int: The number of fields.
+        """
+        return len(self._table.fieldnames)
+
+
+    def __repr__(self) -> str:
+        """
+        Get a dictionary-style representation of the row.
+
+        Returns:
+            str: The representation of the row.
+        """
+        return repr(dict(self))
@@ -0,0 +1,227 @@
+"""The dsv.parallel module provides functions for parsing a DSV file across
+a pool of worker processes.
+
+The body of the file is split into byte ranges which each end on a line
+boundary. Every range is parsed by a worker process using the same type map
+conversion as DSVDictReader, and returned column by column (which is far
+cheaper to send between processes than a dictionary per row). The chunks
+are then reassembled in their original order, so the result is identical to
+reading the file serially. read_chunks yields each chunk as soon as it and every
+chunk before it have been parsed, so the rows can be used while the rest load.
+"""
+
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+from .columnar import MeteoriteTable
+
+
+def read_parallel(dsv_path: str, delimiter=',', type_map: dict | None = None, workers: int | None = None, chunks_per_worker: int = 4) -> list[dict]:
+    """
+    Parses a DSV file in parallel into a list of dictionaries.
+
+    Args:
+        dsv_path (str): The path to the DSV file to read. Its first line must contain the fieldnames.
+        delimiter (str, optional): The delimiter of the DSV file. Defaults to ','.
+        type_map (dict | None, optional): An optional dictionary mapping fieldnames to functions for
+            parsing the field values. The functions must be picklable. Defaults to None.
+        workers (int | None, optional): The number of worker processes. Defaults to the number of CPUs.
+        chunks_per_worker (int, optional): How many chunks to split the file into per worker. Defaults to 4.
+
+    Returns:
+        list[dict]: The rows of the file, identical to list(DSVDictReader(...)).
+    """
+    chunks = read_chunks(dsv_path, delimiter, type_map, workers, chunks_per_worker)
+    return [dict(zip(columns.keys(), values)) for _, columns in chunks for values in zip(*columns.values())]
+
+
+def read_table_parallel(dsv_path: str, delimiter=',', type_map: dict | None = None, workers: int | None = None, chunks_per_worker: int = 4, usecols: list[str] | None = None) -> MeteoriteTable:
+    """
+    Parses a DSV file in parallel into a MeteoriteTable.
+
+    Args:
+        dsv_path (str): The path to the DSV file to read. Its first line must contain the fieldnames.
+        delimiter (str, optional): The delimiter of the DSV file. Defaults to ','.
+        type_map (dict | None, optional): An optional dictionary mapping fieldnames to functions for
+            parsing the field values. The functions must be picklable. Defaults to None.
+        workers (int | None, optional): The number of worker processes. Defaults to the number of CPUs.
+        chunks_per_worker (int, optional): How many chunks to split the file into per worker. Defaults to 4.
+        usecols (list[str] | None, optional): The fieldnames to load, as DSVDictReader.usecols. Defaults to None, which loads every field.
+
+    Returns:
+        MeteoriteTable: A table holding the rows of the file.
+    """
+    table = MeteoriteTable(_select_fields(_read_fieldnames(dsv_path, delimiter), usecols), type_map)
+
+    for _, columns in read_chunks(dsv_path, delimiter, type_map, workers, chunks_per_worker, usecols):
+        table.extend_columns(columns)
+
+    return table
+
+
+def read_chunks(dsv_path: str, delimiter=',', type_map: dict | None = None, workers: int | None = None, chunks_per_worker: int = 4, usecols: list[str] | None = None) -> Iterator[tuple[int, dict[str, list]]]:
+    """
+    Splits a DSV file into chunks and parses them, in parallel if there is more than one worker,
+    yielding each chunk in file order as soon as it has been parsed.
+
+    Args:
+        dsv_path (str): The path to the DSV file to read. Its first line must contain the fieldnames.
+        delimiter (str, optional): The delimiter of the DSV file. Defaults to ','.
+        type_map (dict | None, optional): An optional dictionary mapping fieldnames to functions for
+            parsing the field values. The functions must be picklable. Defaults to None.
+        workers (int | None, optional): The number of worker processes. Defaults to the number of CPUs.
+        chunks_per_worker (int, optional): How many chunks to split the file into per worker. Defaults to 4.
+        usecols (list[str] | None, optional): The fieldnames to load, as DSVDictReader.usecols. Defaults to None, which loads every field.
+
+    Raises:
+        ValueError: If the number of workers is less than 1, usecols includes a field the file does not
+            have, or a line has fewer fields than the header.
+
+    Yields:
+        tuple[int, dict[str, list]]: The offset just past the end of the chunk in the file, and a dictionary
+            mapping each loaded fieldname (in file order) to the chunk's parsed values.
+    """
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers < 1:
+        raise ValueError
+
+    header, ranges = chunk_ranges(dsv_path, workers * chunks_per_worker)
+    fieldnames = _split_lines(header.decode('utf-8'), delimiter)[0]
+    selected = _select_fields(fieldnames, usecols)
+    args = [(dsv_path, start, stop, delimiter, fieldnames, type_map, selected) for start, stop in ranges]
+    stops = [stop for _, stop in ranges]
+
+    if workers == 1 or len(args) <= 1:
+        for stop, chunk_args in zip(stops, args):
+            yield stop, _parse_chunk(*chunk_args)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from zip(stops, executor.map(_parse_chunk, *zip(*args)))
+
+
+def chunk_ranges(dsv_path: str, count: int) -> tuple[bytes, list[tuple[int, int]]]:
+    """
+    Splits the body of a DSV file into byte ranges which end on line boundaries.
+
+    Args:
+        dsv_path (str): The path to the DSV file.
+        count (int): The target number of ranges. Fewer are returned for small files.
+
+    Returns:
+        tuple[bytes, list[tuple[int, int]]]: The header line, and the (start, stop) offsets of each range.
+    """
+    with open(dsv_path, 'rb') as file:
+        header = file.readline()
+        body_start = file.tell()
+        size = os.fstat(file.fileno()).st_size
+
+        bounds = [body_start]
+        span = max((size - body_start) // max(count, 1), 1)
+
+        for pos in range(body_start + span, size, span):
+            if pos <= bounds[-1]:
+                continue
+
+            file.seek(pos)
+            file.readline()
+            bounds.append(file.tell())
+
+    if bounds[-1] < size:
+        bounds.append(size)
+
+    return header, [(start, stop) for start, stop in zip(bounds, bounds[1:]) if start < stop]
+
+
+def _select_fields(fieldnames: list[str], usecols: list[str] | None) -> list[str]:
+    """
+    Get the fieldnames to load from a file, in the order they appear in it.
+
+    Args:
+        fieldnames (list[str]): The fieldnames of the file.
+        usecols (list[str] | None): The fieldnames to load, or None to load every field.
+
+    Raises:
+        ValueError: If usecols includes a field the file does not have.
+
+    Returns:
+        list[str]: The fieldnames to load.
+    """
+    if usecols is None:
+        return list(fieldnames)
+
+    if not set(usecols) <= set(fieldnames):
+        raise ValueError
+
+    return [field for field in fieldnames if field in usecols]
+
+
+def _read_fieldnames(dsv_path: str, delimiter: str) -> list[str]:
+    """
+    Reads the fieldnames from the first line of a DSV file.
+
+    Args:
+        dsv_path (str): The path to the DSV file.
+        delimiter (str): The delimiter of the DSV file.
+
+    Returns:
+        list[str]: The fieldnames.
+    """
+    with open(dsv_path, 'rb') as file:
+        return _split_lines(file.readline().decode('utf-8'), delimiter)[0]
+
+
+def _parse_chunk(dsv_path: str, start: int, stop: int, delimiter: str, fieldnames: list[str], type_map: dict | None, selected: list[str]) -> dict[str, list]:
+    """
+    Parses a byte range of a DSV file into columns. Runs in a worker process.
+
+    Args:
+        dsv_path (str): The path to the DSV file.
+        start (int): The offset of the first byte of the range.
+        stop (int): The offset just past the last byte of the range.
+        delimiter (str): The delimiter of the DSV file.
+        fieldnames (list[str]): The fieldnames of the DSV file.
+        type_map (dict | None): An optional dictionary mapping fieldnames to functions for parsing the field values.
+        selected (list[str]): The fieldnames to return, in file order.
+
+    Raises:
+        ValueError: If a line has fewer fields than there are fieldnames.
+
+    Returns:
+        dict[str, list]: A dictionary mapping each selected fieldname to its parsed values.
+    """
+    with open(dsv_path, 'rb') as file:
+        file.seek(start)
+        text = file.read(stop - start).decode('utf-8')
+
+    rows = _split_lines(text, delimiter)
+    if any(len(row) < len(fieldnames) for row in rows):
+        raise ValueError
+
+    columns = {field: list(values) for field, values in zip(fieldnames, zip(*rows)) if field in selected} if rows else {field: [] for field in selected}
+
+    if type_map is not None:
+        for field, type_func in type_map.items():
+            if field in columns:
+                columns[field] = [type_func(value) if value != '' else None for value in columns[field]]
+
+    return columns
+
+
+def _split_lines(text: str, delimiter: str) -> list[list[str]]:
+    """
+    Splits text into lines of fields, treating line endings the same way as a text mode file.
+
+    Args:
+        text (str): The text to split.
+        delimiter (str): The delimiter between fields.
+
+    Returns:
+        list[list[str]]: The fields of each line.
+    """
+    lines = text.replace('\r\n', '\n').split('\n')
+    if lines[-1] == '':
+        lines.pop()
+
+    return [line.split(delimiter) for line in lines]
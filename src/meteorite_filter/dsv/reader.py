@@ -7,9 +7,25 @@ The DSVReader class provides an easy way to iterate over the lines of a DSV
 file. The DSVDictReader class provides similar functionality, but returns
 a dictionary for each line instead of a list of strings.
 
+Opening a file in binary mode (e.g. mode='rb') memory-maps it and finds
+line and field boundaries on the raw bytes. Fields are then decoded or
+converted individually, and numeric fields are parsed straight from bytes,
+which avoids decoding a str copy of every line.
+
 Both classes are inspired by the Python stdlib csv module.
 """
 
+import io
+import mmap
+import os
+from collections.abc import Iterator
+from operator import itemgetter
+
+
+# Type functions which can parse a field directly from its undecoded bytes
+_BYTES_PARSERS = (int, float)
+
+
 class DSVReader:
     """A class for reading files in a Delimiter Seperated Value (DSV) format.
 
@@ -25,26 +41,80 @@ class DSVReader:
             delimiter: The character that separates values on a line. Defaults to ','.
             newline: The character(s) that separate lines. If None, the default
                 line separator for the operating system will be used.
+            mode: The mode to open the file with. If it contains 'b', the file is
+                memory-mapped and parsed as bytes. Defaults to 'r'.
+
+        Raises:
+            io.UnsupportedOperation: If a binary mode other than 'rb' is given, before
+                the file is opened, so that it is never truncated or created.
         """
-        self._file = open(dsv_path, mode, newline=newline, encoding='utf-8')
+        if 'b' in mode and set(mode) != {'r', 'b'}:
+            raise io.UnsupportedOperation('not readable')
+
         self.delimiter = delimiter
+        self._path = dsv_path
+        self._mode = mode
         self._line_num = 0
+        self._binary = 'b' in mode
 
         if newline is None:
             self._newline = '\n'
         else:
             self._newline = newline
 
+        if self._binary:
+            self._bdelimiter = delimiter.encode()
+            self._bnewline = self._newline.encode()
+            self._file = open(dsv_path, mode)
+            self._buffer = self._map_file()
+            self._raw_lines = None
+        else:
+            self._file = open(dsv_path, mode, newline=newline, encoding='utf-8')
+
     def __del__(self):
         """Close the DSV file when the object is deleted."""
+        if isinstance(getattr(self, '_buffer', None), mmap.mmap):
+            self._buffer.close()
+
         if hasattr(self, '_file'):
             self._file.close()
 
+    def _map_file(self) -> mmap.mmap | bytes:
+        """Memory-map the open file for reading.
+
+        Returns:
+            The mapped file, or an empty bytes object if the file is empty (which
+            cannot be mapped).
+        """
+        if os.fstat(self._file.fileno()).st_size == 0:
+            return b''
+
+        return mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @property
+    def path(self) -> str:
+        """The path to the DSV file."""
+        return self._path
+
+    @property
+    def mode(self) -> str:
+        """The mode the DSV file was opened with."""
+        return self._mode
+
     @property
     def line_num(self):
         """The number of lines read so far."""
         return self._line_num
 
+    @property
+    def bytes_read(self) -> int:
+        """The number of bytes of the file read so far. In text mode, this includes
+        any data read ahead into the file's buffer."""
+        if self._binary:
+            return self._buffer.tell() if isinstance(self._buffer, mmap.mmap) else 0
+
+        return self._file.buffer.tell()
+
     def __iter__(self):
         """Return an iterator over the lines of the file."""
         return self
@@ -55,16 +125,87 @@ class DSVReader:
         Raises:
             StopIteration: If there are no more lines to read.
         """
+        if self._binary:
+            if self._raw_lines is None:
+                self._raw_lines = self._iter_raw()
+
+            return [field.decode('utf-8') for field in next(self._raw_lines)]
+
         self._line_num += 1
         return next(self._file).rstrip(self._newline).split(self.delimiter)
 
+    def _iter_raw(self, indices: list[int] | None = None) -> Iterator[list[bytes]]:
+        """Iterate over the remaining lines of a memory-mapped file as lists of undecoded fields.
+
+        The iterator does not read ahead, so a new one can be started at any time to
+        continue from the current line with different indices.
+
+        Args:
+            indices: The positions of the fields to return, in ascending order. The
+                line is only split as far as the last of these, and only these fields
+                are copied out of the line. If None, all fields are returned.
+
+        Returns:
+            An iterator over the fields of each line.
+
+        Raises:
+            ValueError: If a line does not have every field in indices.
+        """
+        buffer = self._buffer
+        newline = self._bnewline
+        delimiter = self._bdelimiter
+
+        if not buffer:
+            return
+
+        readline = buffer.readline if newline.endswith(b'\n') else self._readline
+        strip_cr = newline == b'\n'
+
+        if indices is None:
+            select = None
+        elif len(indices) > 1:
+            select = itemgetter(*indices)
+        else:
+            select = lambda fields, idx=indices[0]: (fields[idx],)
+
+        while line := readline():
+            self._line_num += 1
+
+            if line.endswith(newline):
+                line = line[:-len(newline)]
+
+            if strip_cr and line.endswith(b'\r'): # Strip the '\r' of a '\r\n' line ending
+                line = line[:-1]
+
+            if select is None:
+                yield line.split(delimiter)
+                continue
+
+            fields = line.split(delimiter, indices[-1] + 1) # type: ignore
+            try:
+                yield select(fields)
+            except IndexError: # The line is missing some of the selected fields
+                raise ValueError
+
+    def _readline(self) -> bytes:
+        """Read the next line of a memory-mapped file whose newline does not end in '\\n'.
+
+        Returns:
+            The line, including its newline, or an empty bytes object at the end of the file.
+        """
+        start = self._buffer.tell()
+        end = self._buffer.find(self._bnewline, start)
+        end = len(self._buffer) if end == -1 else end + len(self._bnewline)
+        self._buffer.seek(end)
+        return self._buffer[start:end]
+
 
 class DSVDictReader(DSVReader):
     '''
     A class for reading a DSV file and returning the data as a dictionary.
     '''
 
-    def __init__(self, dsv_path: str, delimiter=',', fieldnames: list[str] | None=None, type_map: dict | None=None, mode: str = 'r'):
+    def __init__(self, dsv_path: str, delimiter=',', fieldnames: list[str] | None=None, type_map: dict | None=None, mode: str = 'r', usecols: list[str] | None=None):
         """Initialize a DSVDictReader object.
 
         Args:
@@ -72,6 +213,8 @@ class DSVDictReader(DSVReader):
             delimiter: The delimiter of the DSV file. Defaults to ','.
             fieldnames: The fieldnames of the DSV file. Defaults to first row of the file.
             type_map: An optional dictionary mapping fieldnames to functions for parsing the field values.
+            usecols: An optional list of the fieldnames to include in each row. Other fields are
+                never stored or type converted. Defaults to all fields.
         """
         super().__init__(dsv_path, delimiter, mode=mode)
 
@@ -81,6 +224,7 @@ class DSVDictReader(DSVReader):
             self._fieldnames = fieldnames
 
         self._type_map = type_map
+        self.usecols = usecols
 
     @property
     def fieldnames(self):
@@ -89,6 +233,44 @@ class DSVDictReader(DSVReader):
         '''
         return self._fieldnames
 
+    @property
+    def type_map(self) -> dict | None:
+        '''
+        The dictionary mapping fieldnames to functions for parsing the field values.
+        '''
+        return self._type_map
+
+    @property
+    def usecols(self) -> list[str] | None:
+        '''
+        The fieldnames included in each row, in file order, or None if all fields are included.
+        '''
+        return self._usecols
+
+    @usecols.setter
+    def usecols(self, usecols: list[str] | None):
+        '''
+        Sets the fieldnames to include in each row read from now on. The projection can be
+        widened or narrowed at any time.
+
+        Raises:
+            ValueError: If a fieldname is not in the file.
+        '''
+        self._binary_rows = None
+
+        if usecols is None:
+            self._usecols = None
+            self._indices = None
+            self._typed = None if self._type_map is None else list(self._type_map.items())
+            return
+
+        if not set(usecols) <= set(self._fieldnames):
+            raise ValueError
+
+        self._indices = sorted({self._fieldnames.index(field) for field in usecols})
+        self._usecols = [self._fieldnames[idx] for idx in self._indices]
+        self._typed = None if self._type_map is None else [(field, type_func) for field, type_func in self._type_map.items() if field in self._usecols]
+
     def __next__(self) -> dict:
         '''
         Returns the next row of the DSV file as a dictionary.
@@ -96,10 +278,94 @@ class DSVDictReader(DSVReader):
         Raises:
             StopIteration: If there are no more lines to read.
         '''
-        row_dict = dict(zip(self._fieldnames, super().__next__()))
+        if self._binary:
+            return self._next_binary()
+
+        if self._indices is None:
+            row_dict = dict(zip(self._fieldnames, super().__next__()))
+        else:
+            values = super().__next__()
+            row_dict = {self._fieldnames[idx]: values[idx] for idx in self._indices}
 
-        if self._type_map is not None:
-            for field, type_func in self._type_map.items():
+        if self._typed is not None:
+            for field, type_func in self._typed:
                 row_dict[field] = type_func(row_dict[field]) if row_dict[field] != '' else None #type: ignore
 
         return row_dict
+
+    def __iter__(self):
+        '''
+        Return an iterator over the rows of the file.
+
+        In binary mode this is the underlying row generator, which avoids the cost of
+        calling __next__ for every row. Changing usecols while iterating only affects
+        rows read by a new iteration or by next().
+        '''
+        if not self._binary:
+            return self
+
+        if self._binary_rows is None:
+            self._binary_rows = self._iter_binary()
+
+        return self._binary_rows
+
+    def _next_binary(self) -> dict:
+        '''
+        Returns the next row of a memory-mapped DSV file as a dictionary.
+
+        Raises:
+            StopIteration: If there are no more lines to read.
+        '''
+        if self._binary_rows is None:
+            self._binary_rows = self._iter_binary()
+
+        return next(self._binary_rows)
+
+    def _iter_binary(self) -> Iterator[dict]:
+        '''
+        Iterates over the remaining rows of a memory-mapped DSV file as dictionaries,
+        parsing numeric fields directly from bytes and decoding only the remaining fields.
+        Fields outside the projection are never copied out of the file.
+
+        Raises:
+            ValueError: If a line has fewer fields than the header, as it does when parsed
+                in parallel (see dsv.parallel).
+
+        Returns:
+            Iterator[dict]: An iterator over the rows.
+        '''
+        fields = self._fieldnames if self._usecols is None else self._usecols
+        parsers = [_bytes_parser(field, self._type_map) for field in fields]
+        count = len(parsers)
+
+        for values in self._iter_raw(self._indices):
+            if len(values) < count:
+                raise ValueError
+
+            row_dict = {}
+            for (field, parse, empty), value in zip(parsers, values):
+                row_dict[field] = parse(value) if value else empty
+
+            yield row_dict
+
+
+def _bytes_parser(field: str, type_map: dict | None) -> tuple:
+    '''
+    Builds the function used to parse a field from its undecoded bytes.
+
+    Args:
+        field: The name of the field.
+        type_map: An optional dictionary mapping fieldnames to functions for parsing the field values.
+
+    Returns:
+        tuple: The field name, the parsing function, and the value to use when the field is empty.
+    '''
+    type_func = None if type_map is None else type_map.get(field)
+
+    if type_func is None:
+        return (field, bytes.decode, '')
+
+    if type_func in _BYTES_PARSERS:
+        return (field, type_func, None)
+
+    return (field, lambda value, type_func=type_func: type_func(value.decode('utf-8')), None)
@@ -10,6 +10,15 @@ a dictionary for each line instead of a list of strings.
 Both classes are inspired by the Python stdlib csv module.
 """
 
+from collections.abc import Iterable, Sequence
+from itertools import islice
+from operator import itemgetter
+from io import TextIOBase
+
+
+_BATCH_SIZE = 512
+
+
 class DSVWriter:
     """A class for writing files in a Delimiter Seperated Value (DSV) format.
 
@@ -17,17 +26,30 @@ class DSVWriter:
     delimiters include commas (CSV) and tabs (TSV).
     """
 
-    def __init__(self, dsv_path: str, delimiter: str = ',', mode: str = 'w') -> None:
+    def __init__(self, dsv_path: str | TextIOBase, delimiter: str = ',', mode: str = 'w', buffer_size: int | None = None) -> None:
         """
         Initializes a DSVWriter object.
 
         Args:
-            dsv_path (str): The path to the DSV file.
+            dsv_path (str | TextIOBase): The path to the DSV file, or an open text file to write to (such as
+                sys.stdout). An open file is flushed, but not closed, when the writer is closed, and the
+                mode and buffer size only apply to files the writer opens.
             delimiter (str, optional): The delimiter used in the DSV file. Defaults to ','.
             mode (str, optional): The mode in which the file is opened. Defaults to 'w'.
-        """
-        self._file = open(dsv_path, mode, encoding='utf-8')
+            buffer_size (int | None, optional): If set, the size in bytes of the file's write buffer, and
+                rows are no longer flushed to the file as each one is written. Call flush() or close(), or
+                use the writer as a context manager, to make sure every row has been written. Defaults to
+                None, which flushes after every call to writerow or writerows.
+        """
+        if isinstance(dsv_path, str):
+            self._file = open(dsv_path, mode, encoding='utf-8', buffering=-1 if buffer_size is None else buffer_size)
+            self._owns_file = True
+        else:
+            self._file = dsv_path
+            self._owns_file = False
+
         self._delimiter = delimiter
+        self._autoflush = buffer_size is None
 
     @property
     def delimiter(self):
@@ -40,60 +62,84 @@ class DSVWriter:
         return self._delimiter
 
 
-    def writerow(self, row: list) -> int:
+    def writerow(self, row: Sequence) -> int:
         """
         Writes a single row of data to the file.
 
         Args:
-            row (list): The row of data to be written.
+            row (Sequence): The row of data to be written.
 
         Returns:
             int: The number of characters written to the file.
         """
         ret_val = self._file.write(self._format_row(row))
-        self._file.flush()
+
+        if self._autoflush:
+            self._file.flush()
+
         return ret_val
 
 
-    def writerows(self, rows: list[list]):
+    def writerows(self, rows: Iterable[Sequence]):
         """
         Writes multiple rows to the file.
 
+        Rows are formatted and written in batches, so any iterable can be written without
+        holding it in memory.
+
         Args:
-            rows (list[list]): A list of rows to be written to the file.
+            rows (Iterable[Sequence]): The rows to be written to the file.
         """
-        for row in rows:
-            self._file.write(self._format_row(row))
+        format_row = self._format_row
+        rows = iter(rows)
+
+        while batch := ''.join([format_row(row) for row in islice(rows, _BATCH_SIZE)]):
+            self._file.write(batch)
+
+        if self._autoflush:
+            self._file.flush()
+
+
+    def flush(self) -> None:
+        """Flush any buffered rows to the file."""
+
         self._file.flush()
 
 
-    def _format_row(self, row: list) -> str:
+    def close(self) -> None:
+        """Flush any buffered rows and close the file, unless it was opened by the caller."""
+
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+    def __enter__(self) -> 'DSVWriter':
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+    def _format_row(self, row: Sequence) -> str:
         """
         Formats a row of data into a delimited string.
 
         Args:
-            row (list): The row of data to be formatted.
+            row (Sequence): The row of data to be formatted.
 
         Returns:
             str: The formatted row as a delimited string.
         """
-        output = ''
-        for idx, field in enumerate(row, 1):
-            if field is not None:
-                output += str(field)
-
-            if idx < len(row):
-                output += self.delimiter
-
-        output += '\n'
-
-        return output
+        return self.delimiter.join(['' if field is None else str(field) for field in row]) + '\n'
 
 
     def __del__(self):
         """Close the DSV file when the object is deleted."""
 
-        if hasattr(self, '_file'):
+        if getattr(self, '_owns_file', False):
             self._file.close()
 
 
@@ -101,18 +147,21 @@ class DSVDictWriter(DSVWriter):
     '''
     A class for reading a DSV file from the data in a dictionary.
     '''
-    def __init__(self, dsv_path: str, fieldnames: list[str], delimiter: str = ',', mode: str = 'w') -> None:
+    def __init__(self, dsv_path: str | TextIOBase, fieldnames: list[str], delimiter: str = ',', mode: str = 'w', buffer_size: int | None = None) -> None:
         """
         Initialize a DSVWriter object.
 
         Args:
-            dsv_path (str): The path to the DSV file.
+            dsv_path (str | TextIOBase): The path to the DSV file, or an open text file to write to (see DSVWriter).
             fieldnames (list[str]): The list of field names for the DSV file.
             delimiter (str, optional): The delimiter used in the DSV file. Defaults to ','.
             mode (str, optional): The mode in which the DSV file is opened. Defaults to 'w'.
+            buffer_size (int | None, optional): If set, the size in bytes of the file's write buffer, and
+                rows are no longer flushed individually (see DSVWriter). Defaults to None.
         """
-        super().__init__(dsv_path, delimiter, mode)
+        super().__init__(dsv_path, delimiter, mode, buffer_size)
         self._fieldnames = fieldnames
+        self._getter = itemgetter(*fieldnames) if len(fieldnames) > 1 else None # itemgetter only returns a tuple for several fields
 
 
     @property
@@ -149,19 +198,19 @@ class DSVDictWriter(DSVWriter):
         Raises:
             ValueError: If the length of the row dictionary does not match the number of fieldnames.
         """
-        if len(row) != len(self.fieldnames):
-            raise ValueError
-
-        ordered_row = [row[field] for field in self.fieldnames]
-        return super().writerow(ordered_row)
+        return super().writerow(self._dict_to_row_list(row))
 
 
-    def writerows(self, rows: list[dict]) -> None:
+    def writerows(self, rows: Iterable[dict]) -> None:
         """
         Write multiple rows to the DSV file.
 
+        The rows are validated and written in a single pass, so any iterable (such as a
+        generator streaming rows from a reader) can be written without holding it in memory.
+        Rows before an invalid row will already have been written.
+
         Args:
-            rows (list[dict]): A list of dictionaries representing the rows to be written.
+            rows (Iterable[dict]): The dictionaries representing the rows to be written.
 
         Raises:
             ValueError: If the number of fields in any row does not match the number of fieldnames.
@@ -169,12 +218,7 @@ class DSVDictWriter(DSVWriter):
         Returns:
             None
         """
-        for row in rows:
-            if len(row) != len(self.fieldnames):
-                raise ValueError
-
-        ordered_rows = [self._dict_to_row_list(row) for row in rows]
-        super().writerows(ordered_rows)
+        super().writerows(self._dict_to_row_list(row) for row in rows)
 
     def _dict_to_row_list(self, row: dict):
         """
@@ -183,7 +227,13 @@ class DSVDictWriter(DSVWriter):
         Args:
             row (dict): The dictionary row to convert.
 
+        Raises:
+            ValueError: If the number of fields in the row does not match the number of fieldnames.
+
         Returns:
-            list: A list of values extracted from the dictionary row.
+            tuple | list: The values extracted from the dictionary row, in fieldname order.
         """
-        return [row[field] for field in self.fieldnames]
+        if len(row) != len(self._fieldnames):
+            raise ValueError
+
+        return self._getter(row) if self._getter is not None else [row[field] for field in self._fieldnames]
@@ -0,0 +1,311 @@
+"""
+This module contains a class to write Office Open XML (xlsx) files as a stream.
+
+Only the standard library is used. Each sheet's XML is written into the zip archive as
+rows are written, with strings stored inline rather than in a shared string table, so
+memory use does not grow with the number of rows. The workbook parts which list the
+sheets are written when the writer is closed.
+"""
+
+import re
+from collections.abc import Iterable
+from math import isfinite
+from operator import itemgetter
+from xml.sax.saxutils import escape, quoteattr
+from zipfile import ZIP_DEFLATED, ZipFile
+
+
+_BATCH_SIZE = 512
+
+_MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+_SHEET_START = f'{_XML_DECLARATION}<worksheet xmlns="{_MAIN_NS}"><sheetData>'.encode()
+_SHEET_END = b'</sheetData></worksheet>'
+
+_STYLES = (
+    f'{_XML_DECLARATION}<styleSheet xmlns="{_MAIN_NS}">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+_ROOT_RELS = (
+    f'{_XML_DECLARATION}<Relationships xmlns="{_PKG_REL_NS}">'
+    f'<Relationship Id="rId1" Type="{_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+_INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+
+class XlsxDictWriter:
+    """
+    A class for writing dictionaries to an xlsx file as a stream.
+
+    An xlsx sheet holds at most MAX_SHEET_ROWS rows. Once a sheet is full, writing continues
+    on a new sheet named after the first with a number appended (for example,
+    filteredMeteoriteData_2), which repeats the header if one was written.
+
+    The file is only complete once the writer is closed, so call close() or use the writer
+    as a context manager.
+    """
+    MAX_SHEET_ROWS = 1048576
+
+    def __init__(self, xlsx_path: str, fieldnames: list[str], sheet_name: str = 'filteredMeteoriteData') -> None:
+        """
+        Initializes an instance of the XlsxDictWriter class.
+
+        Args:
+            xlsx_path (str): The path to the xlsx file.
+            fieldnames (list[str]): The list of field names for the columns.
+            sheet_name (str, optional): The name of the first sheet. Defaults to 'filteredMeteoriteData'.
+        """
+        self._path = xlsx_path
+        self._fieldnames = fieldnames
+        self._getter = itemgetter(*fieldnames) if len(fieldnames) > 1 else None # itemgetter only returns a tuple for several fields
+        self._columns = [_column_name(col) for col in range(len(fieldnames))]
+        self._sheet_name = sheet_name
+        self._sheets: list[str] = []
+        self._zip = ZipFile(xlsx_path, 'w', compression=ZIP_DEFLATED)
+        self._stream = None
+        self._pending: list[str] = []
+        self._row = 0
+        self._header = False
+        self._add_sheet()
+
+
+    @property
+    def path(self) -> str:
+        """
+        Get the path of the xlsx file.
+
+        Returns:
+            str: The path of the xlsx file.
+        """
+        return self._path
+
+
+    @property
+    def fieldnames(self) -> list[str]:
+        """
+        Get the field names of the xlsx file.
+
+        Returns:
+            list[str]: The field names.
+        """
+        return self._fieldnames
+
+
+    @property
+    def sheets(self) -> list[str]:
+        """
+        Get the names of the sheets written so far, in order.
+
+        Returns:
+            list[str]: The sheet names.
+        """
+        return self._sheets
+
+
+    def writeheader(self) -> None:
+        """
+        Writes the fieldnames as the header row. The header is repeated at the top of any later sheets.
+        """
+        self._header = True
+        self._write_values(self.fieldnames)
+
+
+    def writerow(self, row: dict) -> None:
+        """
+        Writes a row of data.
+
+        Args:
+            row (dict): A dictionary representing a row of data, where the keys are field names and the values are the corresponding values.
+
+        Raises:
+            ValueError: If the length of the row dictionary does not match the number of fieldnames.
+        """
+        self._write_values(self._dict_to_row_list(row))
+
+
+    def writerows(self, rows: Iterable[dict]) -> None:
+        """
+        Writes multiple rows. Any iterable can be written without holding it in memory.
+
+        Args:
+            rows (Iterable[dict]): The dictionaries representing the rows to be written.
+
+        Raises:
+            ValueError: If the length of a row dictionary does not match the number of fieldnames.
+                Rows before the invalid row will already have been written.
+        """
+        write_values = self._write_values
+        to_row_list = self._dict_to_row_list
+
+        for row in rows:
+            write_values(to_row_list(row))
+
+
+    def close(self) -> None:
+        """
+        Finishes the last sheet, writes the workbook parts, and closes the file.
+        """
+        if self._stream is None:
+            return
+
+        self._end_sheet()
+
+        sheets = ''.join(f'<sheet name={quoteattr(name)} sheetId="{num}" r:id="rId{num}"/>' for num, name in enumerate(self._sheets, 1))
+        self._zip.writestr('xl/workbook.xml', f'{_XML_DECLARATION}<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}"><sheets>{sheets}</sheets></workbook>')
+
+        rels = ''.join(f'<Relationship Id="rId{num}" Type="{_REL_NS}/worksheet" Target="worksheets/sheet{num}.xml"/>' for num in range(1, len(self._sheets) + 1))
+        rels += f'<Relationship Id="rId{len(self._sheets) + 1}" Type="{_REL_NS}/styles" Target="styles.xml"/>'
+        self._zip.writestr('xl/_rels/workbook.xml.rels', f'{_XML_DECLARATION}<Relationships xmlns="{_PKG_REL_NS}">{rels}</Relationships>')
+
+        self._zip.writestr('xl/styles.xml', _STYLES)
+        self._zip.writestr('_rels/.rels', _ROOT_RELS)
+
+        content_type = 'application/vnd.openxmlformats-officedocument.spreadsheetml'
+        overrides = ''.join(f'<Override PartName="/xl/worksheets/sheet{num}.xml" ContentType="{content_type}.worksheet+xml"/>' for num in range(1, len(self._sheets) + 1))
+        self._zip.writestr('[Content_Types].xml', (
+            f'{_XML_DECLARATION}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            f'<Override PartName="/xl/workbook.xml" ContentType="{content_type}.sheet.main+xml"/>'
+            f'<Override PartName="/xl/styles.xml" ContentType="{content_type}.styles+xml"/>'
+            f'{overrides}</Types>'
+        ))
+
+        self._zip.close()
+
+
+    def __enter__(self) -> 'XlsxDictWriter':
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+    def _dict_to_row_list(self, row: dict):
+        """
+        Converts a dictionary row to a list of values.
+
+        Args:
+            row (dict): The dictionary row to convert.
+
+        Raises:
+            ValueError: If the number of fields in the row does not match the number of fieldnames.
+
+        Returns:
+            tuple | list: The values extracted from the dictionary row, in fieldname order.
+        """
+        if len(row) != len(self._fieldnames):
+            raise ValueError
+
+        return self._getter(row) if self._getter is not None else [row[field] for field in self._fieldnames]
+
+
+    def _write_values(self, values: Iterable) -> None:
+        """
+        Writes a row of values to the next row of the current sheet, starting a new sheet if it is full.
+        Rows are written to the file in batches.
+
+        Args:
+            values (Iterable): The values, in column order. None values and empty strings are left blank.
+        """
+        if self._row >= self.MAX_SHEET_ROWS:
+            self._add_sheet()
+
+        self._row += 1
+        ref = str(self._row)
+        cells = []
+
+        for column, value in zip(self._columns, values):
+            kind = type(value)
+
+            if kind is int or (kind is float and isfinite(value)):
+                cells.append(f'<c r="{column}{ref}"><v>{value!r}</v></c>')
+            elif kind is bool:
+                cells.append(f'<c r="{column}{ref}" t="b"><v>{value:d}</v></c>')
+            elif value is not None and value != '':
+                cells.append(f'<c r="{column}{ref}" t="inlineStr"><is><t xml:space="preserve">{_escape(str(value))}</t></is></c>')
+
+        self._pending.append(f'<row r="{ref}">{"".join(cells)}</row>')
+
+        if len(self._pending) >= _BATCH_SIZE:
+            self._flush()
+
+
+    def _flush(self) -> None:
+        """
+        Writes the pending rows to the current sheet.
+        """
+        self._stream.write(''.join(self._pending).encode())
+        self._pending.clear()
+
+
+    def _end_sheet(self) -> None:
+        """
+        Writes the pending rows and the end of the current sheet, and closes it.
+        """
+        self._flush()
+        self._stream.write(_SHEET_END)
+        self._stream.close()
+        self._stream = None
+
+
+    def _add_sheet(self) -> None:
+        """
+        Starts a new sheet, writing the header to it if one was written to the first sheet.
+        """
+        if self._stream is not None:
+            self._end_sheet()
+
+        self._sheets.append(f'{self._sheet_name}_{len(self._sheets) + 1}' if self._sheets else self._sheet_name)
+        self._stream = self._zip.open(f'xl/worksheets/sheet{len(self._sheets)}.xml', 'w', force_zip64=True) # A full sheet can be larger than 2 GiB
+        self._stream.write(_SHEET_START)
+        self._row = 0
+
+        if self._header:
+            self._write_values(self.fieldnames)
+
+
+def _column_name(col: int) -> str:
+    """
+    Get the letters naming a column, as used in cell references.
+
+    Args:
+        col (int): The zero-based column number.
+
+    Returns:
+        str: The column's name, for example 'A' for 0 and 'AA' for 26.
+    """
+    name = ''
+    col += 1
+
+    while col:
+        col, remainder = divmod(col - 1, 26)
+        name = chr(ord('A') + remainder) + name
+
+    return name
+
+
+def _escape(text: str) -> str:
+    """
+    Escapes text for an XML element, removing characters which XML cannot contain.
+
+    Args:
+        text (str): The text.
+
+    Returns:
+        str: The escaped text.
+    """
+    return escape(_INVALID_XML_CHARS.sub('', text))
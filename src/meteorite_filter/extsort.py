@@ -0,0 +1,155 @@
+"""
+This module contains an external merge sort for sorting more rows than fit in memory.
+
+Rows are buffered until their estimated size reaches a memory budget, then sorted and
+spilled to a temporary file as a "run". Runs store the fieldnames once followed by
+batches of value tuples, pickled. Whenever the number of runs reaches the fan in, the
+runs so far are merged into one, so no more than that many run files are kept open.
+Once every row has been read, the runs are merged back together with a k-way merge.
+Both Python's sort and heapq.merge are stable, so the result is identical to sorting
+all of the rows in memory.
+"""
+
+import heapq
+import pickle
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from tempfile import TemporaryFile
+from typing import IO
+
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
+_BATCH_SIZE = 1024
+
+
+def external_sort(rows: Iterable[dict], key: Callable, memory_budget: int = DEFAULT_MEMORY_BUDGET, fan_in: int = 64) -> Iterator[dict]:
+    """
+    Sorts rows, spilling sorted runs to temporary files whenever the buffered rows exceed a memory budget.
+
+    Args:
+        rows (Iterable[dict]): The rows to sort. Every row must have the same fields.
+        key (Callable): The sort key function.
+        memory_budget (int, optional): The approximate number of bytes of rows to buffer before spilling
+            a run to disk. Defaults to DEFAULT_MEMORY_BUDGET (64 MiB).
+        fan_in (int, optional): The maximum number of runs to merge at once, which is also the most
+            run files kept open. Whenever there are this many runs, they are merged into one larger
+            run. Defaults to 64.
+
+    Raises:
+        ValueError: If the memory budget is not positive or the fan in is less than 2.
+
+    Returns:
+        Iterator[dict]: An iterator over the sorted rows. Rows which were spilled to disk are
+            returned as new dictionaries.
+    """
+    if memory_budget <= 0 or fan_in < 2:
+        raise ValueError
+
+    buffer = []
+    buffered_size = 0
+    runs: list[IO[bytes]] = []
+
+    for row in rows:
+        buffer.append(row)
+        buffered_size += _row_size(row)
+
+        if buffered_size >= memory_budget:
+            buffer.sort(key=key)
+            _spill(runs, buffer, key, fan_in)
+            buffer = []
+            buffered_size = 0
+
+    buffer.sort(key=key)
+
+    if not runs:
+        yield from buffer
+        return
+
+    if buffer:
+        _spill(runs, buffer, key, fan_in)
+        buffer = []
+
+    yield from heapq.merge(*[_read_run(run) for run in runs], key=key)
+
+
+def _spill(runs: list[IO[bytes]], rows: list[dict], key: Callable, fan_in: int) -> None:
+    """
+    Writes sorted rows to a new run, first merging the existing runs into one if there are already fan_in of them.
+
+    Args:
+        runs (list[IO[bytes]]): The runs so far, in input order. Updated in place.
+        rows (list[dict]): The sorted rows, which follow every row of the existing runs in the input.
+        key (Callable): The sort key function.
+        fan_in (int): The maximum number of runs to keep.
+    """
+    if len(runs) >= fan_in: # The merged run replaces the runs it holds, keeping input order so the sort stays stable
+        runs[:] = [_write_run(heapq.merge(*[_read_run(run) for run in runs], key=key))]
+
+    runs.append(_write_run(rows))
+
+
+def _row_size(row: dict) -> int:
+    """
+    Estimates the memory used by a row.
+
+    Args:
+        row (dict): The row.
+
+    Returns:
+        int: The approximate size of the row and its values in bytes.
+    """
+    return sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row.values())
+
+
+def _write_run(rows: Iterable[dict]) -> IO[bytes]:
+    """
+    Writes sorted rows to a temporary file.
+
+    Args:
+        rows (Iterable[dict]): The sorted rows.
+
+    Returns:
+        IO[bytes]: The temporary file, rewound to its start. It is deleted when closed.
+    """
+    run = TemporaryFile()
+    rows = iter(rows)
+    first = next(rows, None)
+
+    if first is not None:
+        fieldnames = list(first.keys())
+        pickle.dump(fieldnames, run, pickle.HIGHEST_PROTOCOL)
+        pickle.dump([tuple(first[field] for field in fieldnames)], run, pickle.HIGHEST_PROTOCOL)
+
+        while batch := [tuple(row[field] for field in fieldnames) for row in islice(rows, _BATCH_SIZE)]:
+            pickle.dump(batch, run, pickle.HIGHEST_PROTOCOL)
+
+    run.seek(0)
+    return run
+
+
+def _read_run(run: IO[bytes]) -> Iterator[dict]:
+    """
+    Reads the rows of a run back from its temporary file, then closes (and deletes) it.
+
+    Args:
+        run (IO[bytes]): The run's temporary file.
+
+    Returns:
+        Iterator[dict]: An iterator over the run's rows.
+    """
+    with run:
+        try:
+            fieldnames = pickle.load(run)
+        except EOFError:
+            return
+
+        while True:
+            try:
+                batch = pickle.load(run)
+            except EOFError:
+                return
+
+            for values in batch:
+                yield dict(zip(fieldnames, values))
@@ -8,31 +8,235 @@ filtered data to the terminal or save it to a text or xls file.
 """
 
 
+import os
+import sys
+from argparse import ArgumentParser
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import nullcontext
+from functools import cache
+from meteorite_filter.aggregate import GROUPINGS, aggregate, summary_rows
 from meteorite_filter.constants import *
+from meteorite_filter.dsv.cache import TableCache
+from meteorite_filter.dsv.columnar import MeteoriteTable
 from meteorite_filter.dsv.reader import DSVDictReader
+from meteorite_filter.index import SortedIndex
+from meteorite_filter.loader import BackgroundLoader
+from meteorite_filter.output import TextFileOutput
+from meteorite_filter.query import EqualsPredicate, Predicate, QueryPlanner, RangePredicate, top_k, top_percent
+from meteorite_filter.resultcache import ResultCache
+from meteorite_filter.spatial import GridIndex
+from meteorite_filter import profiling, vectorized
+from meteorite_filter.view import ResultView
 from meteorite_filter.tui.menu import Menu, MenuItem, ReturnableMenuItem
 from meteorite_filter.tui.utils import *
 
 
-def main():
+def main(argv: list[str] | None = None):
     """
     Main function that filters meteorite data based on user input.
+
+    Args:
+        argv (list[str] | None, optional): The command line arguments. Defaults to sys.argv[1:].
     """
+    args = parse_args(argv)
+
+    if args.profile or args.profile_output is not None:
+        profiling.enable(args.profile_output)
+
     clear()
     print(WELCOME_MESSAGE + '\n')
 
     reader = get_reader()
+    reader.usecols = ['name', *FILTER_OPTIONS] # Remaining columns are only loaded if a file export needs them
+
+    loader = start_loading(reader, use_cache=not args.no_cache, clear_cache=args.clear_cache, workers=args.workers)
+    data = loader.table
+
+    if not loader.done:
+        print(term_format('Loading the data in the background. You can choose a query while it loads.\n', TERM_FG_CYAN))
+
+    @cache
+    def indexes() -> dict[str, SortedIndex]: # Built once every row has loaded
+        with profiling.stage('index', len(data)):
+            return {field: SortedIndex(data, field) for field in FILTER_OPTIONS}
 
-    data = list(reader)
+    index = lambda field: indexes()[field] if loader.done else None
+    widen = lambda: wait_for_data(loader) or widen_data(data, reader.path, reader.mode, use_cache=not args.no_cache)
+
+    planner = cache(lambda: QueryPlanner(data, indexes()))
+    grid = cache(lambda: widen() or GridIndex(data)) # Built on first use, as the location columns are not loaded up front
+    results = ResultCache(data)
+    output_query = lambda key, query, field: select_cached_output(results, key, query, field, widen, show_stats=args.cache_stats, loader=loader)
 
     filter_menus = Menu([ReturnableMenuItem(
             prop['menu_desc'], lambda desc=prop['input_desc']: filter_range_input(desc),
-            lambda range, data=data, field=option: select_output(filter_data(data, field, *range), field)
-        ) for option, prop in FILTER_OPTIONS.items()], 'Which field would you like to use to filter the data?')
+            lambda range, field=option: output_query((field, *range), lambda: filter_data(data, field, *range, index=index(field)), field)
+        ) for option, prop in FILTER_OPTIONS.items()] + [ReturnableMenuItem(
+            'Largest or smallest values', rank_input,
+            lambda query: output_query(('rank', *query), lambda: rank_data(data, *query, index=index(query[0])), query[0])
+        ), ReturnableMenuItem(
+            'Combine several conditions', lambda: compound_query_input(reader.fieldnames),
+            lambda predicates: widen() or output_query(('compound', *predicates), lambda: planner().run(predicates), predicates[0].field)
+        ), ReturnableMenuItem(
+            'Location', location_input,
+            lambda query: widen() or output_query(('location', *query), lambda: location_data(grid(), *query), 'GeoLocation')
+        ), ReturnableMenuItem(
+            'Summary statistics', grouping_input,
+            lambda grouping: choose_loaded_data(loader) or select_summary_output(summarize_data(data, grouping, widen, loader.lock), grouping)
+        )], 'Which field would you like to use to filter the data?')
 
     filter_menus()
 
 
+def parse_args(argv: list[str] | None = None):
+    """
+    Parses the application's command line arguments.
+
+    Args:
+        argv (list[str] | None, optional): The command line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = ArgumentParser(description='Interactively filter a meteorite landings data file by mass or year.')
+    parser.add_argument('--no-cache', action='store_true', help='do not read or write the parsed data cache')
+    parser.add_argument('--clear-cache', action='store_true', help="delete the data file's parsed data cache before loading it")
+    parser.add_argument('--cache-stats', action='store_true', help='show the result cache statistics after each query')
+    parser.add_argument('--workers', type=int, metavar='N', help='parse the data file in N worker processes instead of on a single thread')
+    parser.add_argument('--profile', action='store_true', default=profiling.env_enabled(),
+                        help=f'record the time, rows, and peak memory of each stage, and show a summary on quitting (or set {profiling.ENV_VAR}=1)')
+    parser.add_argument('--profile-output', metavar='PATH', default=os.environ.get(profiling.OUTPUT_ENV_VAR),
+                        help=f'also profile every function call with cProfile, saving the statistics to PATH (or set {profiling.OUTPUT_ENV_VAR})')
+    args = parser.parse_args(argv)
+
+    if args.workers is not None and args.workers < 1:
+        parser.error('the number of workers must be positive')
+
+    return args
+
+
+def load_data(reader: DSVDictReader, use_cache: bool = True, clear_cache: bool = False, workers: int | None = None) -> MeteoriteTable:
+    """
+    Loads the rows of a data file, from its parsed data cache if it is up to date.
+
+    If the file has to be parsed and caching is enabled, the cache is rebuilt afterwards.
+
+    Args:
+        reader (DSVDictReader): The reader for the data file.
+        use_cache (bool, optional): Whether to read and write the cache. Defaults to True.
+        clear_cache (bool, optional): Whether to delete the cache before loading. Defaults to False.
+        workers (int | None, optional): The number of worker processes to parse the file with. Defaults to
+            None, which parses it on a single thread.
+
+    Returns:
+        MeteoriteTable: The rows of the data file.
+    """
+    loader = start_loading(reader, use_cache, clear_cache, workers)
+    loader.wait()
+    return loader.table
+
+
+def start_loading(reader: DSVDictReader, use_cache: bool = True, clear_cache: bool = False, workers: int | None = None) -> BackgroundLoader:
+    """
+    Starts loading the rows of a data file on a background thread, unless its parsed data cache is up to date.
+
+    If the file has to be parsed and caching is enabled, the cache is rebuilt once every row has loaded.
+
+    Args:
+        reader (DSVDictReader): The reader for the data file.
+        use_cache (bool, optional): Whether to read and write the cache. Defaults to True.
+        clear_cache (bool, optional): Whether to delete the cache before loading. Defaults to False.
+        workers (int | None, optional): The number of worker processes to parse the file with. Defaults to
+            None, which parses it on a single thread.
+
+    Returns:
+        BackgroundLoader: The loader. It has already finished if the data was loaded from the cache.
+    """
+    cache = TableCache(reader.path, reader.delimiter, reader.type_map)
+
+    if clear_cache and cache.clear():
+        print(f'Cleared cached data {term_format(cache.path, [TERM_ITALIC, TERM_FG_GREEN])}\n')
+
+    if use_cache:
+        with profiling.stage('load cache') as loading:
+            data = cache.load()
+            loading.rows = len(data) if data is not None else None
+
+        if data is not None:
+            return BackgroundLoader.from_table(data)
+
+    def save_cache(table: MeteoriteTable):
+        with profiling.stage('save cache', len(table)):
+            cache.save(table)
+
+    return BackgroundLoader(reader, on_complete=save_cache if use_cache else None, workers=workers).start()
+
+
+def wait_for_data(loader: BackgroundLoader) -> None:
+    """
+    Waits for the data to finish loading, showing its progress.
+
+    Args:
+        loader (BackgroundLoader): The loader.
+    """
+    if loader.wait(0):
+        return
+
+    while not loader.wait(0.1):
+        if sys.stdout.isatty(): # Only redraw the progress in place on a terminal
+            print(f'\r\u001b[2K{term_format(str(loader), TERM_FG_CYAN)}', end='', flush=True)
+
+    print(f'\r\u001b[2K{term_format(str(loader), TERM_FG_CYAN)}\n')
+
+
+def choose_loaded_data(loader: BackgroundLoader) -> None:
+    """
+    If the data is still loading, prompts the user to either wait for it to finish or use the rows loaded so far.
+
+    Args:
+        loader (BackgroundLoader): The loader.
+    """
+    if loader.wait(0):
+        return
+
+    partial = False
+
+    def set_partial(selection: bool):
+        nonlocal partial
+        partial = selection
+
+    scope_menu = Menu([MenuItem('Wait for the rest of the data to load', lambda: False, set_partial),
+        MenuItem('Use the rows loaded so far', lambda: True, set_partial)],
+        f'The data is still loading. {loader}.', default=0)
+
+    scope_menu()
+    print()
+
+    if not partial:
+        wait_for_data(loader)
+
+
+def widen_data(data: MeteoriteTable, path: str, mode: str, use_cache: bool = True) -> None:
+    """
+    Loads any columns of the data file which were left out when the data was loaded.
+
+    Args:
+        data (MeteoriteTable): The loaded data.
+        path (str): The path to the data file.
+        mode (str): The mode the data file was originally opened with. The file is reopened
+            for reading in the same format.
+        use_cache (bool, optional): Whether to update the parsed data cache with the new columns. Defaults to True.
+    """
+    reader = DSVDictReader(path, delimiter='\t', type_map=TYPE_MAP, mode='rb' if 'b' in mode else 'r')
+
+    with profiling.stage('widen', len(data)):
+        widened = data.widen(reader)
+
+    if widened and use_cache:
+        with profiling.stage('save cache', len(data)):
+            TableCache(reader.path, reader.delimiter, reader.type_map).save(data)
+
+
 def input_file_path() -> str:
     """
     Prompts the user to enter the filename, including its file extension and path if necessary.
@@ -53,10 +257,10 @@ def input_file_path() -> str:
 
 def select_open_mode() -> str:
     """
-    Prompts the user to select an open mode for the file.
+    Prompts the user to select an open mode and format for the file.
 
     Returns:
-        str: The selected open mode.
+        str: The selected open mode, followed by the selected format.
     """
     open_mode = ''
 
@@ -69,37 +273,43 @@ def select_open_mode() -> str:
         preamble='What mode would you like to use to open the file?',
         default=0, quit_label='>q')
 
+    open_format_menu = Menu({fmt['param']: MenuItem(
+        label=fmt['desc'], func_call=lambda f=fmt['param']: f, callback=set_open_mode) for fmt in OPEN_FORMATS},
+        preamble='What format would you like to use to read the file?',
+        default=0, quit_label='>q')
+
     open_mode_menu()
+    print()
+    open_format_menu()
     return open_mode
 
 
 def get_reader() -> DSVDictReader:
     """
-    Retrieves a DSVDictReader object for reading a file.
+    Retrieves a DSVDictReader object for reading a file, prompting again until the file can be opened.
 
     Returns:
         DSVDictReader: The reader object for reading the file.
     """
-    file_name = input_file_path()
+    while True:
+        file_name = input_file_path()
 
-    print()
+        print()
 
-    open_mode = select_open_mode()
-    print(f'Opening file {term_format(file_name, [TERM_ITALIC, TERM_FG_GREEN])} using {term_format(OPEN_SHORT_DESCS[open_mode[0]], [TERM_ITALIC, TERM_FG_GREEN])} mode...\n')
+        open_mode = select_open_mode()
+        print(f'Opening file {term_format(file_name, [TERM_ITALIC, TERM_FG_GREEN])} using {term_format(OPEN_SHORT_DESCS[open_mode[0]], [TERM_ITALIC, TERM_FG_GREEN])} mode in {term_format(OPEN_SHORT_DESCS[open_mode[1]], [TERM_ITALIC, TERM_FG_GREEN])} format...\n')
 
-    # Create a reader
-    try:
-        reader = DSVDictReader(file_name, delimiter='\t', type_map=TYPE_MAP, mode=open_mode)
-    except IOError:
-        throw_error(f'Could not open {term_format(file_name, TERM_ITALIC)}. Please double check the file name is correct and the file contains the required format.')
-        reader = get_reader()
-
-    return reader
+        # Create a reader
+        try:
+            return DSVDictReader(file_name, delimiter='\t', type_map=TYPE_MAP, mode=open_mode)
+        except IOError:
+            throw_error(f'Could not open {term_format(file_name, TERM_ITALIC)}. Please double check the file name is correct and the file contains the required format.')
 
 
 def filter_range_input(desc: str) -> tuple[float, float]:
     """
-    Prompts the user to enter lower and upper filter limits for a given description.
+    Prompts the user to enter lower and upper filter limits for a given description,
+    repeating the prompts until the limits are valid.
 
     Args:
         desc (str): The description of the filter.
@@ -107,40 +317,38 @@ def filter_range_input(desc: str) -> tuple[float, float]:
     Returns:
         tuple[float, float]: A tuple containing the lower and upper filter limits.
     """
-    print(term_format('Enter a number for the upper and lower filter limits or type "Q" to quit.\nYou may leave one limit blank.', TERM_FG_CYAN))
+    while True:
+        print(term_format('Enter a number for the upper and lower filter limits or type "Q" to quit.\nYou may leave one limit blank.', TERM_FG_CYAN))
 
-    min_input = finput(f'Enter the LOWER limit (inclusive) for {desc}: ', TERM_FG_GREEN)
+        min_input = finput(f'Enter the LOWER limit (inclusive) for {desc}: ', TERM_FG_GREEN)
 
-    if 'Q' == min_input:
-        quit_app()
+        if 'Q' == min_input:
+            quit_app()
 
-    max_input = finput(f'Enter the UPPER limit (inclusive) for {desc}: ', TERM_FG_GREEN)
+        max_input = finput(f'Enter the UPPER limit (inclusive) for {desc}: ', TERM_FG_GREEN)
 
-    if 'Q' == max_input:
-        quit_app()
-    
-    return filter_input_error_check(min_input, max_input, desc)
+        if 'Q' == max_input:
+            quit_app()
 
+        if (limits := filter_input_error_check(min_input, max_input)) is not None:
+            return limits
 
-def filter_input_error_check(min_input: str, max_input: str, desc: str) -> tuple[float, float]:
+
+def filter_input_error_check(min_input: str, max_input: str) -> tuple[float, float] | None:
     """
-    Check for input errors in the filter range values.
+    Check for input errors in the filter range values, showing an error if there are any.
 
     Args:
         min_input (str): The minimum value of the filter range.
         max_input (str): The maximum value of the filter range.
-        desc (str): The description of the filter range.
 
     Returns:
-        tuple[float, float]: A tuple containing the minimum and maximum values of the filter range.
-
-    Raises:
-        ValueError: If the limits are not valid numeric values.
-
+        tuple[float, float] | None: A tuple containing the minimum and maximum values of the filter range,
+            or None if the limits are not valid numeric values.
     """
     if min_input == '' and max_input == '':
         throw_error('At least one limit must be set.')
-        return filter_range_input(desc)
+        return None
 
     min_input = '-inf' if min_input == '' else min_input
     max_input = 'inf' if max_input == '' else max_input
@@ -149,10 +357,261 @@ def filter_input_error_check(min_input: str, max_input: str, desc: str) -> tuple
         return (float(min_input), float(max_input))
     except ValueError:
         throw_error('Limits must be valid numeric values.')
-        return filter_range_input(desc)
+        return None
 
 
-def filter_data(data: list[dict], field: str, min_val = float('-inf'), max_val = float('inf')) -> list[dict]:
+def rank_input() -> tuple[str, bool, int | None, float | None]:
+    """
+    Prompts the user to select a field and direction to rank the data by, then how many rows to find.
+
+    Returns:
+        tuple[str, bool, int | None, float | None]: The field, whether to find the largest values,
+            and either the number of rows or the percentage of rows to find (the other is None).
+    """
+    ranking = ()
+
+    def set_ranking(selection: tuple[str, bool]):
+        nonlocal ranking
+        ranking = selection
+
+    rank_menu = Menu([MenuItem(
+        prop[f'{direction}_desc'], lambda field=option, largest=direction == 'largest': (field, largest), set_ranking
+        ) for option, prop in FILTER_OPTIONS.items() for direction in ('largest', 'smallest')],
+        'Which values would you like to find?')
+
+    rank_menu()
+    print()
+
+    while True:
+        print(term_format('Enter a number of meteorites, or a percentage followed by "%" (ex: "100" or "1%"), or type "Q" to quit.', TERM_FG_CYAN))
+        count_input = finput('Enter the number of meteorites to find: ', TERM_FG_GREEN)
+
+        if 'Q' == count_input:
+            quit_app()
+
+        try:
+            if count_input.endswith('%'):
+                percent = float(count_input[:-1])
+                if not 0 < percent <= 100: raise ValueError
+                return (*ranking, None, percent)
+
+            count = int(count_input)
+            if count <= 0: raise ValueError
+            return (*ranking, count, None)
+        except ValueError:
+            throw_error('The number must be a positive whole number, or a percentage between 0 and 100.')
+
+
+def compound_query_input(fieldnames: list[str]) -> list[Predicate]:
+    """
+    Prompts the user to build a query from several conditions, all of which must be met.
+
+    Numeric fields are given a range, and other fields a value to equal.
+
+    Args:
+        fieldnames (list[str]): The fields of the data file.
+
+    Returns:
+        list[Predicate]: The conditions, in the order they were entered.
+    """
+    predicates = []
+    field = ''
+    done = False
+
+    def set_field(selection: str):
+        nonlocal field
+        field = selection
+
+    def set_done(selection: bool):
+        nonlocal done
+        done = selection
+
+    field_menu = Menu([MenuItem(name, lambda name=name: name, set_field) for name in fieldnames],
+        'Which field would you like to add a condition on?')
+    next_menu = Menu([MenuItem('Add another condition', lambda: False, set_done), MenuItem('Run the query', lambda: True, set_done)],
+        default=1)
+
+    while not done:
+        field_menu()
+        print()
+
+        if field in TYPE_MAP:
+            desc = FILTER_OPTIONS[field]['input_desc'] if field in FILTER_OPTIONS else field
+            predicates.append(RangePredicate(field, *filter_range_input(desc)))
+        else:
+            value = finput(f'Enter the value {field} must equal, or type "Q" to quit: ', TERM_FG_GREEN)
+
+            if 'Q' == value:
+                quit_app()
+
+            predicates.append(EqualsPredicate(field, value))
+
+        print(term_format('\nConditions: ' + ' AND '.join(str(predicate) for predicate in predicates), TERM_FG_CYAN))
+        next_menu()
+        print()
+
+    return predicates
+
+
+def location_input() -> tuple:
+    """
+    Prompts the user to select a kind of location query and enter its parameters.
+
+    Returns:
+        tuple: The kind of query ('radius' or 'bbox'), followed by its parameters: the latitude,
+            longitude, and distance in kilometres for 'radius', or the minimum and maximum
+            latitude and minimum and maximum longitude for 'bbox'.
+    """
+    kind = ''
+
+    def set_kind(selection: str):
+        nonlocal kind
+        kind = selection
+
+    kind_menu = Menu([MenuItem('Within a distance of a place', lambda: 'radius', set_kind),
+        MenuItem('Inside a latitude and longitude box', lambda: 'bbox', set_kind)],
+        'Which meteorites would you like to find?')
+
+    kind_menu()
+    print()
+    print(term_format('Enter latitudes in degrees north (-90 to 90) and longitudes in degrees east (-180 to 180), or type "Q" to quit.', TERM_FG_CYAN))
+
+    if kind == 'radius':
+        return ('radius', number_input('Enter the latitude of the place: ', -90, 90),
+                number_input('Enter the longitude of the place: ', -180, 180),
+                number_input('Enter the distance from the place in kilometres: ', 0))
+
+    return ('bbox', number_input('Enter the SOUTHERN latitude of the box: ', -90, 90),
+            number_input('Enter the NORTHERN latitude of the box: ', -90, 90),
+            number_input('Enter the WESTERN longitude of the box: ', -180, 180),
+            number_input('Enter the EASTERN longitude of the box: ', -180, 180))
+
+
+def number_input(prompt: str, min_val=float('-inf'), max_val=float('inf')) -> float:
+    """
+    Prompts the user to enter a number, repeating the prompt until it is valid.
+    If the user enters "Q", the application will exit.
+
+    Args:
+        prompt (str): The prompt text.
+        min_val (float, optional): The minimum valid value (inclusive). Defaults to negative infinity.
+        max_val (float, optional): The maximum valid value (inclusive). Defaults to positive infinity.
+
+    Returns:
+        float: The entered number.
+    """
+    while True:
+        value = finput(prompt, TERM_FG_GREEN)
+
+        if 'Q' == value:
+            quit_app()
+
+        try:
+            number = float(value)
+            if not min_val <= number <= max_val: raise ValueError
+            return number
+        except ValueError:
+            throw_error(f'The value must be a number from {min_val:g} to {max_val:g}.')
+
+
+def location_data(grid: GridIndex, kind: str, *params: float) -> ResultView:
+    """
+    Finds the rows matching a location query.
+
+    Args:
+        grid (GridIndex): The spatial index of the data.
+        kind (str): The kind of query, 'radius' or 'bbox'.
+        *params (float): The query's parameters, as returned by location_input.
+
+    Returns:
+        ResultView: A view of the matching rows, ordered by distance for 'radius' or by location for 'bbox'.
+    """
+    return grid.within(*params) if kind == 'radius' else grid.bbox(*params)
+
+
+def grouping_input() -> str:
+    """
+    Prompts the user to select how to group the data for summary statistics.
+
+    Returns:
+        str: The selected grouping, a key of GROUPINGS.
+    """
+    grouping = ''
+
+    def set_grouping(selection: str):
+        nonlocal grouping
+        grouping = selection
+
+    grouping_menu = Menu([MenuItem(prop['menu_desc'], lambda option=option: option, set_grouping) for option, prop in GROUPINGS.items()],
+        'How would you like to group the meteorites?')
+
+    grouping_menu()
+    print()
+    return grouping
+
+
+def summarize_data(data: MeteoriteTable, grouping: str, widen=None, lock=None) -> list[dict]:
+    """
+    Calculates the number of meteorites and statistics of their mass for each group of a grouping.
+
+    Args:
+        data (MeteoriteTable): The data.
+        grouping (str): The grouping, a key of GROUPINGS.
+        widen (optional): A function which loads any columns left out of the data. It is called
+            if the grouping's field has not been loaded. Defaults to None.
+        lock (optional): A lock to hold while the data is summarized, such as a BackgroundLoader's
+            lock to pause loading. Defaults to None.
+
+    Returns:
+        list[dict]: A summary row for each group, ordered by group.
+    """
+    if GROUPINGS[grouping]['field'] not in data.fieldnames and widen is not None:
+        widen()
+
+    with lock if lock is not None else nullcontext(), profiling.stage('summary', len(data)):
+        return summary_rows(aggregate(data, [grouping])[grouping], grouping)
+
+
+def select_summary_output(rows: list[dict], grouping: str):
+    """
+    Prompts the user to select an output option for summary statistics.
+
+    Args:
+        rows (list[dict]): The summary rows.
+        grouping (str): The grouping the statistics are for.
+    """
+    output_menus = Menu([MenuItem(
+            prop['menu_desc'], lambda output_func=prop['func']: output_func(rows, grouping)
+        ) for option, prop in SUMMARY_OUTPUT_OPTIONS.items()],
+        'How would you like to output the summary?'
+    )
+
+    output_menus()
+
+
+def rank_data(data: list[dict], field: str, largest: bool, count: int | None = None, percent: float | None = None, index: SortedIndex | None = None) -> ResultView:
+    """
+    Finds the rows with the largest or smallest values of a field, without sorting the whole dataset.
+
+    Args:
+        data (list[dict]): The list of dictionaries representing the data.
+        field (str): The field to rank by.
+        largest (bool): Whether to find the largest values rather than the smallest.
+        count (int | None, optional): The number of rows to find. Defaults to None.
+        percent (float | None, optional): The percentage of rows to find, used if count is None. Defaults to None.
+        index (SortedIndex | None, optional): A prebuilt index of the data on the field. Defaults to None.
+
+    Returns:
+        ResultView: A view of the matching rows, ordered by field and name: descending if largest is True, otherwise ascending.
+    """
+    with profiling.stage('rank') as ranking:
+        result = top_percent(data, field, percent, largest, index) if count is None else top_k(data, field, count, largest, index)
+        ranking.rows = len(result)
+
+    return result
+
+
+def filter_data(data: list[dict], field: str, min_val = float('-inf'), max_val = float('inf'), index: SortedIndex | None = None) -> ResultView:
     """
     Filters the given data based on the specified field and value range.
 
@@ -161,27 +620,131 @@ def filter_data(data: list[dict], field: str, min_val = float('-inf'), max_val =
         field (str): The field to filter on.
         min_val (float, optional): The minimum value for the field. Defaults to negative infinity.
         max_val (float, optional): The maximum value for the field. Defaults to positive infinity.
+        index (SortedIndex | None, optional): A prebuilt index of the data on the field. If provided,
+            the matching rows are found by binary search instead of scanning and sorting. Defaults to None.
+
+    Returns:
+        ResultView: A view of the filtered rows, ordered by field and name. The rows are not copied.
+    """
+    with profiling.stage('filter') as filtering:
+        if index is not None and index.field == field:
+            result = index.range(min_val, max_val)
+        elif vectorized.supports(data, field):
+            result = vectorized.filter_table(data, field, min_val, max_val)
+        else:
+            positions = [pos for pos, row in enumerate(data) if (val := row[field]) is not None and val >= min_val and val <= max_val]
+            positions.sort(key=lambda pos, k=field: (data[pos][k], data[pos]['name']))
+            result = ResultView(data, positions)
+
+        filtering.rows = len(result)
+
+    return result
+
+
+def filter_stream(rows: Iterable[dict], field: str, min_val = float('-inf'), max_val = float('inf'), ordered: bool = True, memory_budget: int | None = None) -> Iterator[dict]:
+    """
+    Filters a stream of rows based on the specified field and value range, without holding
+    the whole stream in memory.
+
+    Args:
+        rows (Iterable[dict]): The rows to filter, such as a DSVDictReader.
+        field (str): The field to filter on.
+        min_val (float, optional): The minimum value for the field. Defaults to negative infinity.
+        max_val (float, optional): The maximum value for the field. Defaults to positive infinity.
+        ordered (bool, optional): Whether to order the results by field and name, as filter_data does.
+            This buffers the matching rows (but no others) to sort them. If False, matching rows are
+            yielded in their original order as soon as they are read. Defaults to True.
+        memory_budget (int | None, optional): If set, ordered results are sorted with an external merge
+            sort which spills to temporary files once the buffered rows use roughly this many bytes.
+            Defaults to None, which sorts in memory.
 
     Returns:
-        list[dict]: The filtered data as a list of dictionaries.
+        Iterator[dict]: An iterator over the matching rows.
+    """
+    matches = (row for row in rows if (val := row[field]) is not None and val >= min_val and val <= max_val)
+    key = lambda x, k=field: (x[k], x['name'])
+
+    if not ordered:
+        return matches
+
+    if memory_budget is not None:
+        from meteorite_filter.extsort import external_sort # Only loaded when needed, as tempfile is slow to import
+        return external_sort(matches, key, memory_budget)
+
+    return iter(sorted(matches, key=key))
+
+
+def filter_file(dsv_path: str, field: str, min_val = float('-inf'), max_val = float('inf'), output_func = TextFileOutput.output, ordered: bool = True, mode: str = 'r', memory_budget: int | None = None) -> None:
     """
-    return sorted([row for row in data if (val := row[field]) is not None and val >= min_val and val <= max_val], key=lambda x, k=field: (x[k], x['name']))
+    Filters a data file in a single streaming pass, writing the matching rows straight to an output.
 
+    Only the matching rows (or, if ordered is False or a memory budget is set, a bounded number of
+    rows) are held in memory, so files far larger than memory can be filtered.
 
-def select_output(data: list[dict], field):
+    Args:
+        dsv_path (str): The path to the data file.
+        field (str): The field to filter on.
+        min_val (float, optional): The minimum value for the field. Defaults to negative infinity.
+        max_val (float, optional): The maximum value for the field. Defaults to positive infinity.
+        output_func (optional): The output to write the matching rows to. Defaults to TextFileOutput.output.
+        ordered (bool, optional): Whether to order the results by field and name. Defaults to True.
+        mode (str, optional): The mode to open the data file with. Defaults to 'r'.
+        memory_budget (int | None, optional): If set, ordered results larger than roughly this many
+            bytes are sorted on disk and merged straight into the output. Defaults to None.
+    """
+    reader = DSVDictReader(dsv_path, delimiter='\t', type_map=TYPE_MAP, mode=mode)
+    output_func(filter_stream(reader, field, min_val, max_val, ordered, memory_budget), field)
+
+
+def select_cached_output(results: ResultCache, key: tuple, query: Callable[[], list[dict]], field: str, widen=None, show_stats: bool = False, loader: BackgroundLoader | None = None):
+    """
+    Runs a query, reusing its result if the same query was run recently, and prompts the user to select an output option for it.
+
+    Args:
+        results (ResultCache): The cache of recent query results.
+        key (tuple): A key identifying the query, such as its field and limits.
+        query (Callable[[], list[dict]]): A function which runs the query.
+        field (str): The field the data was filtered on.
+        widen (optional): A function which loads any columns left out of the data. Defaults to None.
+        show_stats (bool, optional): Whether to print the cache's statistics afterwards. Defaults to False.
+        loader (BackgroundLoader | None, optional): The loader of the data. If it has not finished, the user
+            chooses whether to wait for it, and loading is paused while the query runs. Defaults to None.
+    """
+    if loader is not None:
+        choose_loaded_data(loader)
+
+    with loader.lock if loader is not None else nullcontext(), profiling.stage('query') as querying:
+        result = results.get_or_compute(key, query)
+        querying.rows = len(result)
+
+    select_output(result, field, widen)
+
+    if show_stats:
+        print(term_format(str(results), TERM_FG_CYAN) + '\n')
+
+
+def select_output(data: list[dict], field, widen=None):
     """
     Selects the output method for the filtered results.
 
     Args:
         data (list[dict]): The input data to be filtered.
         field: The field to be filtered.
+        widen (optional): A function which loads any columns left out of the data. It is called
+            before outputs which need full rows. Defaults to None.
 
     Returns:
         None
     """
+    def run_output(output_func, full_rows: bool):
+        if full_rows and widen is not None:
+            widen()
+
+        output_func(data, field)
+
     output_menus = Menu([MenuItem(
             prop['menu_desc'],
-            lambda output_func=prop['func'], data=data, field=field: output_func(data, field)
+            lambda output_func=prop['func'], full_rows=prop.get('full_rows', False): run_output(output_func, full_rows)
         ) for option, prop in OUTPUT_OPTIONS.items()],
         'How would you like to output the filtered results?'
     )
@@ -0,0 +1,166 @@
+"""
+This module contains a sorted index for answering range queries on a single field.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from meteorite_filter import vectorized
+from meteorite_filter.view import ResultView
+
+
+class SortedIndex:
+    """
+    A permutation of a dataset's rows, ordered by a field and then by the row's name.
+
+    Rows where the field is None are left out of the index. The index is built once,
+    after which range queries use binary search and return an already-ordered slice
+    in O(log n + k) instead of scanning and sorting the whole dataset. If NumPy is
+    installed, indexes of a MeteoriteTable's numeric columns are built with it.
+    """
+    def __init__(self, data: list[dict], field: str) -> None:
+        """
+        Initializes an instance of the SortedIndex class.
+
+        Args:
+            data (list[dict]): The rows to index. The index keeps a reference to this list.
+            field (str): The field to order the rows by.
+        """
+        self._data = data
+        self._field = field
+
+        if vectorized.supports(data, field):
+            order, self._keys = vectorized.sorted_positions(data, field)
+        else:
+            order = sorted(
+                (pos for pos, row in enumerate(data) if row[field] is not None),
+                key=lambda pos: (data[pos][field], data[pos]['name'])
+            )
+            self._keys = [data[pos][field] for pos in order]
+
+        self._order = memoryview(array('q', order))
+
+
+    @property
+    def field(self) -> str:
+        """
+        Get the field the index is ordered by.
+
+        Returns:
+            str: The indexed field.
+        """
+        return self._field
+
+
+    def __len__(self) -> int:
+        """
+        Get the number of indexed (non-null) rows.
+
+        Returns:
+            int: The number of rows in the index.
+        """
+        return len(self._order)
+
+
+    def positions(self, min_val=float('-inf'), max_val=float('inf')) -> list[int]:
+        """
+        Finds the positions of the rows whose field falls within the given range.
+
+        Args:
+            min_val (float, optional): The minimum value (inclusive). Defaults to negative infinity.
+            max_val (float, optional): The maximum value (inclusive). Defaults to positive infinity.
+
+        Returns:
+            list[int]: The positions of the matching rows in the indexed data, ordered by field and name.
+        """
+        return self._slice(min_val, max_val).tolist()
+
+
+    def count(self, min_val=float('-inf'), max_val=float('inf')) -> int:
+        """
+        Counts the rows whose field falls within the given range, without finding them.
+
+        Args:
+            min_val (float, optional): The minimum value (inclusive). Defaults to negative infinity.
+            max_val (float, optional): The maximum value (inclusive). Defaults to positive infinity.
+
+        Returns:
+            int: The number of matching rows.
+        """
+        if min_val != min_val or max_val != max_val:
+            return 0
+
+        return max(bisect_right(self._keys, max_val) - bisect_left(self._keys, min_val), 0)
+
+
+    def range(self, min_val=float('-inf'), max_val=float('inf')) -> ResultView:
+        """
+        Finds the rows whose field falls within the given range.
+
+        Args:
+            min_val (float, optional): The minimum value (inclusive). Defaults to negative infinity.
+            max_val (float, optional): The maximum value (inclusive). Defaults to positive infinity.
+
+        Returns:
+            ResultView: A view of the matching rows, ordered by field and name.
+        """
+        return ResultView(self._data, self._slice(min_val, max_val))
+
+
+    def _slice(self, min_val, max_val) -> memoryview:
+        """
+        Finds the positions of the rows whose field falls within the given range, without copying them.
+
+        Args:
+            min_val (float): The minimum value (inclusive).
+            max_val (float): The maximum value (inclusive).
+
+        Returns:
+            memoryview: A slice of the index's order.
+        """
+        if min_val != min_val or max_val != max_val: # NaN never compares true, so nothing matches
+            return self._order[0:0]
+
+        start = bisect_left(self._keys, min_val)
+        stop = bisect_right(self._keys, max_val)
+        return self._order[start:max(start, stop)]
+
+
+    def head(self, k: int) -> ResultView:
+        """
+        Get the rows with the k smallest values of the field.
+
+        Args:
+            k (int): The number of rows.
+
+        Returns:
+            ResultView: A view of up to k rows, in ascending order of field and name.
+        """
+        return ResultView(self._data, self._order[:max(k, 0)])
+
+
+    def tail(self, k: int) -> ResultView:
+        """
+        Get the rows with the k largest values of the field.
+
+        Args:
+            k (int): The number of rows.
+
+        Returns:
+            ResultView: A view of up to k rows, in descending order of field and name. Rows with the
+                same value and name keep their order in the data, as they do without an index.
+        """
+        key = lambda i: (self._keys[i], self._data[self._order[i]]['name'])
+        k = min(max(k, 0), len(self._order))
+        positions = []
+        stop = len(self._order)
+
+        while len(positions) < k: # Take each run of equal keys from the end, keeping the run in ascending order
+            start = stop - 1
+            while start > 0 and key(start - 1) == key(stop - 1):
+                start -= 1
+
+            positions.extend(self._order[start:min(stop, start + k - len(positions))])
+            stop = start
+
+        return ResultView(self._data, positions)
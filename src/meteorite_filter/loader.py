@@ -0,0 +1,221 @@
+"""
+This module contains a loader which parses a data file on a background thread.
+"""
+
+import os
+import threading
+from collections.abc import Callable
+from itertools import islice
+from time import perf_counter
+
+from meteorite_filter import profiling
+from meteorite_filter.dsv.columnar import MeteoriteTable
+
+
+class BackgroundLoader:
+    """
+    Loads the rows of a DSVDictReader into a MeteoriteTable on a background thread, so
+    the table can be used while it is still growing. Given a number of workers, the file
+    is instead parsed in chunks by a pool of worker processes (see dsv.parallel), and
+    each chunk is appended once it and every chunk before it have been parsed.
+
+    Rows are appended in batches while holding the loader's lock. Code which needs the
+    table to stay the same size while it runs (such as a query on the rows loaded so
+    far, or anything which views a column's buffer) should hold the lock as well, which
+    pauses loading until it is released. Positions of rows already loaded never change.
+    """
+    BATCH_SIZE = 4096
+
+    def __init__(self, reader, on_complete: Callable[[MeteoriteTable], None] | None = None, workers: int | None = None) -> None:
+        """
+        Initializes an instance of the BackgroundLoader class. Loading starts when start() is called.
+
+        Args:
+            reader (DSVDictReader): The reader to consume. Only its projected columns (see
+                DSVDictReader.usecols) are loaded.
+            on_complete (Callable[[MeteoriteTable], None] | None, optional): A function called on the
+                background thread with the table once every row has been loaded, before the load
+                is reported as done (for example, to save it to a cache). Defaults to None.
+            workers (int | None, optional): The number of worker processes to parse the file with.
+                Defaults to None, which parses it with the reader on the background thread.
+        """
+        self._reader = reader
+        self._on_complete = on_complete
+        self._workers = workers
+        self._table = MeteoriteTable(reader.fieldnames if reader.usecols is None else reader.usecols, reader.type_map)
+        self._total_bytes = os.path.getsize(reader.path)
+        self._bytes_read = 0
+        self._started = 0.0
+        self._finished = None
+        self._error = None
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='BackgroundLoader', daemon=True)
+        self.lock = threading.Lock()
+
+
+    @classmethod
+    def from_table(cls, table: MeteoriteTable) -> 'BackgroundLoader':
+        """
+        Creates a loader which has already finished, for a table loaded some other way (such as from a cache).
+
+        Args:
+            table (MeteoriteTable): The loaded table.
+
+        Returns:
+            BackgroundLoader: The finished loader.
+        """
+        loader = cls.__new__(cls)
+        loader._reader = None
+        loader._on_complete = None
+        loader._workers = None
+        loader._table = table
+        loader._total_bytes = loader._bytes_read = 0
+        loader._started = loader._finished = perf_counter()
+        loader._error = None
+        loader._done = threading.Event()
+        loader._done.set()
+        loader._thread = None
+        loader.lock = threading.Lock()
+        return loader
+
+
+    @property
+    def table(self) -> MeteoriteTable:
+        """
+        Get the table being loaded. It grows as rows are loaded.
+
+        Returns:
+            MeteoriteTable: The table.
+        """
+        return self._table
+
+
+    @property
+    def done(self) -> bool:
+        """
+        Check whether loading has finished, successfully or not.
+
+        Returns:
+            bool: True if loading has finished.
+        """
+        return self._done.is_set()
+
+
+    def start(self) -> 'BackgroundLoader':
+        """
+        Starts loading on the background thread.
+
+        Returns:
+            BackgroundLoader: The loader.
+        """
+        if self._thread is not None and not self._thread.is_alive() and not self.done:
+            self._started = perf_counter()
+            self._thread.start()
+
+        return self
+
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Waits for loading to finish.
+
+        Args:
+            timeout (float | None, optional): The longest time to wait in seconds. Defaults to None, which waits until it finishes.
+
+        Raises:
+            Exception: Any exception raised while loading the file, such as a ValueError for an unparsable value.
+
+        Returns:
+            bool: True if loading has finished, or False if the timeout expired first.
+        """
+        if not self._done.wait(timeout):
+            return False
+
+        if self._error is not None:
+            raise self._error
+
+        return True
+
+
+    def progress(self) -> tuple[int, int, int, float]:
+        """
+        Get the progress of loading so far.
+
+        Returns:
+            tuple[int, int, int, float]: The number of rows loaded, the number of bytes of the file read,
+                the size of the file in bytes, and the number of seconds spent loading.
+        """
+        finished = self._finished if self._finished is not None else perf_counter()
+        return len(self._table), self._bytes_read, self._total_bytes, finished - self._started
+
+
+    def __str__(self) -> str:
+        """
+        Get a summary of the progress of loading, with the reading speed and an estimate of the time left.
+
+        Returns:
+            str: The progress, for example "Loaded 12,288 rows (1.2 of 4.5 MB, 27%) at 9.8 MB/s, about 0.3 seconds left".
+        """
+        rows, bytes_read, total_bytes, elapsed = self.progress()
+
+        if self.done:
+            return f'Loaded {rows:,} rows in {elapsed:.1f} seconds'
+
+        fraction = bytes_read / total_bytes if total_bytes else 0
+        speed = bytes_read / elapsed if elapsed > 0 else 0
+        eta = f', about {(total_bytes - bytes_read) / speed:.1f} seconds left' if speed else ''
+        return (f'Loaded {rows:,} rows ({bytes_read / 1024 / 1024:.1f} of {total_bytes / 1024 / 1024:.1f} MB, {fraction:.0%}) '
+                f'at {speed / 1024 / 1024:.1f} MB/s{eta}')
+
+
+    def _run(self) -> None:
+        """
+        Loads every row of the reader into the table, in batches or in chunks parsed by worker processes.
+        """
+        try:
+            with profiling.profile_thread():
+                with profiling.stage('parse') as parsing:
+                    if self._workers is None:
+                        self._load_rows()
+                    else:
+                        self._load_chunks()
+
+                    parsing.rows = len(self._table)
+
+                self._bytes_read = self._total_bytes
+                self._finished = perf_counter()
+
+                if self._on_complete is not None:
+                    self._on_complete(self._table)
+        except Exception as error:
+            self._error = error
+        finally:
+            if self._finished is None:
+                self._finished = perf_counter()
+
+            self._done.set()
+
+
+    def _load_rows(self) -> None:
+        """
+        Parses the rows with the reader and appends them to the table, in batches.
+        """
+        rows = iter(self._reader)
+
+        while batch := list(islice(rows, self.BATCH_SIZE)):
+            with self.lock:
+                self._table.extend(batch)
+                self._bytes_read = self._reader.bytes_read
+
+
+    def _load_chunks(self) -> None:
+        """
+        Parses the file in chunks with a pool of worker processes and appends each chunk to the table, in file order.
+        """
+        from meteorite_filter.dsv.parallel import read_chunks
+        reader = self._reader
+
+        for stop, columns in read_chunks(reader.path, reader.delimiter, reader.type_map, self._workers, usecols=reader.usecols):
+            with self.lock:
+                self._table.extend_columns(columns)
+                self._bytes_read = stop
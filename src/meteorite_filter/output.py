@@ -1,13 +1,23 @@
 """
 This module contains an interface for output methods and
 classes which implement it.
+
+File writers are imported when an output first uses them, so that starting the
+application does not pay for loading backends (such as xlwt) which may never be used.
 """
 
+import sys
+from collections.abc import Iterable, Iterator, Sequence, Sized
 from datetime import datetime as dt
-from meteorite_filter.dsv.excel import ExcelDictWriter
-from meteorite_filter.dsv.writer import DSVDictWriter
+from itertools import chain
+from time import perf_counter
+from meteorite_filter import profiling
+from meteorite_filter.tui.pager import Pager, default_page_size
 from meteorite_filter.tui.table import TablePrinter
 
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+
 class OutputInterface:
     @staticmethod
     def output(data: list[dict], field: str):
@@ -23,55 +33,204 @@ class OutputInterface:
 
 class TerminalOutput(OutputInterface):
     @staticmethod
-    def output(data: list[dict], field: str):
+    def output(data: Sequence[dict], field: str):
         """
-        Output the data to the terminal.
+        Output the data to the terminal. When running interactively, data longer than
+        the terminal is shown one page at a time.
 
         Args:
-            data (list[dict]): The data to be outputted.
+            data (Sequence[dict]): The data to be outputted.
             field (str): The field to be displayed in the output.
         """
         from meteorite_filter.constants import FILTER_OPTIONS
-        table = TablePrinter(('', 'NAME', FILTER_OPTIONS[field]['header']), [(row_no, row['name'], row[field]) for row_no, row in enumerate(data, 1)])
+        header = FILTER_OPTIONS[field]['header'] if field in FILTER_OPTIONS else field.upper()
+        table = TablePrinter(('', 'NAME', header), _NumberedEntries(data, field))
+
+        if len(table) > default_page_size() and sys.stdin.isatty() and sys.stdout.isatty():
+            with profiling.stage('render', len(table)):
+                pager = Pager(table)
+
+            pager()
+            return
+
+        with profiling.stage('render', len(table)):
+            text = str(table)
+
         print()
-        print(table)
+        print(text)
 
 
 class TextFileOutput(OutputInterface):
     @staticmethod
-    def output(data: list[dict], field: str):
+    def output(data: Iterable[dict], field: str, path: str | None = None):
         """
-        Output the data to a text file.
+        Output the data to a text file. The rows are written as they are read, so
+        data can be streamed. Nothing is written if there is no data.
 
         Args:
-            data (list[dict]): The data to be outputted.
+            data (Iterable[dict]): The data to be outputted.
             field (str): The field to be displayed in the output.
+            path (str | None, optional): The path of the file. Defaults to None, which names it after the current date and time.
         """
-        path = _gen_filename('txt')
-        fieldnames = list(data[0].keys())
+        rows, fieldnames = _peek_fieldnames(data)
+        if fieldnames is None:
+            return
+
+        from meteorite_filter.dsv.writer import DSVDictWriter
+        path = path if path is not None else _gen_filename('txt')
+        start = perf_counter()
+
+        with profiling.stage('write txt', _row_count(data)), DSVDictWriter(path, fieldnames, delimiter='\t', buffer_size=_WRITE_BUFFER_SIZE) as writer:
+            writer.writeheader()
+            writer.writerows(rows)
+
+        print(f'\nSaved {path} in {perf_counter() - start:.2f} seconds.')
+
+
+class StdoutOutput(OutputInterface):
+    @staticmethod
+    def output(data: Iterable[dict], field: str):
+        """
+        Output the data to standard output as tab-separated values, with a header. The rows
+        are written as they are read, so data can be streamed. Nothing is written if there is no data.
+
+        Args:
+            data (Iterable[dict]): The data to be outputted.
+            field (str): The field to be displayed in the output.
+        """
+        rows, fieldnames = _peek_fieldnames(data)
+        if fieldnames is None:
+            return
+
+        from meteorite_filter.dsv.writer import DSVDictWriter
 
-        writer = DSVDictWriter(path, fieldnames, delimiter='\t')
-        writer.writeheader()
-        writer.writerows(data)
+        with profiling.stage('write stdout', _row_count(data)), DSVDictWriter(sys.stdout, fieldnames, delimiter='\t', buffer_size=_WRITE_BUFFER_SIZE) as writer:
+            writer.writeheader()
+            writer.writerows(rows)
 
 
 class ExcelFileOutput(OutputInterface):
     @staticmethod
-    def output(data: list[dict], field: str):
+    def output(data: Iterable[dict], field: str, path: str | None = None):
         """
-        Output the data to an Excel file.
+        Output the data to an Excel file. Nothing is written if there is no data.
 
         Args:
-            data (list[dict]): The data to be outputted.
+            data (Iterable[dict]): The data to be outputted.
+            field (str): The field to be displayed in the output.
+            path (str | None, optional): The path of the file. Defaults to None, which names it after the current date and time.
+        """
+        rows, fieldnames = _peek_fieldnames(data)
+        if fieldnames is None:
+            return
+
+        from meteorite_filter.dsv.excel import ExcelDictWriter
+        path = path if path is not None else _gen_filename('xls')
+
+        with profiling.stage('write xls', _row_count(data)):
+            writer = ExcelDictWriter(path, fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+
+            with profiling.stage('save'):
+                elapsed = writer.save()
+
+        sheets = f' across {len(writer.sheets)} sheets' if len(writer.sheets) > 1 else ''
+        print(f'\nSaved {path}{sheets} in {elapsed:.2f} seconds.')
+
+
+class XlsxFileOutput(OutputInterface):
+    @staticmethod
+    def output(data: Iterable[dict], field: str, path: str | None = None):
+        """
+        Output the data to an xlsx file. The rows are written as they are read, so memory use
+        does not grow with the number of rows. Nothing is written if there is no data.
+
+        Args:
+            data (Iterable[dict]): The data to be outputted.
             field (str): The field to be displayed in the output.
+            path (str | None, optional): The path of the file. Defaults to None, which names it after the current date and time.
+        """
+        rows, fieldnames = _peek_fieldnames(data)
+        if fieldnames is None:
+            return
+
+        from meteorite_filter.dsv.xlsx import XlsxDictWriter
+        path = path if path is not None else _gen_filename('xlsx')
+        start = perf_counter()
+
+        with profiling.stage('write xlsx', _row_count(data)), XlsxDictWriter(path, fieldnames) as writer:
+            writer.writeheader()
+            writer.writerows(rows)
+
+        sheets = f' across {len(writer.sheets)} sheets' if len(writer.sheets) > 1 else ''
+        print(f'\nSaved {path}{sheets} in {perf_counter() - start:.2f} seconds.')
+
+
+class SummaryTerminalOutput(OutputInterface):
+    @staticmethod
+    def output(data: list[dict], field: str):
+        """
+        Output summary statistics to the terminal.
+
+        Args:
+            data (list[dict]): The summary rows, as returned by aggregate.summary_rows.
+            field (str): The grouping the statistics are for.
+        """
+        from meteorite_filter.aggregate import GROUPINGS, summary_table
+        print()
+        print(summary_table(data, GROUPINGS[field]['menu_desc']))
+
+
+class SummaryTextFileOutput(OutputInterface):
+    @staticmethod
+    def output(data: list[dict], field: str):
         """
-        path = _gen_filename('xls')
-        fieldnames = list(data[0].keys())
+        Output summary statistics to a text file. Nothing is written if there are no rows.
+
+        Args:
+            data (list[dict]): The summary rows, as returned by aggregate.summary_rows.
+            field (str): The grouping the statistics are for.
+        """
+        if not data:
+            print('\nThere are no summary rows, so no file was saved.')
+            return
+
+        from meteorite_filter.aggregate import write_summary
+        path = _gen_filename('txt')
+        start = perf_counter()
+        write_summary(data, path)
+        print(f'\nSaved {path} in {perf_counter() - start:.2f} seconds.')
+
+
+class _NumberedEntries(Sequence):
+    """
+    The table entries for displaying data in the terminal: each row's number, name, and
+    a field. Entries are created as they are accessed rather than copied up front.
+    """
+    def __init__(self, data: Sequence[dict], field: str) -> None:
+        self._data = data
+        self._field = field
+
+
+    def __len__(self) -> int:
+        return len(self._data)
 
-        writer = ExcelDictWriter(path, fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
-        writer.save()
+
+    def __getitem__(self, idx: int) -> tuple:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+
+        if idx < 0:
+            idx += len(self)
+
+        row = self._data[idx]
+        return (idx + 1, row['name'], row[self._field])
+
+
+    def __iter__(self) -> Iterator[tuple]:
+        field = self._field
+        return ((row_no, row['name'], row[field]) for row_no, row in enumerate(self._data, 1))
 
 
 def _gen_filename(ext: str) -> str:
@@ -85,3 +244,36 @@ def _gen_filename(ext: str) -> str:
         str: The generated filename.
     """
     return dt.now().strftime(f'%Y-%m-%d_%H_%M_%f.{ext}')
+
+
+def _peek_fieldnames(data: Iterable[dict]) -> tuple[Iterator[dict], list[str] | None]:
+    """
+    Get the fieldnames of the first row of some data without consuming it, so that
+    streamed rows can be written as well as lists.
+
+    Args:
+        data (Iterable[dict]): The data to be outputted.
+
+    Returns:
+        tuple[Iterator[dict], list[str] | None]: An iterator over all of the rows, and the
+            fieldnames of the first row, or None if there are no rows.
+    """
+    rows = iter(data)
+    first = next(rows, None)
+    if first is None:
+        return rows, None
+
+    return chain([first], rows), list(first.keys())
+
+
+def _row_count(data: Iterable[dict]) -> int | None:
+    """
+    Get the number of rows in some data without consuming it.
+
+    Args:
+        data (Iterable[dict]): The data to be outputted.
+
+    Returns:
+        int | None: The number of rows, or None if the data is streamed and its length is unknown.
+    """
+    return len(data) if isinstance(data, Sized) else None
@@ -0,0 +1,379 @@
+"""
+This module contains opt-in instrumentation, which records the wall time, number of rows,
+and peak memory of each stage of a session (such as parsing, filtering, rendering, and
+saving), and can profile every function call with cProfile.
+
+Instrumentation is off unless enable() is called, which the application does when run
+with --profile or --profile-output, or with the METEORITE_FILTER_PROFILE or
+METEORITE_FILTER_PROFILE_OUTPUT environment variables set. While it is off, stage()
+returns a shared context manager which does nothing, so instrumented code only pays for
+a function call. While it is on, memory is traced with tracemalloc, which slows down
+code that allocates many objects, so times are only comparable between profiled runs.
+
+Stages started inside another stage on the same thread are named after it, for example
+"query > filter". The peak memory of a stage is the largest amount traced while it ran,
+above the amount traced when it started. Memory is traced for the whole process, so the
+peaks of stages which run at the same time as background loading include its allocations.
+"""
+
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from time import perf_counter
+
+
+ENV_VAR = 'METEORITE_FILTER_PROFILE'
+OUTPUT_ENV_VAR = 'METEORITE_FILTER_PROFILE_OUTPUT'
+
+
+class StageRecord:
+    """
+    The measurements of one run of a stage.
+    """
+    __slots__ = ('name', 'seconds', 'rows', 'peak_memory')
+
+    def __init__(self, name: str, seconds: float, rows: int | None, peak_memory: int | None) -> None:
+        """
+        Initializes an instance of the StageRecord class.
+
+        Args:
+            name (str): The name of the stage, including the stages it ran inside.
+            seconds (float): The wall time the stage took, in seconds.
+            rows (int | None): The number of rows the stage produced or processed, or None if unknown.
+            peak_memory (int | None): The peak memory the stage used, in bytes, or None if memory was not traced.
+        """
+        self.name = name
+        self.seconds = seconds
+        self.rows = rows
+        self.peak_memory = peak_memory
+
+
+class Stage:
+    """
+    A context manager which measures a stage while instrumentation is enabled. The number of
+    rows can be set on it at any point before it exits, once it is known.
+    """
+    __slots__ = ('name', 'rows', '_session', '_parent', '_start', '_memory_start', '_peak')
+
+    def __init__(self, session: 'Session', name: str, rows: int | None = None) -> None:
+        """
+        Initializes an instance of the Stage class.
+
+        Args:
+            session (Session): The session to record the stage in.
+            name (str): The name of the stage.
+            rows (int | None, optional): The number of rows, if known up front. Defaults to None.
+        """
+        self.name = name
+        self.rows = rows
+        self._session = session
+        self._parent = None
+        self._start = 0.0
+        self._memory_start = 0
+        self._peak = 0
+
+
+    def __enter__(self) -> 'Stage':
+        stack = self._session.stack()
+
+        if stack:
+            self._parent = stack[-1]
+            self.name = f'{self._parent.name} > {self.name}'
+
+        if self._session.trace_memory:
+            import tracemalloc
+            current, peak = tracemalloc.get_traced_memory()
+
+            if self._parent is not None: # Keep the parent's peak so far, as it is about to be reset
+                self._parent._peak = max(self._parent._peak, peak)
+
+            self._memory_start = current
+            tracemalloc.reset_peak()
+
+        stack.append(self)
+        self._start = perf_counter()
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        seconds = perf_counter() - self._start
+        self._session.stack().pop()
+        peak_memory = None
+
+        if self._session.trace_memory:
+            import tracemalloc
+            self._peak = max(self._peak, tracemalloc.get_traced_memory()[1])
+            peak_memory = max(self._peak - self._memory_start, 0)
+
+            if self._parent is not None:
+                self._parent._peak = max(self._parent._peak, self._peak)
+
+        self._session.records.append(StageRecord(self.name, seconds, self.rows, peak_memory))
+
+
+class _NullStage:
+    """
+    A context manager which does nothing, used for every stage while instrumentation is disabled.
+    """
+    __slots__ = ()
+
+    name = ''
+
+    @property
+    def rows(self) -> None:
+        return None
+
+
+    @rows.setter
+    def rows(self, rows: int | None) -> None:
+        pass
+
+
+    def __enter__(self) -> '_NullStage':
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class Session:
+    """
+    The stages recorded, and the profiles collected, since instrumentation was enabled.
+    """
+    def __init__(self, profile_output: str | None = None, trace_memory: bool = True) -> None:
+        """
+        Initializes an instance of the Session class, starting any tracing and profiling.
+
+        Args:
+            profile_output (str | None, optional): The path to save cProfile statistics to when the
+                session finishes. Defaults to None, which does not run cProfile.
+            trace_memory (bool, optional): Whether to trace memory with tracemalloc. Defaults to True.
+        """
+        self.records: list[StageRecord] = []
+        self.profile_output = profile_output
+        self.trace_memory = trace_memory
+        self.profiles = []
+        self._local = threading.local()
+        self._start = perf_counter()
+
+        if trace_memory:
+            import tracemalloc
+            self._started_tracing = not tracemalloc.is_tracing()
+
+            if self._started_tracing:
+                tracemalloc.start()
+
+        if profile_output is not None:
+            import cProfile
+            self.profiles.append(cProfile.Profile())
+            self.profiles[0].enable()
+
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Get the time since the session started.
+
+        Returns:
+            float: The time in seconds.
+        """
+        return perf_counter() - self._start
+
+
+    def stack(self) -> list[Stage]:
+        """
+        Get the stages running on the current thread, outermost first.
+
+        Returns:
+            list[Stage]: The stages.
+        """
+        stack = getattr(self._local, 'stack', None)
+
+        if stack is None:
+            stack = self._local.stack = []
+
+        return stack
+
+
+    def stop(self) -> None:
+        """
+        Stops any tracing and profiling started by the session, and saves the cProfile statistics.
+        """
+        if self.trace_memory and self._started_tracing:
+            import tracemalloc
+            tracemalloc.stop()
+
+        if self.profiles:
+            import pstats
+            self.profiles[0].disable()
+            pstats.Stats(*self.profiles).dump_stats(self.profile_output)
+
+
+    def summary(self) -> str:
+        """
+        Get a summary of the session's stages, combining runs of the same stage.
+
+        Returns:
+            str: A table with, for each stage, the number of runs, their total rows and time, the slowest
+                run's time, and the largest peak memory, followed by where any cProfile statistics are saved.
+        """
+        from meteorite_filter.tui.table import TablePrinter
+
+        stages: dict[str, list[StageRecord]] = {}
+        for record in self.records:
+            stages.setdefault(record.name, []).append(record)
+
+        entries = []
+        for name, records in stages.items():
+            rows = [record.rows for record in records if record.rows is not None]
+            peaks = [record.peak_memory for record in records if record.peak_memory is not None]
+            entries.append((
+                name,
+                len(records),
+                sum(rows) if rows else '',
+                round(sum(record.seconds for record in records), 4),
+                round(max(record.seconds for record in records), 4),
+                round(max(peaks) / 1024 / 1024, 1) if peaks else ''
+            ))
+
+        summary = str(TablePrinter(('STAGE', 'RUNS', 'ROWS', 'TOTAL (s)', 'SLOWEST (s)', 'PEAK (MB)'), entries, f'Profile of {self.elapsed:.1f} second session'))
+
+        if self.profiles:
+            summary += f'\ncProfile statistics saved to {self.profile_output} (view them with "python -m pstats {self.profile_output}")\n'
+
+        return summary
+
+
+_session: Session | None = None
+
+
+def enable(profile_output: str | None = None, trace_memory: bool = True) -> Session:
+    """
+    Starts recording stages, replacing any session already in progress.
+
+    Args:
+        profile_output (str | None, optional): The path to save cProfile statistics to when the
+            session finishes. Defaults to None, which does not run cProfile.
+        trace_memory (bool, optional): Whether to trace memory with tracemalloc. Defaults to True.
+
+    Returns:
+        Session: The new session.
+    """
+    global _session
+
+    disable()
+    _session = Session(profile_output, trace_memory)
+    return _session
+
+
+def disable() -> Session | None:
+    """
+    Stops recording stages, saving any cProfile statistics.
+
+    Returns:
+        Session | None: The session which was in progress, or None if instrumentation was not enabled.
+    """
+    global _session
+
+    session, _session = _session, None
+
+    if session is not None:
+        session.stop()
+
+    return session
+
+
+def enabled() -> bool:
+    """
+    Check whether instrumentation is enabled.
+
+    Returns:
+        bool: True if stages are being recorded.
+    """
+    return _session is not None
+
+
+def env_enabled() -> bool:
+    """
+    Check whether the environment asks for instrumentation to be enabled.
+
+    Returns:
+        bool: True if METEORITE_FILTER_PROFILE is set to anything other than an empty string or 0.
+    """
+    return os.environ.get(ENV_VAR, '') not in ('', '0')
+
+
+def stage(name: str, rows: int | None = None) -> Stage | _NullStage:
+    """
+    Get a context manager which records a stage while instrumentation is enabled, for example:
+
+        with profiling.stage('filter') as filtering:
+            result = ...
+            filtering.rows = len(result)
+
+    Args:
+        name (str): The name of the stage.
+        rows (int | None, optional): The number of rows, if known up front. Defaults to None.
+
+    Returns:
+        Stage | _NullStage: The context manager. It does nothing if instrumentation is disabled.
+    """
+    if _session is None:
+        return _NULL_STAGE
+
+    return Stage(_session, name, rows)
+
+
+@contextmanager
+def profile_thread() -> Iterator[None]:
+    """
+    Runs cProfile on the current thread while the session in progress has cProfile enabled,
+    adding its statistics to the session's. cProfile only profiles the thread which enabled
+    it, so this should wrap the work of any background thread.
+
+    Returns:
+        Iterator[None]: The context manager.
+    """
+    session = _session
+    profile = None
+
+    if session is not None and session.profiles:
+        import cProfile
+        profile = cProfile.Profile()
+
+        try:
+            profile.enable()
+        except ValueError: # Another profiler is already active, as it is for every thread from Python 3.12
+            profile = None
+
+    try:
+        yield
+    finally:
+        if profile is not None:
+            profile.disable()
+            session.profiles.append(profile)
+
+
+def finish() -> None:
+    """
+    Prints a summary of the session in progress and stops recording, saving any cProfile statistics.
+    Does nothing if instrumentation is not enabled.
+    """
+    session = _session
+
+    if session is None:
+        return
+
+    try:
+        disable()
+    except OSError as error:
+        print(f'\nCould not save cProfile statistics to {session.profile_output}: {error.strerror}')
+        session.profiles.clear()
+
+    print()
+    print(session.summary(), end='')
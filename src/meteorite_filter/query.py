@@ -0,0 +1,330 @@
+"""
+This module contains queries over meteorite data beyond simple range filters.
+"""
+
+import heapq
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Sequence
+from math import ceil
+
+from meteorite_filter.index import SortedIndex
+from meteorite_filter.view import ResultView
+
+
+def top_k(data: Sequence[dict], field: str, k: int, largest: bool = True, index: SortedIndex | None = None) -> ResultView:
+    """
+    Finds the k rows with the largest (or smallest) values of a field, ignoring rows where it is None.
+
+    Uses partial selection with a heap in O(n log k), or O(k) with a prebuilt index.
+
+    Args:
+        data (Sequence[dict]): The rows to search.
+        field (str): The field to rank by.
+        k (int): The number of rows to find.
+        largest (bool, optional): Whether to find the largest values rather than the smallest. Defaults to True.
+        index (SortedIndex | None, optional): A prebuilt index of the data on the field. Defaults to None.
+
+    Raises:
+        ValueError: If k is negative.
+
+    Returns:
+        ResultView: A view of up to k rows, ordered by field and name: descending if largest is True, otherwise ascending.
+    """
+    if k < 0:
+        raise ValueError
+
+    if index is not None and index.field == field:
+        return index.tail(k) if largest else index.head(k)
+
+    positions = (pos for pos, row in enumerate(data) if row[field] is not None)
+    key = lambda pos, f=field: (data[pos][f], data[pos]['name'])
+    return ResultView(data, heapq.nlargest(k, positions, key=key) if largest else heapq.nsmallest(k, positions, key=key))
+
+
+def top_percent(data: Sequence[dict], field: str, percent: float, largest: bool = True, index: SortedIndex | None = None) -> ResultView:
+    """
+    Finds the given percentage of rows with the largest (or smallest) values of a field, ignoring rows
+    where it is None. For example, the oldest 1% of falls.
+
+    Args:
+        data (Sequence[dict]): The rows to search.
+        field (str): The field to rank by.
+        percent (float): The percentage of rows to find, greater than 0 and at most 100. The row count
+            is rounded up, so any non-empty data returns at least one row.
+        largest (bool, optional): Whether to find the largest values rather than the smallest. Defaults to True.
+        index (SortedIndex | None, optional): A prebuilt index of the data on the field. Defaults to None.
+
+    Raises:
+        ValueError: If the percentage is out of range.
+
+    Returns:
+        ResultView: A view of the rows, ordered by field and name: descending if largest is True, otherwise ascending.
+    """
+    if not 0 < percent <= 100:
+        raise ValueError
+
+    if index is not None and index.field == field:
+        count = len(index)
+    else:
+        count = sum(1 for row in data if row[field] is not None)
+
+    return top_k(data, field, ceil(count * percent / 100), largest, index)
+
+
+class Predicate(ABC):
+    """
+    A condition on a single field of a row. Rows where the field is None never match.
+    """
+    def __init__(self, field: str) -> None:
+        """
+        Initializes an instance of the Predicate class.
+
+        Args:
+            field (str): The field the condition is on.
+        """
+        self._field = field
+
+
+    @property
+    def field(self) -> str:
+        """
+        Get the field the condition is on.
+
+        Returns:
+            str: The field.
+        """
+        return self._field
+
+
+    @abstractmethod
+    def _key(self) -> tuple:
+        """
+        Get the values identifying the condition.
+
+        Returns:
+            tuple: The condition's type, field, and parameters.
+        """
+
+
+    @abstractmethod
+    def __call__(self, row: dict) -> bool:
+        """
+        Check whether a row meets the condition.
+
+        Args:
+            row (dict): The row.
+
+        Returns:
+            bool: True if the row meets the condition.
+        """
+
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Predicate) and self._key() == other._key()
+
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+
+class RangePredicate(Predicate):
+    """
+    A condition that a field falls within an inclusive range.
+    """
+    def __init__(self, field: str, min_val=float('-inf'), max_val=float('inf')) -> None:
+        """
+        Initializes an instance of the RangePredicate class.
+
+        Args:
+            field (str): The field the condition is on.
+            min_val (float, optional): The minimum value (inclusive). Defaults to negative infinity.
+            max_val (float, optional): The maximum value (inclusive). Defaults to positive infinity.
+        """
+        super().__init__(field)
+        self.min_val = min_val
+        self.max_val = max_val
+
+
+    def _key(self) -> tuple:
+        return (RangePredicate, self.field, self.min_val, self.max_val)
+
+
+    def __call__(self, row: dict) -> bool:
+        return (val := row[self.field]) is not None and self.min_val <= val <= self.max_val
+
+
+    def __str__(self) -> str:
+        if self.min_val == float('-inf'):
+            return f'{self.field} <= {self.max_val}'
+
+        if self.max_val == float('inf'):
+            return f'{self.field} >= {self.min_val}'
+
+        return f'{self.min_val} <= {self.field} <= {self.max_val}'
+
+
+class EqualsPredicate(Predicate):
+    """
+    A condition that a field is equal to a value.
+    """
+    def __init__(self, field: str, value) -> None:
+        """
+        Initializes an instance of the EqualsPredicate class.
+
+        Args:
+            field (str): The field the condition is on.
+            value: The value the field must equal.
+        """
+        super().__init__(field)
+        self.value = value
+
+
+    def _key(self) -> tuple:
+        return (EqualsPredicate, self.field, self.value)
+
+
+    def __call__(self, row: dict) -> bool:
+        return row[self.field] == self.value
+
+
+    def __str__(self) -> str:
+        return f'{self.field} = {self.value}'
+
+
+class QueryPlan:
+    """
+    The order a compound query's conditions are checked in.
+
+    If the plan has a driver, the rows meeting it are found with its field's index and
+    only those rows are checked against the remaining filters. Otherwise, every row is
+    scanned and checked against the filters, most selective first.
+    """
+    def __init__(self, driver: RangePredicate | None, filters: list[Predicate], estimate: int) -> None:
+        """
+        Initializes an instance of the QueryPlan class.
+
+        Args:
+            driver (RangePredicate | None): The condition used to find candidate rows with an index, if any.
+            filters (list[Predicate]): The conditions checked on each candidate row, in order.
+            estimate (int): The estimated number of candidate rows.
+        """
+        self.driver = driver
+        self.filters = filters
+        self.estimate = estimate
+
+
+    def __str__(self) -> str:
+        source = f'index range {self.driver}' if self.driver is not None else 'scan'
+        return f'{source} (~{self.estimate} rows)' + ''.join(f', then check {predicate}' for predicate in self.filters)
+
+
+class QueryPlanner:
+    """
+    Plans and runs compound queries on a dataset, using statistics about its columns to
+    check the most selective conditions first.
+
+    Range conditions on indexed fields are counted exactly by their index. Equality
+    conditions are estimated from the frequencies of each of the field's values, which
+    are counted the first time they are needed. Other range conditions are estimated by
+    checking a sample of evenly spaced rows.
+    """
+    SAMPLE_SIZE = 1000
+
+    def __init__(self, data: Sequence[dict], indexes: dict[str, SortedIndex] | None = None) -> None:
+        """
+        Initializes an instance of the QueryPlanner class.
+
+        Args:
+            data (Sequence[dict]): The rows to query.
+            indexes (dict[str, SortedIndex] | None, optional): Prebuilt indexes of the data, by field. Defaults to None.
+        """
+        self._data = data
+        self._indexes = indexes or {}
+        self._value_counts: dict[str, Counter] = {}
+
+
+    def estimate(self, predicate: Predicate) -> int:
+        """
+        Estimates the number of rows meeting a condition.
+
+        Args:
+            predicate (Predicate): The condition.
+
+        Returns:
+            int: The estimated number of matching rows.
+        """
+        if isinstance(predicate, RangePredicate) and (index := self._indexes.get(predicate.field)) is not None:
+            return index.count(predicate.min_val, predicate.max_val)
+
+        if isinstance(predicate, EqualsPredicate):
+            if predicate.field not in self._value_counts:
+                self._value_counts[predicate.field] = Counter(row[predicate.field] for row in self._data)
+
+            return self._value_counts[predicate.field][predicate.value]
+
+        step = max(len(self._data) // self.SAMPLE_SIZE, 1)
+        sample = range(0, len(self._data), step)
+        return round(sum(1 for pos in sample if predicate(self._data[pos])) * len(self._data) / len(sample)) if sample else 0
+
+
+    def plan(self, predicates: list[Predicate]) -> QueryPlan:
+        """
+        Chooses the order to check a compound query's conditions in.
+
+        Args:
+            predicates (list[Predicate]): The conditions, which must all be met.
+
+        Returns:
+            QueryPlan: The plan for the query.
+        """
+        estimates = {predicate: self.estimate(predicate) for predicate in predicates}
+        ordered = sorted(estimates, key=estimates.get)
+        indexed = [predicate for predicate in ordered if isinstance(predicate, RangePredicate) and predicate.field in self._indexes]
+
+        # An index range costs a binary search plus its matches, a scan costs every row
+        if indexed and estimates[indexed[0]] < len(self._data):
+            driver = indexed[0]
+            return QueryPlan(driver, [predicate for predicate in ordered if predicate is not driver], estimates[driver])
+
+        return QueryPlan(None, ordered, len(self._data))
+
+
+    def run(self, predicates: list[Predicate], order_by: str | None = None) -> ResultView:
+        """
+        Finds the rows meeting every condition of a compound query.
+
+        Args:
+            predicates (list[Predicate]): The conditions, which must all be met. There must be at least one.
+            order_by (str | None, optional): The field to order the rows by, then by name. Defaults to
+                the field of the first condition.
+
+        Raises:
+            ValueError: If there are no conditions.
+
+        Returns:
+            ResultView: A view of the matching rows, ordered by order_by and name.
+        """
+        if not predicates:
+            raise ValueError
+
+        order_by = predicates[0].field if order_by is None else order_by
+        plan = self.plan(predicates)
+
+        data = self._data
+
+        if plan.driver is not None:
+            candidates = self._indexes[plan.driver.field].range(plan.driver.min_val, plan.driver.max_val).positions
+        else:
+            candidates = range(len(data))
+
+        positions = []
+        for pos in candidates:
+            row = data[pos]
+            if all(predicate(row) for predicate in plan.filters):
+                positions.append(pos)
+
+        if plan.driver is None or plan.driver.field != order_by: # Otherwise already ordered by the index
+            positions.sort(key=lambda pos, k=order_by: (data[pos][k] is None, data[pos][k], data[pos]['name']))
+
+        return ResultView(data, positions)
@@ -0,0 +1,171 @@
+"""
+This module contains a least recently used (LRU) cache for query results.
+"""
+
+import sys
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+
+
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class ResultCache:
+    """
+    A bounded cache of query results over a dataset, such as the rows matching a filter.
+
+    Results are evicted least recently used first once there are more than a maximum
+    number of entries or their estimated size exceeds a memory budget. The dataset is
+    assumed to only ever grow (as MeteoriteTable does), so every result is discarded
+    whenever its length changes.
+    """
+    def __init__(self, data: Sequence[dict], max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """
+        Initializes an instance of the ResultCache class.
+
+        Args:
+            data (Sequence[dict]): The dataset the cached results are computed from.
+            max_entries (int, optional): The maximum number of results to keep. Defaults to DEFAULT_MAX_ENTRIES (32).
+            max_bytes (int, optional): The approximate number of bytes of results to keep.
+                Defaults to DEFAULT_MAX_BYTES (64 MiB).
+
+        Raises:
+            ValueError: If the maximum number of entries or bytes is not positive.
+        """
+        if max_entries <= 0 or max_bytes <= 0:
+            raise ValueError
+
+        self._data = data
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Sequence[dict], int]] = OrderedDict()
+        self._nbytes = 0
+        self._data_len = len(data)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Get the estimated size of the cached results.
+
+        Returns:
+            int: The approximate size of the cached results in bytes.
+        """
+        return self._nbytes
+
+
+    def __len__(self) -> int:
+        """
+        Get the number of cached results.
+
+        Returns:
+            int: The number of cached results.
+        """
+        return len(self._entries)
+
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Check whether a result is cached, without counting a hit or miss.
+
+        Args:
+            key (Hashable): The query's key.
+
+        Returns:
+            bool: True if the result is cached and up to date.
+        """
+        self._check_data()
+        return key in self._entries
+
+
+    def get_or_compute(self, key: Hashable, query: Callable[[], Sequence[dict]]) -> Sequence[dict]:
+        """
+        Get the cached result of a query, running the query and caching its result if needed.
+
+        Args:
+            key (Hashable): A key identifying the query, such as its field and limits.
+            query (Callable[[], Sequence[dict]]): A function which runs the query.
+
+        Returns:
+            Sequence[dict]: The query's result. It is shared with the cache, so must not be modified.
+        """
+        self._check_data()
+
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key][0]
+
+        self.misses += 1
+        result = query()
+        size = _result_size(result)
+
+        if size <= self._max_bytes:
+            self._entries[key] = (result, size)
+            self._nbytes += size
+            self._evict()
+
+        return result
+
+
+    def clear(self) -> None:
+        """
+        Discard every cached result. The hit and miss counters are kept.
+        """
+        self._entries.clear()
+        self._nbytes = 0
+
+
+    def __str__(self) -> str:
+        """
+        Get a summary of the cache's statistics.
+
+        Returns:
+            str: The number of hits, misses, and evictions, and the cache's size.
+        """
+        lookups = self.hits + self.misses
+        hit_rate = f' ({self.hits / lookups:.0%} hit rate)' if lookups else ''
+        return (f'Result cache: {self.hits} hits, {self.misses} misses{hit_rate}, {self.evictions} evictions, '
+                f'{len(self)} of {self._max_entries} entries using {self._nbytes / 1024 / 1024:.1f} of {self._max_bytes / 1024 / 1024:.1f} MB')
+
+
+    def _check_data(self) -> None:
+        """
+        Discard every cached result if the dataset has changed since they were computed.
+        """
+        if len(self._data) != self._data_len:
+            self._data_len = len(self._data)
+            self.clear()
+
+
+    def _evict(self) -> None:
+        """
+        Discard least recently used results until the cache is within its limits.
+        """
+        while len(self._entries) > self._max_entries or self._nbytes > self._max_bytes:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._nbytes -= size
+            self.evictions += 1
+
+
+def _result_size(result: Sequence[dict]) -> int:
+    """
+    Estimates the memory used by a query result. For a list, every row is assumed to be the same size.
+
+    Row values are not counted, since they are shared with the dataset, and neither are the
+    rows of a ResultView, since they are only created as they are accessed.
+
+    Args:
+        result (Sequence[dict]): The result.
+
+    Returns:
+        int: The approximate size of the result in bytes.
+    """
+    if not isinstance(result, list):
+        return sys.getsizeof(result)
+
+    return sys.getsizeof(result) + (len(result) * sys.getsizeof(result[0]) if result else 0)
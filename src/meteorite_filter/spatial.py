@@ -0,0 +1,190 @@
+"""
+This module contains a spatial index for answering location queries on reclat and reclong.
+"""
+
+from collections.abc import Sequence
+from math import asin, cos, degrees, floor, radians, sin, sqrt
+
+from meteorite_filter.view import ResultView
+
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+class GridIndex:
+    """
+    A grid of cells covering the globe, each holding the positions of the rows located in it.
+
+    Queries only check the rows in the cells overlapping the queried area, rather than
+    every row. Rows without a location are left out of the index, as are rows at
+    (0.0, 0.0) by default, since the dataset uses it as a placeholder for unknown locations.
+    """
+    def __init__(self, data: Sequence[dict], cell_size: float = 1.0, include_placeholders: bool = False, lat_field: str = 'reclat', lon_field: str = 'reclong') -> None:
+        """
+        Initializes an instance of the GridIndex class.
+
+        Args:
+            data (Sequence[dict]): The rows to index. The index keeps a reference to them.
+            cell_size (float, optional): The height and width of each cell in degrees. Defaults to 1.0.
+            include_placeholders (bool, optional): Whether to index rows at (0.0, 0.0). Defaults to False.
+            lat_field (str, optional): The latitude field. Defaults to 'reclat'.
+            lon_field (str, optional): The longitude field. Defaults to 'reclong'.
+
+        Raises:
+            ValueError: If the cell size is not positive.
+        """
+        if cell_size <= 0:
+            raise ValueError
+
+        self._data = data
+        self._cell_size = cell_size
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        self._coords: dict[int, tuple[float, float]] = {}
+
+        for pos, row in enumerate(data):
+            lat, lon = row[lat_field], row[lon_field]
+
+            if lat is None or lon is None or (lat == 0 and lon == 0 and not include_placeholders):
+                continue
+
+            self._coords[pos] = (lat, lon)
+            self._cells.setdefault(self._cell(lat, lon), []).append(pos)
+
+
+    def __len__(self) -> int:
+        """
+        Get the number of indexed rows.
+
+        Returns:
+            int: The number of rows with a location.
+        """
+        return len(self._coords)
+
+
+    def bbox(self, min_lat: float, max_lat: float, min_lon: float, max_lon: float) -> ResultView:
+        """
+        Finds the rows located within a latitude and longitude box.
+
+        Args:
+            min_lat (float): The southern edge of the box (inclusive).
+            max_lat (float): The northern edge of the box (inclusive).
+            min_lon (float): The western edge of the box (inclusive).
+            max_lon (float): The eastern edge of the box (inclusive). If it is less than min_lon,
+                the box crosses the 180th meridian.
+
+        Returns:
+            ResultView: A view of the matching rows, ordered by latitude, longitude, and name.
+        """
+        min_lon, max_lon = _wrap(min_lon), _wrap(max_lon)
+        crosses = min_lon > max_lon
+        lon_ranges = [(min_lon, 180), (-180, max_lon)] if crosses else [(min_lon, max_lon)]
+
+        matches = []
+        for west, east in lon_ranges:
+            for pos in self._candidates(min_lat, max_lat, west, east):
+                lat, lon = self._coords[pos]
+                if min_lat <= lat <= max_lat and west <= _wrap(lon) <= east:
+                    matches.append(pos)
+
+        matches.sort(key=lambda pos: (*self._coords[pos], self._data[pos]['name']))
+        return ResultView(self._data, matches)
+
+
+    def within(self, lat: float, lon: float, radius_km: float) -> ResultView:
+        """
+        Finds the rows located within a great-circle distance of a point.
+
+        Args:
+            lat (float): The point's latitude.
+            lon (float): The point's longitude.
+            radius_km (float): The distance from the point in kilometres (inclusive).
+
+        Returns:
+            ResultView: A view of the matching rows, ordered by distance from the point, then by name.
+        """
+        if radius_km < 0:
+            return ResultView(self._data, [])
+
+        angle = radius_km / EARTH_RADIUS_KM
+        min_lat, max_lat = lat - degrees(angle), lat + degrees(angle)
+
+        if min_lat <= -90 or max_lat >= 90 or angle >= radians(90):
+            candidates = self._candidates(max(min_lat, -90), min(max_lat, 90), -180, 180) # The circle reaches a pole, so every longitude is covered
+        else:
+            delta_lon = degrees(asin(min(sin(angle) / cos(radians(lat)), 1)))
+            west, east = _wrap(lon - delta_lon), _wrap(lon + delta_lon)
+            lon_ranges = [(west, 180), (-180, east)] if west > east else [(west, east)]
+            candidates = [pos for west, east in lon_ranges for pos in self._candidates(min_lat, max_lat, west, east)]
+
+        distances = {pos: distance for pos in candidates if (distance := haversine(lat, lon, *self._coords[pos])) <= radius_km}
+        return ResultView(self._data, sorted(distances, key=lambda pos: (distances[pos], self._data[pos]['name'])))
+
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        """
+        Get the cell containing a location.
+
+        Args:
+            lat (float): The latitude.
+            lon (float): The longitude.
+
+        Returns:
+            tuple[int, int]: The cell's row and column.
+        """
+        return (floor(lat / self._cell_size), floor(_wrap(lon) / self._cell_size))
+
+
+    def _candidates(self, min_lat: float, max_lat: float, min_lon: float, max_lon: float) -> list[int]:
+        """
+        Get the positions of the rows in the cells overlapping a box which does not cross the 180th meridian.
+
+        Args:
+            min_lat (float): The southern edge of the box.
+            max_lat (float): The northern edge of the box.
+            min_lon (float): The western edge of the box.
+            max_lon (float): The eastern edge of the box.
+
+        Returns:
+            list[int]: The row positions. Each row appears at most once.
+        """
+        if min_lat > max_lat or min_lon > max_lon:
+            return []
+
+        south, west = self._cell(max(min_lat, -90), min_lon)
+        north, east = self._cell(min(max_lat, 90), max_lon)
+
+        if (north - south + 1) * (east - west + 1) > len(self._cells): # Cheaper to check every occupied cell
+            return [pos for (row, col), cell in self._cells.items() if south <= row <= north and west <= col <= east for pos in cell]
+
+        return [pos for row in range(south, north + 1) for col in range(west, east + 1) for pos in self._cells.get((row, col), ())]
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Calculates the great-circle distance between two points.
+
+    Args:
+        lat1 (float): The first point's latitude.
+        lon1 (float): The first point's longitude.
+        lat2 (float): The second point's latitude.
+        lon2 (float): The second point's longitude.
+
+    Returns:
+        float: The distance in kilometres.
+    """
+    lat1, lon1, lat2, lon2 = map(radians, (lat1, lon1, lat2, lon2))
+    a = sin((lat2 - lat1) / 2) ** 2 + cos(lat1) * cos(lat2) * sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * asin(min(sqrt(a), 1))
+
+
+def _wrap(lon: float) -> float:
+    """
+    Wraps a longitude into the range -180 to 180.
+
+    Args:
+        lon (float): The longitude.
+
+    Returns:
+        float: The equivalent longitude from -180 to 180. 180 is kept as is.
+    """
+    return lon if -180 <= lon <= 180 else (lon + 180) % 360 - 180
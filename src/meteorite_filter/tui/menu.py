@@ -166,18 +166,26 @@ class Menu:
     def __call__(self):
         """
         Display the menu and handle user input.
+
+        The menu is shown again after an invalid selection, and after a selected item which
+        returns to the menu, until an item which does not return is selected or the user
+        goes back. This runs in a loop, so the stack does not grow however many selections
+        are made.
         """
-        print(self, end='')
-        selection = self._get_user_selection()
-        if selection is None: return
+        while True:
+            print(self, end='')
+            selection = self._get_user_selection()
+            if selection is None: return
+
+            try:
+                menu_key = list(self.items.keys())[self._default] if selection == '' and self._default is not None else selection
+                if menu_key not in self.items.keys(): raise ValueError
+            except (ValueError, IndexError):
+                throw_error('Invalid option. Please enter the number or letter of your selection.')
+                continue
 
-        try:
-            menu_key = list(self.items.keys())[self._default] if selection == '' and self._default is not None else selection
-            if menu_key not in self.items.keys(): raise ValueError
-            self._run_selection(self.items[menu_key])
-        except (ValueError, IndexError):
-            throw_error('Invalid option. Please enter the number or letter of your selection.')
-            self()
+            if not self._run_selection(self.items[menu_key]):
+                return
 
     def _get_user_selection(self) -> str | None:
         """
@@ -196,21 +204,24 @@ class Menu:
         
         return selection
 
-    def _run_selection(self, menu_item: MenuItem):
+    def _run_selection(self, menu_item: MenuItem) -> bool:
         """
         Run the selected menu item.
 
         Args:
             menu_item (MenuItem): The selected menu item.
+
+        Returns:
+            bool: True if the menu should be shown again afterwards.
         """
+        print()
+        menu_item()
+
         if isinstance(menu_item, ReturnableMenuItem) and menu_item.go_back:
             print()
-            menu_item()
-            print()
-            self()
-        else:
-            print()
-            menu_item()
+            return True
+
+        return False
 
 
 class ReturnableMenuItem(MenuItem):
@@ -0,0 +1,167 @@
+"""
+This module contains an interactive pager for viewing large tables in the terminal.
+"""
+
+import shutil
+
+from meteorite_filter.tui.table import TablePrinter
+from meteorite_filter.tui.utils import *
+
+
+class Pager:
+    """
+    Displays a table one page at a time, with navigation between pages.
+
+    Only the visible page of the table is formatted, so the first page is shown straight
+    away however many entries the table has. Column widths are fitted to an evenly spaced
+    sample of the entries up front, then widened as pages with longer values are shown.
+    """
+    SAMPLE_SIZE = 1000
+
+    def __init__(self, table: TablePrinter, page_size: int | None = None) -> None:
+        """
+        Initializes an instance of the Pager class.
+
+        Args:
+            table (TablePrinter): The table to display. Its entries must support slicing.
+            page_size (int | None, optional): The number of entries on each page. Defaults to None,
+                which fits a page to the height of the terminal.
+
+        Raises:
+            ValueError: If the page size is not positive.
+        """
+        if page_size is not None and page_size <= 0:
+            raise ValueError
+
+        self._table = table
+        self._page_size = page_size if page_size is not None else default_page_size()
+        self._start = 0
+
+        step = max(len(table) // self.SAMPLE_SIZE, 1)
+        table.fit(table.entries[pos] for pos in range(0, len(table), step))
+
+
+    @property
+    def page_size(self) -> int:
+        """
+        Get the number of entries on each page.
+
+        Returns:
+            int: The page size.
+        """
+        return self._page_size
+
+
+    @property
+    def start(self) -> int:
+        """
+        Get the index of the first entry on the current page.
+
+        Returns:
+            int: The index of the first entry.
+        """
+        return self._start
+
+
+    @property
+    def page_count(self) -> int:
+        """
+        Get the number of pages.
+
+        Returns:
+            int: The number of pages. An empty table has one empty page.
+        """
+        return max(-(-len(self._table) // self._page_size), 1)
+
+
+    def render(self) -> str:
+        """
+        Get the current page of the table and a status line.
+
+        Returns:
+            str: The current page.
+        """
+        stop = min(self._start + self._page_size, len(self._table))
+        status = f'Rows {self._start + 1}-{stop} of {len(self._table)} (page {self._start // self._page_size + 1} of {self.page_count})'
+        return self._table.page(self._start, stop) + term_format(status, TERM_FAINT) + '\n'
+
+
+    def next(self) -> bool:
+        """
+        Move to the next page.
+
+        Returns:
+            bool: False if the current page is the last page.
+        """
+        if self._start + self._page_size >= len(self._table):
+            return False
+
+        self._start += self._page_size
+        return True
+
+
+    def prev(self) -> bool:
+        """
+        Move to the previous page.
+
+        Returns:
+            bool: False if the current page is the first page.
+        """
+        if self._start == 0:
+            return False
+
+        self._start -= self._page_size
+        return True
+
+
+    def jump(self, row: int) -> None:
+        """
+        Move to the page containing a row.
+
+        Args:
+            row (int): The row's number, starting from 1.
+
+        Raises:
+            ValueError: If there is no row with the number.
+        """
+        if not 1 <= row <= len(self._table):
+            raise ValueError
+
+        self._start = (row - 1) // self._page_size * self._page_size
+
+
+    def __call__(self) -> None:
+        """
+        Display the table, reading navigation commands until the user returns to the previous menu.
+        """
+        while True:
+            print()
+            print(self.render(), end='')
+            print(term_format('Press enter or type "n" for the next page, "p" for the previous page, a row number to jump to it, or "b" to go back', TERM_FG_CYAN))
+            command = finput('> ', TERM_FG_GREEN).strip().lower()
+
+            if command in ('q', '?q', '>q'):
+                quit_app()
+
+            if command in ('b', '?b', '>b'):
+                return
+
+            if command in ('', 'n'):
+                if not self.next():
+                    return # Moving past the last page finishes viewing
+            elif command == 'p':
+                self.prev()
+            elif command.isdecimal() and 1 <= int(command) <= len(self._table):
+                self.jump(int(command))
+            else:
+                throw_error(f'Invalid option. Please enter "n", "p", "b", or a row number from 1 to {len(self._table)}.')
+
+
+def default_page_size() -> int:
+    """
+    Get the number of table entries which fit on the terminal, leaving room for the header and prompt.
+
+    Returns:
+        int: The page size, at least 5.
+    """
+    return max(shutil.get_terminal_size().lines - 7, 5)
@@ -2,6 +2,9 @@
 This module contains a table pretty printer.
 """
 
+from collections.abc import Iterable, Sequence
+
+
 class TablePrinter:
     """
     Pretty print a table of data to the terminal.
@@ -11,13 +14,14 @@ class TablePrinter:
     values to the right and non-numeric values to the left.
     """
 
-    def __init__(self, header: tuple[str, ...], entries: list[tuple], title: str | None = None, colMargin: int = 4):
+    def __init__(self, header: tuple[str, ...], entries: Sequence[tuple], title: str | None = None, colMargin: int = 4):
         """
         Initialize a TablePrinter object.
 
         Args:
             header (tuple[str, ...]): The header of the table.
-            entries (list[tuple]): The entries of the table.
+            entries (Sequence[tuple]): The entries of the table. They are iterated over each time
+                the table is printed, so may be created lazily.
             title (str | None, optional): The title of the table. Defaults to None.
             colMargin (int, optional): The margin size between columns. Defaults to 4.
         """
@@ -29,6 +33,27 @@ class TablePrinter:
         self._colMargin = colMargin
 
 
+    @property
+    def entries(self) -> Sequence[tuple]:
+        """
+        Returns the entries of the table.
+
+        Returns:
+            Sequence[tuple]: The entries.
+        """
+        return self._entries
+
+
+    def __len__(self) -> int:
+        """
+        Returns the number of entries in the table.
+
+        Returns:
+            int: The number of entries.
+        """
+        return len(self._entries)
+
+
     def __str__(self):
         """
         Returns a string representation of the table.
@@ -41,26 +66,60 @@ class TablePrinter:
         Returns:
             str: The string representation of the table.
         """
-        self._calcColumnSize()
+        self._calcColumnSize(self._entries)
+        return self._headerStr() + ''.join([self._formatRow(entry) + '\n' for entry in self._entries])
+
+
+    def page(self, start: int, stop: int) -> str:
+        """
+        Returns a string representation of the title, header, and a range of the entries.
+
+        Only the entries in the range are formatted, and the columns are widened to fit
+        them, so the cost does not depend on the size of the table. Columns never shrink,
+        so use fit() with a sample of the entries first to keep their widths stable
+        between pages.
+
+        Args:
+            start (int): The index of the first entry to include.
+            stop (int): The index after the last entry to include.
+
+        Returns:
+            str: The string representation of the range of the table.
+        """
+        entries = self._entries[start:stop]
+        self._calcColumnSize(entries)
+        return self._headerStr() + ''.join([self._formatRow(entry) + '\n' for entry in entries])
+
+
+    def fit(self, entries: Iterable[tuple]) -> None:
+        """
+        Widens the columns to fit some entries, such as a sample of the table's entries.
+
+        Args:
+            entries (Iterable[tuple]): The entries.
+
+        Raises:
+            ValueError: If the length of an entry does not match the length of the header.
+        """
+        self._calcColumnSize(entries)
+
+
+    def _headerStr(self) -> str:
+        """Format the title, header, and divider with the current column sizes."""
+
         divider = ('=' * self._colMargin).join(['=' * size for size in self._colSize])
-        
+
         str_repr = ''
         if self.title is not None:
             str_repr += f"{self.title:^{len(divider)}}\n" # Print centered title
 
-        str_repr += self._formatRow(self._header) + '\n'
-        str_repr += divider + '\n'
-        
-        for entry in self._entries:
-            str_repr += self._formatRow(entry) + '\n'
-
-        return str_repr
+        return str_repr + self._formatRow(self._header) + '\n' + divider + '\n'
 
 
-    def _calcColumnSize(self):
+    def _calcColumnSize(self, entries: Iterable[tuple]):
         """Iterates over entries, updating column size if a value is longer than the current size."""
 
-        for entry in self._entries:
+        for entry in entries:
             # Ensure entry length matches header length
             if len(entry) != self._headerLen:
                 raise ValueError("Entry length does not match header length.")
@@ -2,6 +2,8 @@
 This module contains constants and utility functions for formatting terminal text.
 """
 
+from meteorite_filter import profiling
+
 TERM_RESET = '\u001b[0m'
 
 TERM_BOLD = ('\u001b[1m', '\u001b[22m')
@@ -110,7 +112,10 @@ def quit_app():
     """
     Quit the application.
 
-    This function prints a goodbye message and raises a SystemExit exception to terminate the program.
+    This function prints a summary of the session's stages if instrumentation is enabled (see
+    the profiling module), then prints a goodbye message and raises a SystemExit exception to
+    terminate the program.
     """
+    profiling.finish()
     print('\nQuitting application... Goodbye!')
     raise SystemExit(0)
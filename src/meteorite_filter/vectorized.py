@@ -0,0 +1,126 @@
+"""
+This module contains NumPy implementations of filtering and ordering a MeteoriteTable.
+
+NumPy is optional. If it is not installed, HAS_NUMPY is False and callers fall back to
+their pure Python implementations. NumPy is only imported the first time it is used,
+since importing it takes longer than starting the rest of the application. The numeric
+columns of a MeteoriteTable are viewed as NumPy arrays without copying, ranges are
+matched with boolean masks, and matches are ordered with a stable lexsort on (field,
+name), so the results are exactly the same rows in the same order as the pure Python
+implementations.
+"""
+
+from importlib.util import find_spec
+
+from meteorite_filter.dsv.columnar import MeteoriteTable
+from meteorite_filter.view import ResultView
+
+
+HAS_NUMPY = find_spec('numpy') is not None
+
+np = None
+
+
+def _numpy():
+    """
+    Imports NumPy on first use.
+
+    Returns:
+        module: The numpy module.
+    """
+    global np
+
+    if np is None:
+        import numpy
+        np = numpy
+
+    return np
+
+
+def supports(data, field: str) -> bool:
+    """
+    Check whether data can be filtered on a field with NumPy.
+
+    Args:
+        data: The data to filter.
+        field (str): The field to filter on.
+
+    Returns:
+        bool: True if NumPy is installed, the data is a MeteoriteTable, and the field is numeric.
+    """
+    return HAS_NUMPY and isinstance(data, MeteoriteTable) and field in data.buffers()[1]
+
+
+def filter_table(table: MeteoriteTable, field: str, min_val=float('-inf'), max_val=float('inf')) -> ResultView:
+    """
+    Filters a table based on the specified numeric field and value range.
+
+    Args:
+        table (MeteoriteTable): The table to filter.
+        field (str): The numeric field to filter on.
+        min_val (float, optional): The minimum value for the field. Defaults to negative infinity.
+        max_val (float, optional): The maximum value for the field. Defaults to positive infinity.
+
+    Returns:
+        ResultView: A view of the matching rows, ordered by field and name.
+    """
+    np = _numpy()
+    values, known = _column(table, field)
+    positions = np.flatnonzero(known & (values >= min_val) & (values <= max_val))
+    return ResultView(table, memoryview(_ordered(table, positions, values[positions]).astype(np.int64)))
+
+
+def sorted_positions(table: MeteoriteTable, field: str) -> tuple[list[int], list]:
+    """
+    Orders the rows of a table where a numeric field is not None by field and name.
+
+    Args:
+        table (MeteoriteTable): The table.
+        field (str): The numeric field to order by.
+
+    Returns:
+        tuple[list[int], list]: The ordered row positions, and the field's value for each of them.
+    """
+    np = _numpy()
+    values, known = _column(table, field)
+    positions = _ordered(table, np.flatnonzero(known), values[known])
+    return positions.tolist(), values[positions].tolist()
+
+
+def _column(table: MeteoriteTable, field: str) -> tuple['np.ndarray', 'np.ndarray']:
+    """
+    Views a numeric column of a table as a NumPy array.
+
+    Args:
+        table (MeteoriteTable): The table.
+        field (str): The numeric field.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The column's values (nulls are stored as 0), and a mask which
+            is True where the value is not None.
+    """
+    np = _numpy()
+    columns, nulls = table.buffers()
+    column = columns[field]
+    length = len(table)
+
+    values = np.frombuffer(column, dtype=column.typecode, count=length) if length else np.empty(0, dtype=column.typecode)
+    known = ~np.unpackbits(np.frombuffer(nulls[field], dtype=np.uint8), count=length, bitorder='little').astype(bool)
+    return values, known
+
+
+def _ordered(table: MeteoriteTable, positions: 'np.ndarray', values: 'np.ndarray') -> 'np.ndarray':
+    """
+    Orders row positions by their field value, then by name.
+
+    Args:
+        table (MeteoriteTable): The table.
+        positions (np.ndarray): The row positions, in ascending order.
+        values (np.ndarray): The field's value for each position.
+
+    Returns:
+        np.ndarray: The positions, reordered. Rows with the same value and name keep their order.
+    """
+    np = _numpy()
+    names = table.buffers()[0]['name']
+    return positions[np.lexsort((np.array([names[pos] for pos in positions.tolist()], dtype=str), values))]
@@ -0,0 +1,114 @@
+"""
+This module contains a read-only view of selected rows of a dataset.
+"""
+
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+
+
+class ResultView(Sequence):
+    """
+    A sequence of rows of a dataset, selected and ordered by their positions in it.
+
+    The view only stores the positions, as a memoryview over an array of integers, so
+    creating, slicing, and getting the length of a view take constant time and copy no
+    rows. Rows are looked up in the dataset as they are accessed.
+    """
+    __slots__ = ('_data', '_positions')
+
+    def __init__(self, data: Sequence[dict], positions: Iterable[int] | memoryview) -> None:
+        """
+        Initializes an instance of the ResultView class.
+
+        Args:
+            data (Sequence[dict]): The dataset. The view keeps a reference to it.
+            positions (Iterable[int] | memoryview): The positions of the rows in the dataset, in order.
+                A memoryview of integers is used as is, without copying.
+        """
+        self._data = data
+        self._positions = positions if isinstance(positions, memoryview) else memoryview(array('q', positions))
+
+
+    @property
+    def positions(self) -> memoryview:
+        """
+        Get the positions of the view's rows in the dataset.
+
+        Returns:
+            memoryview: The positions, in order.
+        """
+        return self._positions
+
+
+    def __len__(self) -> int:
+        """
+        Get the number of rows in the view.
+
+        Returns:
+            int: The number of rows.
+        """
+        return len(self._positions)
+
+
+    def __getitem__(self, key):
+        """
+        Get a row, or a view of a slice of the rows.
+
+        Args:
+            key (int | slice): The index of the row, or a slice.
+
+        Returns:
+            dict | ResultView: The row, or a view of the slice without copying.
+        """
+        if isinstance(key, slice):
+            return ResultView(self._data, self._positions[key])
+
+        return self._data[self._positions[key]]
+
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Iterate over the rows in the view.
+
+        Returns:
+            Iterator[dict]: An iterator over the rows.
+        """
+        data = self._data
+        return (data[pos] for pos in self._positions)
+
+
+    def __eq__(self, other) -> bool:
+        """
+        Check whether the view has the same rows as another sequence, such as a list.
+
+        Args:
+            other: The other sequence.
+
+        Returns:
+            bool: True if the rows are equal and in the same order.
+        """
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+
+        return len(self) == len(other) and all(row == other_row for row, other_row in zip(self, other))
+
+
+    def __repr__(self) -> str:
+        """
+        Get the string representation of the view, the same as a list of its rows.
+
+        Returns:
+            str: The string representation.
+        """
+        return repr(list(self))
+
+
+    def __sizeof__(self) -> int:
+        """
+        Get the memory used by the view, not including the dataset.
+
+        Returns:
+            int: The size of the view and its positions in bytes.
+        """
+        return object.__sizeof__(self) + sys.getsizeof(self._positions) + self._positions.nbytes
@@ -0,0 +1,113 @@
+import os
+from pathlib import Path
+from pytest import fixture
+from meteorite_filter.dsv.cache import *
+from meteorite_filter.dsv.columnar import MeteoriteTable
+from meteorite_filter.dsv.reader import DSVDictReader
+
+
+class TestTableCache:
+    contents = 'name\tyear\tmass\nAachen\t1880\t21\nAarhus\t\t720.5\n\t1951\t\n'
+    type_map = {'year': int, 'mass': float}
+
+    @fixture
+    def source(self, tmp_path: Path) -> Path:
+        path = tmp_path / 'source.tsv'
+        path.write_text(self.contents)
+        return path
+
+
+    def _parse(self, source: Path) -> MeteoriteTable:
+        return MeteoriteTable.from_reader(DSVDictReader(str(source), '\t', type_map=self.type_map))
+
+
+    def test_round_trip(self, source: Path):
+        cache = TableCache(str(source), '\t', self.type_map)
+        assert cache.path == str(source) + CACHE_EXTENSION
+        assert cache.load() is None
+
+        table = self._parse(source)
+        assert cache.save(table)
+
+        cached = cache.load()
+        assert cached is not None
+        assert cached.fieldnames == table.fieldnames
+        assert list(cached) == list(table)
+        assert cached[1]['year'] is None and cached[2]['name'] == ''
+
+
+    def test_newline_value(self, source: Path):
+        cache = TableCache(str(source), '\t', self.type_map)
+        table = self._parse(source)
+        table.append({'name': 'Line\nbreak', 'year': 1990, 'mass': 1.0})
+
+        assert not cache.save(table) # It could not be loaded back with the same number of rows
+        assert not os.path.exists(cache.path)
+        assert cache.load() is None
+
+
+    def test_empty_table(self, tmp_path: Path):
+        source = tmp_path / 'empty.tsv'
+        source.write_text('name\tyear\tmass\n')
+        cache = TableCache(str(source), '\t', self.type_map)
+
+        cache.save(self._parse(source))
+        cached = cache.load()
+        assert cached is not None and len(cached) == 0
+
+
+    def test_stale_size(self, source: Path):
+        cache = TableCache(str(source), '\t', self.type_map)
+        cache.save(self._parse(source))
+
+        source.write_text(self.contents + 'Abee\t1952\t107000\n')
+        assert cache.load() is None
+
+
+    def test_stale_mtime(self, source: Path):
+        cache = TableCache(str(source), '\t', self.type_map)
+        cache.save(self._parse(source))
+
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert cache.load() is None
+
+
+    def test_stale_content(self, source: Path):
+        cache = TableCache(str(source), '\t', self.type_map)
+        cache.save(self._parse(source))
+
+        stat = source.stat()
+        source.write_text(self.contents.replace('1880', '1881'))
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert source.stat().st_size == stat.st_size
+        assert cache.load() is None
+
+
+    def test_stale_options(self, source: Path):
+        TableCache(str(source), '\t', self.type_map).save(self._parse(source))
+
+        assert TableCache(str(source), '\t', {'year': float, 'mass': float}).load() is None
+        assert TableCache(str(source), ',', self.type_map).load() is None
+        assert TableCache(str(source), '\t', self.type_map).load() is not None
+
+
+    def test_corrupt(self, source: Path):
+        cache = TableCache(str(source), '\t', self.type_map)
+        cache.save(self._parse(source))
+
+        Path(cache.path).write_bytes(Path(cache.path).read_bytes()[:40])
+        assert cache.load() is None
+
+        Path(cache.path).write_bytes(b'not a cache')
+        assert cache.load() is None
+
+
+    def test_clear(self, source: Path):
+        cache = TableCache(str(source), '\t', self.type_map)
+        assert not cache.clear()
+
+        cache.save(self._parse(source))
+        assert cache.clear()
+        assert not Path(cache.path).exists()
+        assert cache.load() is None
@@ -0,0 +1,79 @@
+from pathlib import Path
+import pytest
+from meteorite_filter.constants import TYPE_MAP
+from meteorite_filter.dsv.columnar import *
+from meteorite_filter.dsv.reader import DSVDictReader
+from meteorite_filter.filter_data import filter_data
+from meteorite_filter.index import SortedIndex
+
+
+DATA_PATH = Path(__file__).parents[2] / 'data' / 'meteorite_landings_data.txt'
+
+
+class TestMeteoriteTable:
+    fieldnames = ['name', 'year', 'mass (g)']
+    type_map = {'year': int, 'mass (g)': float}
+    rows = [
+        {'name': 'Aachen', 'year': 1880, 'mass (g)': 21.0},
+        {'name': 'Aarhus', 'year': None, 'mass (g)': 720.0},
+        {'name': '', 'year': 1951, 'mass (g)': None}
+    ]
+
+    def test_append(self):
+        table = MeteoriteTable(self.fieldnames, self.type_map)
+        table.extend(self.rows)
+
+        assert len(table) == 3
+        assert table.fieldnames == self.fieldnames
+        assert [dict(row) for row in table] == self.rows
+        assert table[-1] == self.rows[2]
+        assert table[1:] == self.rows[1:]
+        assert table.value(1, 'year') is None
+        assert table.value(1, 'mass (g)') == 720.0
+
+        with pytest.raises(IndexError):
+            table[3]
+
+
+    def test_row_view(self):
+        table = MeteoriteTable(self.fieldnames, self.type_map)
+        table.extend(self.rows)
+        row = table[0]
+
+        assert row.pos == 0
+        assert len(row) == 3
+        assert list(row.keys()) == self.fieldnames
+        assert repr(row) == repr(self.rows[0])
+
+        with pytest.raises(KeyError):
+            row['id']
+
+
+    def test_widen(self, tmp_path: Path):
+        path = tmp_path / 'test_widen.tsv'
+        path.write_text('id\tname\tyear\tmass (g)\n1\tAachen\t1880\t21\n2\tAarhus\t\t720\n')
+        type_map = {'id': int, **self.type_map}
+
+        table = MeteoriteTable.from_reader(DSVDictReader(str(path), '\t', type_map=type_map, usecols=['year', 'name']))
+        row = table[1]
+        assert table.fieldnames == ['name', 'year']
+        assert dict(row) == {'name': 'Aarhus', 'year': None}
+
+        assert table.widen(DSVDictReader(str(path), '\t', type_map=type_map))
+        assert table.fieldnames == ['id', 'name', 'year', 'mass (g)']
+        assert dict(row) == {'id': 2, 'name': 'Aarhus', 'year': None, 'mass (g)': 720.0}
+        assert not table.widen(DSVDictReader(str(path), '\t', type_map=type_map))
+
+        path.write_text('id\tname\tyear\tmass (g)\tfall\n1\tAachen\t1880\t21\tFell\n')
+        with pytest.raises(ValueError):
+            table.widen(DSVDictReader(str(path), '\t', type_map=type_map))
+
+
+    def test_matches_dicts(self):
+        dicts = list(DSVDictReader(str(DATA_PATH), delimiter='\t', type_map=TYPE_MAP))
+        table = MeteoriteTable.from_reader(DSVDictReader(str(DATA_PATH), delimiter='\t', type_map=TYPE_MAP))
+
+        assert len(table) == len(dicts)
+        assert all(row == expected for row, expected in zip(table, dicts))
+        assert filter_data(table, 'year', 1900, 1950) == filter_data(dicts, 'year', 1900, 1950)
+        assert SortedIndex(table, 'mass (g)').range(10, 100) == filter_data(dicts, 'mass (g)', 10, 100)
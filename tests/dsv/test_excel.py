@@ -0,0 +1,47 @@
+from pathlib import Path
+import pytest
+from meteorite_filter.dsv.excel import *
+
+
+class TestExcelDictWriter:
+    fieldnames = ['name', 'year', 'mass (g)', 'recclass']
+    rows = [
+        {'name': f'Meteorite {num}', 'year': 1900 + num, 'mass (g)': num * 1.5 if num % 3 else None, 'recclass': '' if num % 4 else 'L5'}
+        for num in range(10)
+    ]
+
+    def test_writerows_matches_writerow(self, tmp_path: Path):
+        bulk = ExcelDictWriter(str(tmp_path / 'bulk.xls'), self.fieldnames)
+        bulk.writeheader()
+        bulk.writerows(iter(self.rows))
+        assert bulk.save() >= 0
+
+        single = ExcelDictWriter(str(tmp_path / 'single.xls'), self.fieldnames)
+        single.writeheader()
+        for row in self.rows:
+            single.writerow(row)
+        single.save()
+
+        assert (tmp_path / 'bulk.xls').read_bytes() == (tmp_path / 'single.xls').read_bytes()
+
+
+    def test_sheet_splitting(self, tmp_path: Path):
+        writer = ExcelDictWriter(str(tmp_path / 'split.xls'), self.fieldnames)
+        writer.MAX_SHEET_ROWS = 4
+        writer.writeheader()
+        writer.writerows(self.rows[:7])
+        writer.writerow(self.rows[7])
+        writer.save()
+
+        assert [sheet.name for sheet in writer.sheets] == ['filteredMeteoriteData', 'filteredMeteoriteData_2', 'filteredMeteoriteData_3']
+        assert [len(sheet.get_rows()) for sheet in writer.sheets] == [4, 4, 3] # Each sheet repeats the header
+
+
+    def test_invalid_row(self, tmp_path: Path):
+        writer = ExcelDictWriter(str(tmp_path / 'invalid.xls'), self.fieldnames)
+
+        with pytest.raises(ValueError):
+            writer.writerows([{'name': 'Meteorite'}])
+
+        with pytest.raises(ValueError):
+            writer.writerow({'name': 'Meteorite'})
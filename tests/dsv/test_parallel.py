@@ -0,0 +1,63 @@
+from pathlib import Path
+import pytest
+from meteorite_filter.constants import TYPE_MAP
+from meteorite_filter.dsv.parallel import *
+from meteorite_filter.dsv.reader import DSVDictReader
+
+
+DATA_PATH = Path(__file__).parents[2] / 'data' / 'meteorite_landings_data.txt'
+
+
+class TestParallel:
+    contents = 'name\tyear\tmass\nAachen\t1880\t21\nAarhus\t\t720.5\n\t1951\t\nAbee\t1952\t107000\n'
+    type_map = {'year': int, 'mass': float}
+
+    def test_chunk_ranges(self, tmp_path: Path):
+        path = tmp_path / 'test_chunk_ranges.tsv'
+        path.write_text(self.contents)
+
+        header, ranges = chunk_ranges(str(path), 3)
+        assert header == b'name\tyear\tmass\n'
+        assert ranges[0][0] == len(header) and ranges[-1][1] == len(self.contents)
+        assert all(stop == start for (_, stop), (start, _) in zip(ranges, ranges[1:]))
+        assert all(self.contents[stop - 1] == '\n' for _, stop in ranges)
+
+
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_matches_serial(self, tmp_path: Path, workers: int):
+        path = tmp_path / 'test_matches_serial.tsv'
+        path.write_bytes(self.contents.rstrip('\n').replace('\n', '\r\n').encode())
+
+        expected = list(DSVDictReader(str(path), '\t', type_map=self.type_map))
+        assert read_parallel(str(path), '\t', self.type_map, workers=workers, chunks_per_worker=2) == expected
+        assert list(read_table_parallel(str(path), '\t', self.type_map, workers=workers, chunks_per_worker=2)) == expected
+
+
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_read_chunks(self, tmp_path: Path, workers: int):
+        path = tmp_path / 'test_read_chunks.tsv'
+        path.write_text(self.contents)
+
+        chunks = list(read_chunks(str(path), '\t', self.type_map, workers=workers, chunks_per_worker=2, usecols=['mass', 'name']))
+        assert [stop for stop, _ in chunks] == [stop for _, stop in chunk_ranges(str(path), workers * 2)[1]]
+        assert all(list(columns) == ['name', 'mass'] for _, columns in chunks)
+        assert [value for _, columns in chunks for value in columns['mass']] == [21.0, 720.5, None, 107000.0]
+
+        table = read_table_parallel(str(path), '\t', self.type_map, workers=workers, usecols=['year'])
+        assert list(table) == list(DSVDictReader(str(path), '\t', type_map=self.type_map, usecols=['year']))
+
+        with pytest.raises(ValueError):
+            list(read_chunks(str(path), '\t', self.type_map, workers=workers, usecols=['no such field']))
+
+
+    def test_short_line(self, tmp_path: Path):
+        path = tmp_path / 'test_short_line.tsv'
+        path.write_text(self.contents + 'Acapulco\t1976\n')
+
+        with pytest.raises(ValueError):
+            read_parallel(str(path), '\t', self.type_map, workers=1)
+
+
+    def test_landings(self):
+        expected = list(DSVDictReader(str(DATA_PATH), '\t', type_map=TYPE_MAP))
+        assert read_parallel(str(DATA_PATH), '\t', TYPE_MAP, workers=2) == expected
@@ -0,0 +1,118 @@
+from pathlib import Path
+import pytest
+from pytest import mark
+from meteorite_filter.constants import TYPE_MAP
+from meteorite_filter.dsv.reader import *
+
+
+DATA_PATH = Path(__file__).parents[2] / 'data' / 'meteorite_landings_data.txt'
+
+
+class TestBinaryMode:
+    contents = 'name\tyear\tmass\nAachen\t1880\t21\nAarhus\t\t720.5\n\t1951\t\n'
+
+    @mark.parametrize('newline', ['\n', '\r\n'])
+    def test_reader(self, tmp_path: Path, newline: str):
+        path = tmp_path / 'test_reader.tsv'
+        path.write_bytes(self.contents.replace('\n', newline).encode())
+
+        assert list(DSVReader(str(path), '\t', mode='rb')) == list(DSVReader(str(path), '\t'))
+        assert list(DSVReader(str(path), '\t', mode='rb'))[-1] == ['', '1951', '']
+
+
+    def test_no_trailing_newline(self, tmp_path: Path):
+        path = tmp_path / 'test_no_trailing_newline.tsv'
+        path.write_text(self.contents.rstrip('\n'))
+
+        reader = DSVReader(str(path), '\t', mode='rb')
+        assert list(reader) == list(DSVReader(str(path), '\t'))
+        assert reader.line_num == 4
+
+
+    @mark.parametrize('mode', ['r', 'rb'])
+    def test_bytes_read(self, tmp_path: Path, mode: str):
+        path = tmp_path / 'test_bytes_read.tsv'
+        path.write_text(self.contents)
+
+        reader = DSVReader(str(path), '\t', mode=mode)
+        assert reader.bytes_read == 0
+
+        list(reader)
+        assert reader.bytes_read == len(self.contents)
+
+
+    def test_empty_file(self, tmp_path: Path):
+        path = tmp_path / 'test_empty_file.tsv'
+        path.write_text('')
+
+        assert list(DSVReader(str(path), '\t', mode='rb')) == []
+
+
+    @mark.parametrize('usecols', [None, ['name', 'mass'], ['year']])
+    def test_short_line(self, tmp_path: Path, usecols: list[str] | None):
+        path = tmp_path / 'test_short_line.tsv'
+        path.write_text(self.contents + 'Acapulco\n')
+
+        with pytest.raises(ValueError):
+            list(DSVDictReader(str(path), '\t', type_map={'year': int, 'mass': float}, mode='rb', usecols=usecols))
+
+
+    @mark.parametrize('mode', ['wb', 'xb', 'ab', 'r+b'])
+    def test_unreadable_mode(self, tmp_path: Path, mode: str):
+        path = tmp_path / 'test_unreadable_mode.tsv'
+        path.write_text(self.contents)
+
+        with pytest.raises(OSError):
+            DSVDictReader(str(path), '\t', mode=mode)
+
+        with pytest.raises(OSError):
+            DSVReader(str(tmp_path / 'missing.tsv'), '\t', mode=mode)
+
+        assert path.read_text() == self.contents
+        assert not (tmp_path / 'missing.tsv').exists()
+
+
+    def test_dict_reader(self, tmp_path: Path):
+        path = tmp_path / 'test_dict_reader.tsv'
+        path.write_text(self.contents)
+        type_map = {'year': int, 'mass': float}
+
+        rows = list(DSVDictReader(str(path), '\t', type_map=type_map, mode='rb'))
+        assert rows == list(DSVDictReader(str(path), '\t', type_map=type_map))
+        assert rows[1] == {'name': 'Aarhus', 'year': None, 'mass': 720.5}
+
+
+    def test_matches_text_mode(self):
+        text_rows = list(DSVDictReader(str(DATA_PATH), '\t', type_map=TYPE_MAP))
+        binary_rows = list(DSVDictReader(str(DATA_PATH), '\t', type_map=TYPE_MAP, mode='rb'))
+
+        assert binary_rows == text_rows
+
+
+class TestUsecols:
+    contents = 'name\tyear\tmass\tclass\nAachen\t1880\t21\tL5\nAarhus\t\t720.5\tH6\n\t1951\t\t\n'
+    type_map = {'year': int, 'mass': float}
+
+    @mark.parametrize('mode', ['r', 'rb'])
+    def test_projection(self, tmp_path: Path, mode: str):
+        path = tmp_path / 'test_projection.tsv'
+        path.write_text(self.contents)
+
+        reader = DSVDictReader(str(path), '\t', type_map=self.type_map, mode=mode, usecols=['mass', 'name'])
+        assert reader.usecols == ['name', 'mass']
+        assert list(reader) == [{'name': 'Aachen', 'mass': 21.0}, {'name': 'Aarhus', 'mass': 720.5}, {'name': '', 'mass': None}]
+
+        reader = DSVDictReader(str(path), '\t', type_map=self.type_map, mode=mode, usecols=['year'])
+        assert next(reader) == {'year': 1880}
+        reader.usecols = None
+        assert next(reader) == {'name': 'Aarhus', 'year': None, 'mass': 720.5, 'class': 'H6'}
+        reader.usecols = ['class', 'year']
+        assert next(reader) == {'year': 1951, 'class': ''}
+
+
+    def test_unknown_field(self, tmp_path: Path):
+        path = tmp_path / 'test_unknown_field.tsv'
+        path.write_text(self.contents)
+
+        with pytest.raises(ValueError):
+            DSVDictReader(str(path), '\t', usecols=['name', 'id'])
@@ -1,3 +1,4 @@
+import io
 from pathlib import Path
 import pytest
 from meteorite_filter.dsv.writer import *
@@ -64,6 +65,16 @@ class TestDSVWriter:
         assert 'this|is|a|test\n4|7.4|-4|-7.4\n|||\nthis|0||0.0\n' == pipe_path.read_text()
 
 
+    def test_open_file(self):
+        file = io.StringIO()
+        writer = DSVWriter(file, '\t')
+        writer.writerows(self.rows[:2])
+        writer.close()
+
+        assert not file.closed
+        assert file.getvalue() == 'this\tis\ta\ttest\n4\t7.4\t-4\t-7.4\n'
+
+
 class TestDSVDictWriter:
     fieldnames = ['string', 'int', 'none', 'float']
     header = 'string\tint\tnone\tfloat\n'
@@ -160,6 +171,9 @@ even more text\t0\t\t0.0
         writer.writerows(self.rows)
         assert path.read_text() == self.all_rows
 
+        writer.writerows(row for row in self.rows)
+        assert path.read_text() == self.all_rows * 2
+
         too_few_fields = self.rows + [{
             'string': 'foo',
             'int': 47,
@@ -190,4 +204,18 @@ even more text\t0\t\t0.0
         writer.writeheader()
         writer.writerows(self.rows)
         assert path.read_text() == self.header + self.all_rows
-        
\ No newline at end of file
+        
+
+    def test_buffered(self, tmp_path):
+        path: Path = tmp_path / 'TestDSVDictWriter'
+        path.mkdir()
+        path = path / 'test_buffered.tsv'
+
+        with DSVDictWriter(str(path), self.fieldnames, '\t', buffer_size=1024 * 1024) as writer:
+            writer.writeheader()
+            writer.writerow(self.rows[0])
+            assert path.read_text() == '' # Not flushed after each row
+
+            writer.writerows(iter(self.rows[1:]))
+
+        assert path.read_text() == self.header + self.all_rows
@@ -0,0 +1,88 @@
+from pathlib import Path
+from xml.etree import ElementTree
+from zipfile import ZipFile
+import pytest
+from meteorite_filter.dsv.xlsx import *
+from meteorite_filter.dsv.xlsx import _column_name
+
+
+NS = {'x': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+
+
+def read_sheet(archive: ZipFile, num: int) -> list[dict[str, str]]:
+    root = ElementTree.fromstring(archive.read(f'xl/worksheets/sheet{num}.xml'))
+    rows = []
+
+    for row in root.iterfind('x:sheetData/x:row', NS):
+        cells = {}
+        for cell in row.iterfind('x:c', NS):
+            value = cell.find('x:v', NS) if cell.get('t') != 'inlineStr' else cell.find('x:is/x:t', NS)
+            cells[cell.get('r')] = value.text
+        rows.append(cells)
+
+    return rows
+
+
+class TestXlsxDictWriter:
+    fieldnames = ['name', 'year', 'mass (g)', 'recclass']
+    rows = [
+        {'name': f'Meteorite {num}', 'year': 1900 + num, 'mass (g)': num * 1.5 if num % 3 else None, 'recclass': '' if num % 4 else 'L5'}
+        for num in range(10)
+    ]
+
+    def test_write(self, tmp_path: Path):
+        path = tmp_path / 'test.xlsx'
+
+        with XlsxDictWriter(str(path), self.fieldnames) as writer:
+            writer.writeheader()
+            writer.writerow(self.rows[0])
+            writer.writerows(iter(self.rows[1:3]))
+            writer.writerow({'name': ' <Tab>\t& "quoted"\x01', 'year': True, 'mass (g)': float('nan'), 'recclass': 'L6'})
+
+        with ZipFile(path) as archive:
+            assert archive.testzip() is None
+            assert {'[Content_Types].xml', '_rels/.rels', 'xl/workbook.xml', 'xl/_rels/workbook.xml.rels', 'xl/styles.xml'} <= set(archive.namelist())
+
+            workbook = ElementTree.fromstring(archive.read('xl/workbook.xml'))
+            assert [sheet.get('name') for sheet in workbook.iterfind('x:sheets/x:sheet', NS)] == ['filteredMeteoriteData']
+
+            assert read_sheet(archive, 1) == [
+                {'A1': 'name', 'B1': 'year', 'C1': 'mass (g)', 'D1': 'recclass'},
+                {'A2': 'Meteorite 0', 'B2': '1900', 'D2': 'L5'},
+                {'A3': 'Meteorite 1', 'B3': '1901', 'C3': '1.5'},
+                {'A4': 'Meteorite 2', 'B4': '1902', 'C4': '3.0'},
+                {'A5': ' <Tab>\t& "quoted"', 'B5': '1', 'C5': 'nan', 'D5': 'L6'}
+            ]
+
+
+    def test_sheet_splitting(self, tmp_path: Path):
+        path = tmp_path / 'split.xlsx'
+        writer = XlsxDictWriter(str(path), self.fieldnames)
+        writer.MAX_SHEET_ROWS = 4
+        writer.writeheader()
+        writer.writerows(self.rows[:7])
+        writer.writerow(self.rows[7])
+        writer.close()
+
+        assert writer.sheets == ['filteredMeteoriteData', 'filteredMeteoriteData_2', 'filteredMeteoriteData_3']
+
+        with ZipFile(path) as archive:
+            sheets = [read_sheet(archive, num) for num in range(1, 4)]
+
+        assert [len(sheet) for sheet in sheets] == [4, 4, 3] # Each sheet repeats the header
+        assert all(sheet[0]['A1'] == 'name' for sheet in sheets)
+        assert sheets[2][-1]['A3'] == 'Meteorite 7'
+
+
+    def test_invalid_row(self, tmp_path: Path):
+        with XlsxDictWriter(str(tmp_path / 'invalid.xlsx'), self.fieldnames) as writer:
+            with pytest.raises(ValueError):
+                writer.writerows([{'name': 'Meteorite'}])
+
+            with pytest.raises(ValueError):
+                writer.writerow({'name': 'Meteorite'})
+
+
+    @pytest.mark.parametrize('col,name', [(0, 'A'), (25, 'Z'), (26, 'AA'), (701, 'ZZ'), (702, 'AAA'), (16383, 'XFD')])
+    def test_column_name(self, col: int, name: str):
+        assert _column_name(col) == name
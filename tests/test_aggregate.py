@@ -0,0 +1,68 @@
+from pathlib import Path
+import pytest
+from pytest import CaptureFixture, fixture, mark
+from meteorite_filter.aggregate import *
+from meteorite_filter.constants import TYPE_MAP
+from meteorite_filter.dsv.reader import DSVDictReader
+
+
+DATA_PATH = Path(__file__).parents[1] / 'data' / 'meteorite_landings_data.txt'
+
+
+@fixture(scope='module')
+def landings() -> list[dict]:
+    return list(DSVDictReader(str(DATA_PATH), delimiter='\t', type_map=TYPE_MAP))
+
+
+class TestAggregate:
+    rows = [
+        {'name': 'Aachen', 'year': 1880, 'recclass': 'L5', 'mass (g)': 21.0},
+        {'name': 'Aarhus', 'year': 1951, 'recclass': 'H6', 'mass (g)': 720.0},
+        {'name': 'Abee', 'year': 1952, 'recclass': 'L5', 'mass (g)': None},
+        {'name': 'Acapulco', 'year': None, 'recclass': 'L5', 'mass (g)': 1914.0}
+    ]
+
+    def test_aggregate(self):
+        results = aggregate(self.rows, ['decade', 'recclass'])
+
+        assert list(results['decade']) == [1880, 1950, None]
+        assert results['decade'][1950].count == 2
+        assert results['decade'][1950].known == 1
+        assert results['decade'][1950].mean == 720.0
+
+        l5 = results['recclass']['L5']
+        assert (l5.count, l5.known, l5.total, l5.minimum, l5.maximum, l5.mean) == (3, 2, 1935.0, 21.0, 1914.0, 967.5)
+
+        with pytest.raises(ValueError):
+            aggregate(self.rows, ['month'])
+
+
+    def test_summary_rows(self, tmp_path: Path, capsys: CaptureFixture[str]):
+        rows = summary_rows(aggregate(self.rows, ['year'])['year'], 'year')
+
+        assert [row['year'] for row in rows] == [1880, 1951, 1952, '']
+        assert rows[2] == {'year': 1952, 'count': 1, 'known mass (g)': 0, 'total mass (g)': 0, 'min mass (g)': None, 'max mass (g)': None, 'mean mass (g)': None}
+
+        print(summary_table(rows))
+        assert capsys.readouterr().out.splitlines()[0].split() == ['YEAR', 'COUNT', 'KNOWN', 'MASS', '(G)', 'TOTAL', 'MASS', '(G)', 'MIN', 'MASS', '(G)', 'MAX', 'MASS', '(G)', 'MEAN', 'MASS', '(G)']
+
+        path = tmp_path / 'summary.txt'
+        write_summary(rows, str(path))
+        assert path.read_text().splitlines()[3] == '1952\t1\t0\t0\t\t\t'
+
+
+    def test_histogram(self):
+        assert histogram(self.rows, 'year', 50) == {1850: 1, 1950: 2}
+        assert histogram(self.rows, 'mass (g)', 1000, origin=500) == {-500: 1, 500: 1, 1500: 1}
+
+        with pytest.raises(ValueError):
+            histogram(self.rows, 'year', 0)
+
+
+    @mark.parametrize('limits', [(1900, 1950), (860, 2101), (1950, 1900), (0, 100), (1900.5, 1950.5), (float('-inf'), 1900)])
+    def test_prefix_sums(self, landings: list[dict], limits: tuple):
+        sums = PrefixSums(landings)
+        matches = [row for row in landings if row['year'] is not None and limits[0] <= row['year'] <= limits[1]]
+
+        assert sums.count(*limits) == len(matches)
+        assert sums.total(*limits) == pytest.approx(sum(row['mass (g)'] for row in matches if row['mass (g)'] is not None))
@@ -0,0 +1,82 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from meteorite_filter.constants import TYPE_MAP
+from meteorite_filter.dsv.reader import DSVDictReader
+
+
+ROOT_PATH = Path(__file__).parents[1]
+DATA_PATH = ROOT_PATH / 'data' / 'meteorite_landings_data.txt'
+
+
+def run_module(module: str, *args: str, check: bool = True) -> subprocess.CompletedProcess:
+    env = {**os.environ, 'PYTHONPATH': str(ROOT_PATH / 'src')}
+    return subprocess.run([sys.executable, '-m', module, *args], cwd=ROOT_PATH, env=env, capture_output=True, text=True, check=check)
+
+
+def generate(path: Path, rows: int, seed: int = 0) -> Path:
+    run_module('benchmarks.generate', str(path), '--rows', str(rows), '--seed', str(seed))
+    return path
+
+
+class TestGenerate:
+    def test_schema(self, tmp_path):
+        path = generate(tmp_path / 'landings.txt', 100)
+
+        with open(DATA_PATH, encoding='utf-8') as data_file, open(path, encoding='utf-8') as file:
+            assert file.readline() == data_file.readline()
+
+        for mode in ('r', 'rb'):
+            rows = list(DSVDictReader(str(path), '\t', type_map=TYPE_MAP, mode=mode))
+            assert len(rows) == 100
+            assert all(len(row) == 12 for row in rows)
+
+
+    def test_deterministic(self, tmp_path):
+        first = generate(tmp_path / 'first.txt', 500).read_bytes()
+        assert generate(tmp_path / 'second.txt', 500).read_bytes() == first
+        assert generate(tmp_path / 'other_seed.txt', 500, seed=1).read_bytes() != first
+
+
+    def test_null_rates(self, tmp_path):
+        rows = list(DSVDictReader(str(generate(tmp_path / 'landings.txt', 20_000)), '\t', type_map=TYPE_MAP, mode='rb'))
+        rate = lambda field: sum(row[field] is None for row in rows) / len(rows)
+
+        assert rate('mass (g)') < 0.01
+        assert rate('year') < 0.015
+        assert 0.14 < rate('reclat') < 0.18
+        assert all((row['reclat'] is None) == (row['reclong'] is None) == (row['GeoLocation'] == '') for row in rows)
+        assert 0.95 < rate('States') < 0.975
+        assert len({row['id'] for row in rows}) == len(rows)
+
+
+class TestRun:
+    def test_results(self, tmp_path):
+        base, new = tmp_path / 'base.json', tmp_path / 'new.json'
+        args = ['--rows', '200', '--repeat', '2', '--benchmark', 'parse_binary', 'parse_parallel', 'filter_mass', 'render_page', '--data-dir', str(tmp_path)]
+
+        run_module('benchmarks.run', *args, '--output', str(base))
+        run_module('benchmarks.run', *args, '--output', str(new))
+
+        report = json.loads(new.read_text(encoding='utf-8'))
+        assert [(result['benchmark'], result['rows']) for result in report['results']] == [('parse_binary', 200), ('parse_parallel', 200), ('filter_mass', 200), ('render_page', 200)]
+        assert all(len(result['samples']) == 2 and result['min'] == min(result['samples']) for result in report['results'])
+        assert {'commit', 'dirty', 'python', 'cpus', 'numpy'} <= set(report['environment'])
+
+        comparison = run_module('benchmarks.compare', str(base), str(new), '--threshold', '1000', check=False)
+        assert comparison.returncode == 0
+        assert 'filter_mass' in comparison.stdout
+
+
+    def test_compare_regression(self, tmp_path):
+        result = lambda time: {'benchmark': 'parse_text', 'rows': 10, 'samples': [time], 'min': time, 'median': time, 'rows_per_second': 10 / time}
+        report = lambda time: {'format': 1, 'environment': {'commit': None, 'dirty': None}, 'results': [result(time)]}
+        (tmp_path / 'base.json').write_text(json.dumps(report(1.0)), encoding='utf-8')
+        (tmp_path / 'new.json').write_text(json.dumps(report(1.5)), encoding='utf-8')
+
+        comparison = run_module('benchmarks.compare', str(tmp_path / 'base.json'), str(tmp_path / 'new.json'), check=False)
+        assert comparison.returncode == 1
+        assert '+50.0%' in comparison.stdout and 'slower' in comparison.stdout
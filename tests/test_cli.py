@@ -0,0 +1,116 @@
+import io
+import shutil
+import tomllib
+from pathlib import Path
+
+from pytest import CaptureFixture, fixture, raises
+
+from meteorite_filter.cli import main, parse_args
+from meteorite_filter.constants import TYPE_MAP
+from meteorite_filter.dsv.reader import DSVDictReader
+from meteorite_filter.dsv.writer import DSVDictWriter
+from meteorite_filter.filter_data import filter_data
+
+
+ROOT_PATH = Path(__file__).parents[1]
+DATA_PATH = ROOT_PATH / 'data' / 'meteorite_landings_data.txt'
+
+
+@fixture
+def data_path(tmp_path: Path) -> Path:
+    path = tmp_path / 'landings.txt' # A copy, so caches are not written next to the original
+    shutil.copyfile(DATA_PATH, path)
+    return path
+
+
+def expected_tsv(field: str, lower: float, upper: float) -> str:
+    reader = DSVDictReader(str(DATA_PATH), '\t', type_map=TYPE_MAP)
+    data = list(reader)
+    file = io.StringIO()
+    writer = DSVDictWriter(file, reader.fieldnames, '\t')
+    writer.writeheader()
+    writer.writerows(filter_data(data, field, lower, upper))
+    return file.getvalue()
+
+
+class TestParseArgs:
+    def test_defaults(self):
+        args = parse_args(['--file', 'landings.txt', '--field', 'mass', '--format', 'txt'])
+        assert args.field == 'mass (g)'
+        assert args.min == float('-inf') and args.max == float('inf')
+        assert args.output is None and not args.stream
+
+
+    def test_errors(self, capfd: CaptureFixture[str]):
+        required = ['--file', 'landings.txt', '--field', 'year']
+
+        for argv in (
+            [*required, '--format', 'txt', '--min', '1950', '--max', '1900'],
+            [*required, '--format', 'tsv-stdout', '--output', 'results.txt'],
+            [*required, '--format', 'txt', '--unordered'],
+            [*required, '--format', 'txt', '--stream', '--memory-budget', '0'],
+            [*required, '--format', 'csv'],
+            [*required, '--format', 'txt', '--workers', '0'],
+            [*required, '--format', 'txt', '--stream', '--workers', '2']
+        ):
+            with raises(SystemExit) as exit_info:
+                parse_args(argv)
+
+            assert exit_info.value.code == 2
+
+        assert 'usage: meteorite-filter' in capfd.readouterr().err
+
+
+class TestMain:
+    def test_stdout(self, data_path: Path, capfd: CaptureFixture[str]):
+        assert main(['--file', str(data_path), '--field', 'year', '--min', '1900', '--max', '1950', '--format', 'tsv-stdout']) == 0
+        assert capfd.readouterr().out == expected_tsv('year', 1900, 1950)
+
+
+    def test_stream(self, data_path: Path, capfd: CaptureFixture[str]):
+        argv = ['--file', str(data_path), '--field', 'mass', '--min', '1000', '--format', 'tsv-stdout']
+
+        assert main(argv) == 0
+        loaded = capfd.readouterr().out
+
+        for extra in (['--stream'], ['--stream', '--binary'], ['--stream', '--memory-budget', '1']):
+            assert main([*argv, *extra]) == 0
+            assert capfd.readouterr().out == loaded
+
+        assert loaded == expected_tsv('mass (g)', 1000, float('inf'))
+
+
+    def test_workers(self, data_path: Path, capfd: CaptureFixture[str]):
+        assert main(['--file', str(data_path), '--field', 'mass', '--max', '1000', '--format', 'tsv-stdout', '--no-cache', '--workers', '2']) == 0
+        assert capfd.readouterr().out == expected_tsv('mass (g)', float('-inf'), 1000)
+
+
+    def test_output(self, data_path: Path, tmp_path: Path, capfd: CaptureFixture[str]):
+        path = tmp_path / 'results.txt'
+
+        assert main(['--file', str(data_path), '--field', 'year', '--min', '1900', '--max', '1950', '--format', 'txt', '--output', str(path), '--no-cache']) == 0
+        assert path.read_text(encoding='utf-8') == expected_tsv('year', 1900, 1950)
+        assert str(path) in capfd.readouterr().out
+        assert not list(tmp_path.glob('*.mfcache'))
+
+
+    def test_missing_file(self, tmp_path: Path, capfd: CaptureFixture[str]):
+        path = tmp_path / 'missing.txt'
+
+        assert main(['--file', str(path), '--field', 'year', '--format', 'tsv-stdout']) == 1
+        captured = capfd.readouterr()
+        assert captured.out == ''
+        assert captured.err.startswith('meteorite-filter: error:') and str(path) in captured.err
+
+
+    def test_bad_file(self, tmp_path: Path, capfd: CaptureFixture[str]):
+        path = tmp_path / 'bad.txt'
+        path.write_text('name\tyear\nMeteorite\tnot a year\n', encoding='utf-8')
+
+        assert main(['--file', str(path), '--field', 'year', '--format', 'tsv-stdout', '--no-cache']) == 1
+        assert 'not a correctly formatted' in capfd.readouterr().err
+
+
+    def test_script(self):
+        with open(ROOT_PATH / 'pyproject.toml', 'rb') as file:
+            assert tomllib.load(file)['project']['scripts']['meteorite-filter'] == 'meteorite_filter.cli:main'
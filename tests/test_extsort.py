@@ -0,0 +1,63 @@
+from pathlib import Path
+from random import Random
+from tempfile import TemporaryFile
+import pytest
+from pytest import MonkeyPatch, mark
+from meteorite_filter.extsort import *
+from meteorite_filter.filter_data import filter_file
+
+
+DATA_PATH = Path(__file__).parents[1] / 'data' / 'meteorite_landings_data.txt'
+
+_rng = Random(390)
+
+
+class TestExternalSort:
+    rows = [{'name': f'Meteorite {num}', 'year': _rng.randint(1900, 1910), 'seq': num} for num in range(500)]
+    key = staticmethod(lambda row: row['year'])
+
+    @mark.parametrize('memory_budget,fan_in', [(DEFAULT_MEMORY_BUDGET, 64), (5000, 64), (5000, 2), (1, 3)])
+    def test_matches_sorted(self, memory_budget: int, fan_in: int):
+        result = list(external_sort(iter(self.rows), self.key, memory_budget, fan_in))
+        assert result == sorted(self.rows, key=self.key) # Equal years keep their input order
+
+
+    @mark.parametrize('fan_in', [2, 3, 8])
+    def test_open_runs(self, fan_in: int, monkeypatch: MonkeyPatch):
+        runs = []
+        peak = 0
+
+        def temporary_file():
+            nonlocal peak
+            runs.append(TemporaryFile())
+            peak = max(peak, sum(not run.closed for run in runs))
+            return runs[-1]
+
+        monkeypatch.setattr('meteorite_filter.extsort.TemporaryFile', temporary_file)
+        result = list(external_sort(iter(self.rows), self.key, 1000, fan_in))
+
+        assert result == sorted(self.rows, key=self.key)
+        assert len(runs) > 10 * fan_in
+        assert peak <= fan_in + 1 # The runs being merged, and the run they are merged into
+
+
+    def test_empty(self):
+        assert list(external_sort(iter([]), self.key, 1)) == []
+
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            list(external_sort(iter(self.rows), self.key, 0))
+
+        with pytest.raises(ValueError):
+            list(external_sort(iter(self.rows), self.key, fan_in=1))
+
+
+    def test_filter_file(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+        outputs = iter([tmp_path / 'in_memory.txt', tmp_path / 'external.txt'])
+        monkeypatch.setattr('meteorite_filter.output._gen_filename', lambda *args, **kargs: str(next(outputs)))
+
+        filter_file(str(DATA_PATH), 'year', 1900, 2000)
+        filter_file(str(DATA_PATH), 'year', 1900, 2000, memory_budget=256 * 1024)
+
+        assert (tmp_path / 'external.txt').read_bytes() == (tmp_path / 'in_memory.txt').read_bytes()
@@ -1,4 +1,5 @@
 from io import StringIO
+from threading import Timer
 from pytest import fixture, MonkeyPatch, CaptureFixture, mark
 import pytest
 from meteorite_filter.filter_data import *
@@ -18,9 +19,14 @@ def mock_outputs(monkeypatch: MonkeyPatch):
     def mock_excel_output(data: list[dict], field: str):
         print(f'ExcelFileOutput selected. data: {data}, field: {field}')
 
+    @staticmethod
+    def mock_xlsx_output(data: list[dict], field: str):
+        print(f'XlsxFileOutput selected. data: {data}, field: {field}')
+
     monkeypatch.setitem(OUTPUT_OPTIONS['terminal'], "func", mock_term_output)
     monkeypatch.setitem(OUTPUT_OPTIONS['text'], "func", mock_text_output)
     monkeypatch.setitem(OUTPUT_OPTIONS['excel'], 'func', mock_excel_output)
+    monkeypatch.setitem(OUTPUT_OPTIONS['xlsx'], 'func', mock_xlsx_output)
 
 
 @fixture
@@ -71,11 +77,12 @@ class TestSelectOutput:
 1 - Display on screen
 2 - Save to a text (.txt) file
 3 - Save to an Excel (.xls) file
+4 - Save to an Excel workbook (.xlsx) file
 q - Quit the application
 \x1B[36mType a letter or number to select your choice
 \x1B[39m> \x1B[32m\x1B[39m'''
 
-    @mark.parametrize('sim_input,field,output_option', [('1\n', 'mass (g)', 'TerminalOutput'), ('1\n', 'year', 'TerminalOutput'), ('2\n', 'mass (g)', 'TextFileOutput'), ('2\n', 'year', 'TextFileOutput'), ('3\n', 'mass (g)', 'ExcelFileOutput'), ('3\n', 'year', 'ExcelFileOutput')])
+    @mark.parametrize('sim_input,field,output_option', [('1\n', 'mass (g)', 'TerminalOutput'), ('1\n', 'year', 'TerminalOutput'), ('2\n', 'mass (g)', 'TextFileOutput'), ('2\n', 'year', 'TextFileOutput'), ('3\n', 'mass (g)', 'ExcelFileOutput'), ('3\n', 'year', 'ExcelFileOutput'), ('4\n', 'mass (g)', 'XlsxFileOutput'), ('4\n', 'year', 'XlsxFileOutput')])
     def test_select_valid_output(self, sim_input: str, field: str, output_option: str, mock_outputs, write_stdin, capfd: CaptureFixture[str]):
         write_stdin(sim_input)
         select_output(self.data, field)
@@ -101,7 +108,7 @@ q - Quit the application
             select_output(self.data, field)
 
 
-    @mark.parametrize('bad_input', ['4', '0', '-1', 'show', 'SHOW', '1 Show', '!', '?', 'b', 'B'])
+    @mark.parametrize('bad_input', ['5', '0', '-1', 'show', 'SHOW', '1 Show', '!', '?', 'b', 'B'])
     def test_bad_input(self, bad_input: str, mock_outputs, monkeypatch: MonkeyPatch, write_stdin, capfd: CaptureFixture[str]):
         write_stdin(f'{bad_input}\n\n1\n')
         expected_error = '''\x1B[1m\x1B[31m
@@ -112,3 +119,95 @@ ERROR! Invalid option. Please enter the number or letter of your selection.
 
         select_output(self.data, 'mass (g)')
         assert capfd.readouterr().out == f'{self.expected_menu}{expected_error}{self.expected_menu}\nTerminalOutput selected. data: {self.data}, field: mass (g)\n'
+
+
+class TestFilterStream:
+    data = TestSelectOutput.data
+
+    @mark.parametrize('field,limits', [('mass (g)', (40, 1000)), ('year', (2013, 2013)), ('mass (g)', (float('-inf'), 0))])
+    def test_matches_filter_data(self, field: str, limits: tuple[float, float]):
+        assert list(filter_stream(iter(self.data), field, *limits)) == filter_data(self.data, field, *limits)
+
+
+    def test_unordered(self):
+        rows = filter_stream(iter(self.data), 'mass (g)', 40, 1000, ordered=False)
+        assert [row['name'] for row in rows] == ['Northwest Africa 7812', 'Northwest Africa 7822', 'Northwest Africa 7855']
+
+
+    def test_filter_file(self, tmp_path, monkeypatch: MonkeyPatch):
+        source = tmp_path / 'landings.tsv'
+        fieldnames = list(self.data[0].keys())
+        source.write_text('\t'.join(fieldnames) + '\n' + ''.join('\t'.join('' if row[field] is None else str(row[field]) for field in fieldnames) + '\n' for row in self.data))
+
+        output = tmp_path / 'output.txt'
+        monkeypatch.setattr('meteorite_filter.output._gen_filename', lambda *args, **kargs: str(output))
+
+        filter_file(str(source), 'mass (g)', 40, 1000)
+        lines = output.read_text().splitlines()
+        assert lines[0].split('\t') == fieldnames
+        assert [line.split('\t')[fieldnames.index('name')] for line in lines[1:]] == ['Northwest Africa 7822', 'Northwest Africa 7812', 'Northwest Africa 7855']
+
+
+class TestInput:
+    def test_filter_range_input_retries(self, write_stdin, capfd: CaptureFixture[str]):
+        write_stdin('\n\n\nabc\n5\n\n1900\n\n') # Each error is followed by a pause
+        assert filter_range_input('the year') == (1900.0, float('inf'))
+
+        out = capfd.readouterr().out
+        assert 'At least one limit must be set.' in out and 'Limits must be valid numeric values.' in out
+
+
+    def test_get_reader_retries(self, tmp_path, write_stdin, capfd: CaptureFixture[str]):
+        path = tmp_path / 'data.txt'
+        path.write_text('name\tyear\nMeteorite\t2000\n')
+
+        write_stdin(f'{tmp_path / "missing.txt"}\n\n\n\n' * 3 + f'{path}\n\n\n')
+        reader = get_reader()
+
+        assert reader.path == str(path)
+        assert capfd.readouterr().out.count('Could not open') == 3
+
+
+class TestParseArgs:
+    def test_workers(self):
+        assert parse_args([]).workers is None
+        assert parse_args(['--workers', '4']).workers == 4
+
+        with pytest.raises(SystemExit):
+            parse_args(['--workers', '0'])
+
+
+class TestBackgroundLoading:
+    def make_loader(self, tmp_path) -> BackgroundLoader:
+        path = tmp_path / 'data.txt'
+        path.write_text('name\tyear\n' + ''.join(f'Meteorite {num}\t{1900 + num}\n' for num in range(100)))
+        return BackgroundLoader(DSVDictReader(str(path), '\t', type_map={'year': int}))
+
+
+    def test_use_loaded_rows(self, tmp_path, write_stdin, capfd: CaptureFixture[str]):
+        loader = self.make_loader(tmp_path)
+
+        with loader.lock: # Nothing loads until the query has run
+            loader.start()
+            write_stdin('2\n')
+            choose_loaded_data(loader)
+
+            assert not loader.done
+            assert filter_data(loader.table, 'year', 1900, 1950) == []
+
+        assert 'The data is still loading. Loaded 0 rows' in capfd.readouterr().out
+        assert loader.wait(10)
+
+
+    def test_wait_for_rows(self, tmp_path, write_stdin, capfd: CaptureFixture[str]):
+        loader = self.make_loader(tmp_path)
+        loader.lock.acquire()
+        loader.start()
+
+        write_stdin('\n') # Wait, the default
+        Timer(0.1, loader.lock.release).start() # Let loading continue once the user is waiting
+        choose_loaded_data(loader)
+
+        assert loader.done
+        assert len(filter_data(loader.table, 'year', 1900, 1950)) == 51
+        assert 'Loaded 100 rows in ' in capfd.readouterr().out
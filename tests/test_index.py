@@ -0,0 +1,58 @@
+from pathlib import Path
+from pytest import fixture, mark
+from meteorite_filter.constants import TYPE_MAP
+from meteorite_filter.dsv.reader import DSVDictReader
+from meteorite_filter.filter_data import filter_data
+from meteorite_filter.index import SortedIndex
+
+
+DATA_PATH = Path(__file__).parents[1] / 'data' / 'meteorite_landings_data.txt'
+
+
+@fixture(scope='module')
+def landings() -> list[dict]:
+    return list(DSVDictReader(str(DATA_PATH), delimiter='\t', type_map=TYPE_MAP))
+
+
+class TestSortedIndex:
+    data = [
+        {'name': 'Delta', 'year': 2000},
+        {'name': 'Alpha', 'year': None},
+        {'name': 'Charlie', 'year': 1990},
+        {'name': 'Bravo', 'year': 2000},
+        {'name': 'Echo', 'year': 1980}
+    ]
+
+    def test_nulls_excluded(self):
+        index = SortedIndex(self.data, 'year')
+        assert len(index) == 4
+        assert all(row['year'] is not None for row in index.range())
+
+
+    def test_range(self):
+        index = SortedIndex(self.data, 'year')
+        assert index.field == 'year'
+        assert [row['name'] for row in index.range()] == ['Echo', 'Charlie', 'Bravo', 'Delta']
+        assert [row['name'] for row in index.range(1990, 2000)] == ['Charlie', 'Bravo', 'Delta']
+        assert [row['name'] for row in index.range(1981, 1999)] == ['Charlie']
+        assert index.range(2001) == []
+        assert index.range(2000, 1990) == []
+        assert index.range(float('nan')) == []
+        assert index.positions(max_val=1990) == [4, 2]
+
+
+    def test_head_tail(self):
+        index = SortedIndex(self.data, 'year')
+        assert [row['name'] for row in index.head(2)] == ['Echo', 'Charlie']
+        assert [row['name'] for row in index.tail(3)] == ['Delta', 'Bravo', 'Charlie']
+        assert len(index.tail(10)) == 4
+        assert index.head(0) == index.tail(0) == []
+
+
+    @mark.parametrize('field,limits', [
+        ('year', (1900, 1950)), ('year', (float('-inf'), 1800)), ('year', (2013, float('inf'))),
+        ('mass (g)', (0, 10)), ('mass (g)', (1000.5, 20000)), ('mass (g)', (float('-inf'), float('inf')))
+    ])
+    def test_matches_scan(self, landings: list[dict], field: str, limits: tuple[float, float]):
+        index = SortedIndex(landings, field)
+        assert filter_data(landings, field, *limits, index=index) == filter_data(landings, field, *limits)
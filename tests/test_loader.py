@@ -0,0 +1,90 @@
+from pathlib import Path
+import pytest
+from meteorite_filter.dsv.columnar import MeteoriteTable
+from meteorite_filter.dsv.reader import DSVDictReader
+from meteorite_filter.loader import *
+
+
+TYPES = {'year': int, 'mass (g)': float}
+
+
+def write_data(path: Path, count: int, bad_row: int | None = None) -> str:
+    lines = ['name\tyear\tmass (g)'] + [f'Meteorite {num}\t{"bad" if num == bad_row else 1900 + num}\t{num * 1.5}' for num in range(count)]
+    path.write_text('\n'.join(lines) + '\n')
+    return str(path)
+
+
+class TestBackgroundLoader:
+    @pytest.mark.parametrize('mode', ['r', 'rb'])
+    def test_load(self, tmp_path: Path, mode: str):
+        path = write_data(tmp_path / 'data.txt', 1000)
+        completed = []
+
+        loader = BackgroundLoader(DSVDictReader(path, '\t', type_map=TYPES, mode=mode), on_complete=completed.append)
+        loader.BATCH_SIZE = 64
+        assert loader.start().wait(10)
+
+        assert loader.done
+        assert completed == [loader.table]
+        assert list(loader.table) == list(MeteoriteTable.from_reader(DSVDictReader(path, '\t', type_map=TYPES)))
+
+        rows, bytes_read, total_bytes, elapsed = loader.progress()
+        assert (rows, bytes_read) == (1000, total_bytes)
+        assert elapsed >= 0
+        assert str(loader).startswith('Loaded 1,000 rows in ')
+
+
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_workers(self, tmp_path: Path, workers: int):
+        path = write_data(tmp_path / 'data.txt', 1000)
+        reader = DSVDictReader(path, '\t', type_map=TYPES, usecols=['mass (g)', 'name'])
+
+        loader = BackgroundLoader(reader, workers=workers)
+        assert loader.start().wait(10)
+
+        assert loader.table.fieldnames == ['name', 'mass (g)']
+        assert list(loader.table) == list(MeteoriteTable.from_reader(DSVDictReader(path, '\t', type_map=TYPES, usecols=['name', 'mass (g)'])))
+
+        rows, bytes_read, total_bytes, _ = loader.progress()
+        assert (rows, bytes_read) == (1000, total_bytes)
+
+
+    def test_workers_error(self, tmp_path: Path):
+        loader = BackgroundLoader(DSVDictReader(write_data(tmp_path / 'data.txt', 100, bad_row=50), '\t', type_map=TYPES), workers=2)
+
+        with pytest.raises(ValueError):
+            loader.start().wait(10)
+
+        assert loader.done
+
+
+    def test_lock_pauses_loading(self, tmp_path: Path):
+        loader = BackgroundLoader(DSVDictReader(write_data(tmp_path / 'data.txt', 100), '\t', type_map=TYPES))
+
+        with loader.lock:
+            loader.start()
+            assert not loader.wait(0.05)
+            assert len(loader.table) == 0
+            assert 'Loaded 0 rows (0.0 of ' in str(loader)
+
+        assert loader.wait(10)
+        assert len(loader.table) == 100
+
+
+    def test_error(self, tmp_path: Path):
+        loader = BackgroundLoader(DSVDictReader(write_data(tmp_path / 'data.txt', 100, bad_row=50), '\t', type_map=TYPES))
+        loader.BATCH_SIZE = 16
+
+        with pytest.raises(ValueError):
+            loader.start().wait(10)
+
+        assert loader.done
+        assert len(loader.table) == 48 # The complete batches before the bad row
+
+
+    def test_from_table(self):
+        table = MeteoriteTable(['name'])
+        loader = BackgroundLoader.from_table(table)
+
+        assert loader.done and loader.wait(0)
+        assert loader.table is table
@@ -1,6 +1,6 @@
 from pathlib import Path
 from pytest import MonkeyPatch
-from meteorite_filter.output import TerminalOutput, TextFileOutput
+from meteorite_filter.output import StdoutOutput, SummaryTextFileOutput, TerminalOutput, TextFileOutput
 from meteorite_filter.tui.table import TablePrinter
 
 class TestTerminalOutput:
@@ -50,3 +50,51 @@ class TestTextFileOutput:
         TextFileOutput.output(data, field)
 
         assert path.read_text() == 'name\tmass (g)\nMeteorite 1\t-1.0\nMeteorite 2\t0.0\nMeteorite 3\t1.0\n'
+
+
+    def test_output_stream(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+        path: Path = tmp_path / 'test_output_stream.txt'
+        monkeypatch.setattr('meteorite_filter.output._gen_filename', lambda *args, **kargs: str(path))
+
+        TextFileOutput.output(({'name': f'Meteorite {num}', 'year': num} for num in range(3)), 'year')
+        assert path.read_text() == 'name\tyear\nMeteorite 0\t0\nMeteorite 1\t1\nMeteorite 2\t2\n'
+
+        path.unlink()
+        TextFileOutput.output(iter([]), 'year')
+        assert not path.exists()
+
+
+    def test_output_path(self, tmp_path: Path):
+        path: Path = tmp_path / 'test_output_path.txt'
+
+        TextFileOutput.output([{'name': 'Meteorite 1', 'year': 1999}], 'year', str(path))
+        assert path.read_text() == 'name\tyear\nMeteorite 1\t1999\n'
+
+
+class TestStdoutOutput:
+    def test_output(self, capfd):
+        StdoutOutput.output(({'name': f'Meteorite {num}', 'mass (g)': num / 2} for num in range(3)), 'mass (g)')
+
+        captured = capfd.readouterr()
+        assert captured.out == 'name\tmass (g)\nMeteorite 0\t0.0\nMeteorite 1\t0.5\nMeteorite 2\t1.0\n'
+
+
+class TestSummaryTextFileOutput:
+    def test_output(self, tmp_path: Path, monkeypatch: MonkeyPatch, capfd):
+        path: Path = tmp_path / 'test_summary.txt'
+        monkeypatch.setattr('meteorite_filter.output._gen_filename', lambda *args, **kargs: str(path))
+
+        SummaryTextFileOutput.output([{'year': 1990, 'count': 2}, {'year': 1991, 'count': 1}], 'year')
+
+        assert path.read_text() == 'year\tcount\n1990\t2\n1991\t1\n'
+        assert f'Saved {path} in ' in capfd.readouterr().out
+
+
+    def test_empty(self, tmp_path: Path, monkeypatch: MonkeyPatch, capfd):
+        path: Path = tmp_path / 'test_summary_empty.txt'
+        monkeypatch.setattr('meteorite_filter.output._gen_filename', lambda *args, **kargs: str(path))
+
+        SummaryTextFileOutput.output([], 'year')
+
+        assert not path.exists()
+        assert 'no file was saved' in capfd.readouterr().out
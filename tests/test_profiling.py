@@ -0,0 +1,137 @@
+import pstats
+import threading
+
+from pytest import CaptureFixture, fixture, raises
+
+from meteorite_filter import profiling
+from meteorite_filter.filter_data import filter_data
+from meteorite_filter.tui.utils import quit_app
+
+
+DATA = [{'name': f'Meteorite {num}', 'year': 1900 + num % 50} for num in range(200)]
+
+
+@fixture(autouse=True)
+def stop_profiling():
+    yield
+    profiling.disable()
+
+
+class TestDisabled:
+    def test_null_stage(self):
+        assert not profiling.enabled()
+        assert profiling.stage('filter') is profiling.stage('render')
+
+        with profiling.stage('filter') as filtering:
+            filtering.rows = 10
+
+        assert filtering.rows is None
+
+
+    def test_finish(self, capfd: CaptureFixture[str]):
+        profiling.finish()
+        assert capfd.readouterr().out == ''
+
+
+class TestStages:
+    def test_records(self):
+        session = profiling.enable()
+        result = filter_data(DATA, 'year', 1900, 1909)
+
+        with profiling.stage('render', 5):
+            pass
+
+        assert [(record.name, record.rows) for record in session.records] == [('filter', len(result)), ('render', 5)]
+        assert all(record.seconds >= 0 and record.peak_memory is not None for record in session.records)
+
+
+    def test_nested(self):
+        session = profiling.enable()
+
+        with profiling.stage('query'):
+            filter_data(DATA, 'year', 1900, 1909)
+
+        assert [record.name for record in session.records] == ['query > filter', 'query']
+
+
+    def test_peak_memory(self):
+        session = profiling.enable()
+
+        with profiling.stage('outer'):
+            with profiling.stage('inner'):
+                buffer = bytearray(8 * 1024 * 1024)
+                del buffer
+
+            with profiling.stage('after'):
+                pass
+
+        peaks = {record.name: record.peak_memory for record in session.records}
+        assert peaks['outer > inner'] >= 8 * 1024 * 1024
+        assert peaks['outer'] >= peaks['outer > inner'] # The inner stage's peak is not lost when the next stage resets it
+        assert peaks['outer > after'] < 1024 * 1024
+
+
+    def test_without_memory(self):
+        session = profiling.enable(trace_memory=False)
+
+        with profiling.stage('filter'):
+            pass
+
+        assert session.records[0].peak_memory is None
+
+
+    def test_threads(self):
+        session = profiling.enable()
+
+        def parse():
+            with profiling.stage('parse'):
+                pass
+
+        with profiling.stage('query'): # Stages on other threads are not nested inside it
+            thread = threading.Thread(target=parse)
+            thread.start()
+            thread.join()
+
+        assert [record.name for record in session.records] == ['parse', 'query']
+
+
+class TestSummary:
+    def test_summary(self):
+        session = profiling.enable()
+
+        for _ in range(2):
+            filter_data(DATA, 'year', 1900, 1909)
+
+        lines = session.summary().splitlines()
+        assert lines[1].split() == ['STAGE', 'RUNS', 'ROWS', 'TOTAL', '(s)', 'SLOWEST', '(s)', 'PEAK', '(MB)']
+        assert lines[3].split()[:3] == ['filter', '2', '80']
+
+
+    def test_quit_app(self, capfd: CaptureFixture[str]):
+        profiling.enable()
+        filter_data(DATA, 'year', 1900, 1909)
+
+        with raises(SystemExit):
+            quit_app()
+
+        out = capfd.readouterr().out
+        assert 'filter' in out and out.index('filter') < out.index('Goodbye')
+        assert not profiling.enabled()
+
+
+    def test_profile_output(self, tmp_path, capfd: CaptureFixture[str]):
+        path = tmp_path / 'session.prof'
+        profiling.enable(str(path))
+
+        def load():
+            with profiling.profile_thread():
+                filter_data(DATA, 'name', 'Meteorite 1', 'Meteorite 2')
+
+        thread = threading.Thread(target=load)
+        thread.start()
+        thread.join()
+        profiling.finish()
+
+        assert str(path) in capfd.readouterr().out
+        functions = {function for _, _, function in pstats.Stats(str(path)).stats} # type: ignore
+        assert 'filter_data' in functions
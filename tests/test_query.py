@@ -0,0 +1,120 @@
+from pathlib import Path
+import pytest
+from pytest import fixture, mark
+from meteorite_filter.constants import TYPE_MAP
+from meteorite_filter.dsv.reader import DSVDictReader
+from meteorite_filter.filter_data import filter_data
+from meteorite_filter.index import SortedIndex
+from meteorite_filter.query import *
+
+
+DATA_PATH = Path(__file__).parents[1] / 'data' / 'meteorite_landings_data.txt'
+
+
+@fixture(scope='module')
+def landings() -> list[dict]:
+    return list(DSVDictReader(str(DATA_PATH), delimiter='\t', type_map=TYPE_MAP))
+
+
+class TestTopK:
+    data = [
+        {'name': 'Delta', 'mass (g)': 20.0},
+        {'name': 'Alpha', 'mass (g)': None},
+        {'name': 'Charlie', 'mass (g)': 5.5},
+        {'name': 'Bravo', 'mass (g)': 20.0},
+        {'name': 'Echo', 'mass (g)': 1.0}
+    ]
+
+    @mark.parametrize('use_index', [False, True])
+    def test_top_k(self, use_index: bool):
+        index = SortedIndex(self.data, 'mass (g)') if use_index else None
+
+        assert [row['name'] for row in top_k(self.data, 'mass (g)', 3, index=index)] == ['Delta', 'Bravo', 'Charlie']
+        assert [row['name'] for row in top_k(self.data, 'mass (g)', 2, largest=False, index=index)] == ['Echo', 'Charlie']
+        assert len(top_k(self.data, 'mass (g)', 10, index=index)) == 4
+        assert top_k(self.data, 'mass (g)', 0, index=index) == []
+
+
+    @mark.parametrize('use_index', [False, True])
+    def test_top_percent(self, use_index: bool):
+        index = SortedIndex(self.data, 'mass (g)') if use_index else None
+
+        assert [row['name'] for row in top_percent(self.data, 'mass (g)', 50, index=index)] == ['Delta', 'Bravo']
+        assert [row['name'] for row in top_percent(self.data, 'mass (g)', 1, largest=False, index=index)] == ['Echo'] # Rounded up to one row
+        assert len(top_percent(self.data, 'mass (g)', 100, index=index)) == 4
+
+
+    def test_ties(self):
+        data = [{'name': 'Alpha', 'mass (g)': float(num % 3), 'id': num} for num in range(9)]
+        index = SortedIndex(data, 'mass (g)')
+
+        for k in range(10):
+            for largest in (True, False):
+                assert top_k(data, 'mass (g)', k, largest, index) == top_k(data, 'mass (g)', k, largest)
+
+        assert [row['id'] for row in top_k(data, 'mass (g)', 4, index=index)] == [2, 5, 8, 1] # Ties keep their order in the data
+
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            top_k(self.data, 'mass (g)', -1)
+
+        for percent in (0, -5, 100.5):
+            with pytest.raises(ValueError):
+                top_percent(self.data, 'mass (g)', percent)
+
+
+    @mark.parametrize('field', ['mass (g)', 'year'])
+    @mark.parametrize('k', [1, 10, 500])
+    def test_matches_full_sort(self, landings: list[dict], field: str, k: int):
+        ordered = filter_data(landings, field)
+        index = SortedIndex(landings, field)
+
+        assert top_k(landings, field, k, largest=False) == top_k(landings, field, k, largest=False, index=index) == ordered[:k]
+        assert top_k(landings, field, k) == top_k(landings, field, k, index=index) == ordered[::-1][:k]
+
+
+class TestPredicate:
+    def test_abstract(self):
+        class NoCall(Predicate):
+            def _key(self) -> tuple:
+                return ('none', self.field)
+
+        with pytest.raises(TypeError):
+            NoCall('year')
+
+
+class TestQueryPlanner:
+    predicates = [RangePredicate('year', 1900, 1950), RangePredicate('mass (g)', 10000), EqualsPredicate('recclass', 'H5')]
+
+    def test_plan(self, landings: list[dict]):
+        planner = QueryPlanner(landings, {field: SortedIndex(landings, field) for field in ('year', 'mass (g)')})
+        plan = planner.plan(self.predicates)
+
+        assert plan.driver == RangePredicate('year', 1900, 1950) # Most finds are recent, so early falls are rarer than heavy meteorites
+        assert plan.filters == [RangePredicate('mass (g)', 10000), EqualsPredicate('recclass', 'H5')]
+        assert plan.estimate == SortedIndex(landings, 'year').count(1900, 1950)
+        assert str(plan) == f'index range 1900 <= year <= 1950 (~{plan.estimate} rows), then check mass (g) >= 10000, then check recclass = H5'
+
+
+    def test_scan_plan(self, landings: list[dict]):
+        plan = QueryPlanner(landings).plan(self.predicates)
+
+        assert plan.driver is None
+        assert plan.estimate == len(landings)
+        assert plan.filters == [RangePredicate('year', 1900, 1950), RangePredicate('mass (g)', 10000), EqualsPredicate('recclass', 'H5')]
+
+
+    @mark.parametrize('indexed', [(), ('year',), ('mass (g)',), ('year', 'mass (g)')])
+    def test_run(self, landings: list[dict], indexed: tuple[str, ...]):
+        planner = QueryPlanner(landings, {field: SortedIndex(landings, field) for field in indexed})
+        expected = [row for row in filter_data(landings, 'year', 1900, 1950) if row['mass (g)'] is not None and row['mass (g)'] >= 10000 and row['recclass'] == 'H5']
+
+        assert len(expected) > 0
+        assert planner.run(self.predicates) == expected
+        assert planner.run([EqualsPredicate('recclass', 'no such class'), *self.predicates]) == []
+
+
+    def test_invalid(self, landings: list[dict]):
+        with pytest.raises(ValueError):
+            QueryPlanner(landings).run([])
@@ -0,0 +1,68 @@
+import pytest
+from meteorite_filter.filter_data import filter_data
+from meteorite_filter.resultcache import *
+
+
+class TestResultCache:
+    data = [{'name': f'Meteorite {num}', 'year': 1900 + num} for num in range(10)]
+
+    def query(self, min_val: int, max_val: int):
+        self.runs += 1
+        return filter_data(self.data, 'year', min_val, max_val)
+
+
+    def setup_method(self):
+        self.runs = 0
+
+
+    def test_hits(self):
+        cache = ResultCache(self.data)
+        first = cache.get_or_compute(('year', 1901, 1905), lambda: self.query(1901, 1905))
+        second = cache.get_or_compute(('year', 1901, 1905), lambda: self.query(1901, 1905))
+
+        assert second is first
+        assert self.runs == 1
+        assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+        assert str(cache).startswith('Result cache: 1 hits, 1 misses (50% hit rate), 0 evictions, 1 of 32 entries')
+
+
+    def test_entry_eviction(self):
+        cache = ResultCache(self.data, max_entries=2)
+        cache.get_or_compute('a', lambda: self.query(1900, 1901))
+        cache.get_or_compute('b', lambda: self.query(1902, 1903))
+        cache.get_or_compute('a', lambda: self.query(1900, 1901)) # 'b' is now least recently used
+        cache.get_or_compute('c', lambda: self.query(1904, 1905))
+
+        assert 'a' in cache and 'c' in cache and 'b' not in cache
+        assert cache.evictions == 1
+        assert self.runs == 3
+
+
+    def test_memory_eviction(self):
+        small = list(filter_data(self.data, 'year', 1900, 1900))
+        cache = ResultCache(self.data, max_bytes=1024)
+        cache.get_or_compute('small', lambda: small)
+        cache.get_or_compute('large', lambda: list(self.query(1900, 1909))) # Larger than the whole budget, so never cached
+        cache.get_or_compute('view', lambda: self.query(1900, 1909)) # Views only store positions, so are much smaller
+
+        assert 'small' in cache and 'large' not in cache and 'view' in cache
+        assert 0 < cache.nbytes <= 1024
+
+
+    def test_invalidation(self):
+        data = list(self.data)
+        cache = ResultCache(data)
+        cache.get_or_compute('all', lambda: filter_data(data, 'year'))
+        data.append({'name': 'Meteorite 10', 'year': 1910})
+
+        assert 'all' not in cache
+        assert len(cache.get_or_compute('all', lambda: filter_data(data, 'year'))) == 11
+        assert cache.misses == 2
+
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            ResultCache(self.data, max_entries=0)
+
+        with pytest.raises(ValueError):
+            ResultCache(self.data, max_bytes=0)
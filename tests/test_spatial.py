@@ -0,0 +1,75 @@
+from pathlib import Path
+from random import Random
+import pytest
+from pytest import fixture
+from meteorite_filter.constants import TYPE_MAP
+from meteorite_filter.dsv.reader import DSVDictReader
+from meteorite_filter.spatial import *
+
+
+DATA_PATH = Path(__file__).parents[1] / 'data' / 'meteorite_landings_data.txt'
+
+
+@fixture(scope='module')
+def landings() -> list[dict]:
+    return list(DSVDictReader(str(DATA_PATH), delimiter='\t', type_map=TYPE_MAP))
+
+
+class TestGridIndex:
+    data = [
+        {'name': 'London', 'reclat': 51.5, 'reclong': -0.12},
+        {'name': 'Oxford', 'reclat': 51.75, 'reclong': -1.26},
+        {'name': 'Paris', 'reclat': 48.86, 'reclong': 2.35},
+        {'name': 'Placeholder', 'reclat': 0.0, 'reclong': 0.0},
+        {'name': 'Unknown', 'reclat': None, 'reclong': None},
+        {'name': 'Fiji', 'reclat': -17.8, 'reclong': 178.1},
+        {'name': 'Samoa', 'reclat': -13.8, 'reclong': -172.1}
+    ]
+
+    def names(self, rows: list[dict]) -> list[str]:
+        return [row['name'] for row in rows]
+
+
+    def test_haversine(self):
+        assert haversine(51.5, -0.12, 48.86, 2.35) == pytest.approx(342.2, abs=0.1)
+        assert haversine(10, 20, 10, 20) == 0
+
+
+    def test_within(self):
+        grid = GridIndex(self.data)
+        assert len(grid) == 5
+        assert self.names(grid.within(51.5, -0.12, 100)) == ['London', 'Oxford']
+        assert self.names(grid.within(51.5, -0.12, 400)) == ['London', 'Oxford', 'Paris']
+        assert self.names(grid.within(-16, 180, 1000)) == ['Fiji', 'Samoa'] # Across the 180th meridian
+        assert self.names(grid.within(89, 0, 10000)) == ['Oxford', 'London', 'Paris'] # Reaching over the pole
+        assert grid.within(0, 0, 100) == []
+
+
+    def test_bbox(self):
+        grid = GridIndex(self.data)
+        assert self.names(grid.bbox(48, 52, -2, 3)) == ['Paris', 'London', 'Oxford']
+        assert self.names(grid.bbox(-20, -10, 170, -170)) == ['Fiji', 'Samoa']
+        assert grid.bbox(52, 48, -2, 3) == []
+
+
+    def test_placeholders(self):
+        grid = GridIndex(self.data, include_placeholders=True)
+        assert self.names(grid.within(0, 0, 100)) == ['Placeholder']
+
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            GridIndex(self.data, cell_size=0)
+
+
+    def test_matches_scan(self, landings: list[dict]):
+        grid = GridIndex(landings, cell_size=2.5)
+        located = [row for row in landings if row['reclat'] is not None and row['reclong'] is not None and (row['reclat'], row['reclong']) != (0, 0)]
+        rng = Random(390)
+
+        for _ in range(50):
+            lat, lon, radius = rng.uniform(-90, 90), rng.uniform(-180, 180), rng.choice([50, 500, 5000])
+            distance = lambda row: haversine(lat, lon, row['reclat'], row['reclong'])
+            expected = sorted((row for row in located if distance(row) <= radius), key=lambda row: (distance(row), row['name']))
+
+            assert grid.within(lat, lon, radius) == expected
@@ -0,0 +1,35 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+SRC_PATH = Path(__file__).parents[1] / 'src'
+
+# The cumulative time to import the application, in microseconds. It is about 40 ms when
+# output backends and NumPy are loaded on first use, and about 190 ms when they are not.
+IMPORT_TIME_BUDGET_US = 100_000
+
+LAZY_MODULES = ['xlwt', 'numpy', 'zipfile', 'tempfile', 'cProfile', 'pstats', 'meteorite_filter.dsv.excel', 'meteorite_filter.dsv.xlsx', 'meteorite_filter.extsort']
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, 'PYTHONPATH': str(SRC_PATH)}
+    return subprocess.run([sys.executable, *args], env=env, capture_output=True, text=True, check=True)
+
+
+class TestStartup:
+    def test_backends_not_imported(self):
+        result = run_python('-c', f'import sys, meteorite_filter.filter_data; print(*[name for name in {LAZY_MODULES!r} if name in sys.modules])')
+        assert result.stdout.split() == []
+
+
+    def test_import_time(self):
+        times = []
+
+        for _ in range(3): # Take the best of several runs, as the first may be slowed by compiling bytecode
+            stderr = run_python('-X', 'importtime', '-c', 'import meteorite_filter.filter_data').stderr
+            line = next(line for line in stderr.splitlines() if line.rstrip().endswith('| meteorite_filter.filter_data'))
+            times.append(int(line.split('|')[1]))
+
+        assert min(times) < IMPORT_TIME_BUDGET_US, f'Importing the application took {min(times) / 1000:.1f} ms'
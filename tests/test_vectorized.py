@@ -0,0 +1,68 @@
+from pathlib import Path
+import pytest
+from pytest import fixture, mark
+from meteorite_filter.constants import TYPE_MAP
+from meteorite_filter.dsv.columnar import MeteoriteTable
+from meteorite_filter.dsv.reader import DSVDictReader
+from meteorite_filter.filter_data import filter_data
+from meteorite_filter.index import SortedIndex
+
+pytest.importorskip('numpy')
+
+from meteorite_filter.vectorized import *
+
+
+DATA_PATH = Path(__file__).parents[1] / 'data' / 'meteorite_landings_data.txt'
+
+
+@fixture(scope='module')
+def landings() -> list[dict]:
+    return list(DSVDictReader(str(DATA_PATH), delimiter='\t', type_map=TYPE_MAP))
+
+
+@fixture(scope='module')
+def table() -> MeteoriteTable:
+    return MeteoriteTable.from_reader(DSVDictReader(str(DATA_PATH), delimiter='\t', type_map=TYPE_MAP))
+
+
+class TestVectorized:
+    rows = [
+        {'name': 'Delta', 'year': 2000, 'mass (g)': 1.5},
+        {'name': 'Alpha', 'year': None, 'mass (g)': 1.5},
+        {'name': 'Bravo', 'year': 2000, 'mass (g)': None},
+        {'name': 'Bravo', 'year': 2000, 'mass (g)': 0.25}, # Same value and name as the row before, so order is kept
+        {'name': '', 'year': 1980, 'mass (g)': 9.0}
+    ]
+
+    def test_supports(self, table: MeteoriteTable, landings: list[dict]):
+        assert supports(table, 'year')
+        assert not supports(table, 'recclass')
+        assert not supports(landings, 'year')
+
+
+    @mark.parametrize('field', ['year', 'mass (g)'])
+    def test_small_table(self, field: str):
+        table = MeteoriteTable(['name', 'year', 'mass (g)'], {'year': int, 'mass (g)': float})
+        table.extend(self.rows)
+
+        for limits in [(), (1990,), (float('-inf'), 1.5), (2001,), (float('nan'),)]:
+            assert [row.pos for row in filter_table(table, field, *limits)] == [self.rows.index(row) for row in filter_data(self.rows, field, *limits)]
+
+        positions, keys = sorted_positions(table, field)
+        assert [self.rows[pos] for pos in positions] == filter_data(self.rows, field)
+        assert keys == [self.rows[pos][field] for pos in positions]
+
+
+    def test_empty_table(self):
+        table = MeteoriteTable(['name', 'year'], {'year': int})
+        assert filter_table(table, 'year') == []
+        assert sorted_positions(table, 'year') == ([], [])
+
+
+    @mark.parametrize('field,limits', [
+        ('year', (1900, 1950)), ('year', (float('-inf'), 1800)), ('year', (2013, float('inf'))),
+        ('mass (g)', (0, 10)), ('mass (g)', (1000.5, 20000)), ('mass (g)', (float('-inf'), float('inf')))
+    ])
+    def test_matches_python(self, table: MeteoriteTable, landings: list[dict], field: str, limits: tuple[float, float]):
+        assert filter_table(table, field, *limits) == filter_data(landings, field, *limits)
+        assert SortedIndex(table, field).range(*limits) == SortedIndex(landings, field).range(*limits)
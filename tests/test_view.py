@@ -0,0 +1,42 @@
+from meteorite_filter.dsv.columnar import MeteoriteTable
+from meteorite_filter.filter_data import filter_data
+from meteorite_filter.index import SortedIndex
+from meteorite_filter.view import *
+
+
+class TestResultView:
+    data = [{'name': f'Meteorite {num}', 'year': 1900 + num % 5} for num in range(20)]
+
+    def test_sequence(self):
+        view = ResultView(self.data, [3, 1, 4])
+
+        assert len(view) == 3
+        assert view[0] is self.data[3]
+        assert view[-1] is self.data[4]
+        assert list(view) == [self.data[3], self.data[1], self.data[4]]
+        assert view == [self.data[3], self.data[1], self.data[4]]
+        assert [self.data[3], self.data[1], self.data[4]] == view
+        assert view != self.data[:3]
+        assert repr(view) == repr(list(view))
+
+
+    def test_slice(self):
+        view = ResultView(self.data, range(10))
+        part = view[2:8:2]
+
+        assert isinstance(part, ResultView)
+        assert part.positions.obj is view.positions.obj # Shares the positions rather than copying them
+        assert part == [self.data[2], self.data[4], self.data[6]]
+        assert view[::-1][0] is self.data[9]
+        assert view[20:] == []
+
+
+    def test_filter_results(self):
+        table = MeteoriteTable(['name', 'year'], {'year': int})
+        table.extend(self.data)
+
+        for data in (self.data, table):
+            result = filter_data(data, 'year', 1901, 1902)
+            assert isinstance(result, ResultView)
+            assert result == SortedIndex(data, 'year').range(1901, 1902)
+            assert [row['name'] for row in result[:3]] == ['Meteorite 1', 'Meteorite 11', 'Meteorite 16']
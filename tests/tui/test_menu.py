@@ -0,0 +1,39 @@
+import inspect
+import sys
+from io import StringIO
+from pytest import CaptureFixture, MonkeyPatch
+from meteorite_filter.tui.menu import *
+
+
+class TestMenu:
+    def test_invalid_selections(self, monkeypatch: MonkeyPatch, capfd: CaptureFixture[str]):
+        selected = []
+        menu = Menu([MenuItem('Item', lambda: 'item', selected.append)])
+
+        monkeypatch.setattr('sys.stdin', StringIO('0\n\n' * (sys.getrecursionlimit() + 100) + '1\n')) # Each invalid selection is followed by a pause
+        menu()
+
+        assert selected == ['item']
+        assert capfd.readouterr().out.count('ERROR! Invalid option.') == sys.getrecursionlimit() + 100
+
+
+    def test_returnable_items_keep_stack_flat(self, monkeypatch: MonkeyPatch, capfd: CaptureFixture[str]):
+        depths = []
+        menu = Menu([ReturnableMenuItem('Query', lambda: depths.append(len(inspect.stack(0))))], back=True)
+
+        monkeypatch.setattr('sys.stdin', StringIO('1\n' * (sys.getrecursionlimit() + 100) + 'b\n'))
+        menu()
+
+        assert len(depths) == sys.getrecursionlimit() + 100
+        assert len(set(depths)) == 1
+
+
+    def test_output(self, monkeypatch: MonkeyPatch, capfd: CaptureFixture[str]):
+        menu = Menu([ReturnableMenuItem('Again', lambda: print('again')), MenuItem('Done', lambda: print('done'))], 'Preamble')
+
+        monkeypatch.setattr('sys.stdin', StringIO('1\n2\n'))
+        menu()
+
+        listing = term_format('Preamble', TERM_FG_CYAN) + '\n1 - Again\n2 - Done\nq - Quit the application\n' + term_format('Type a letter or number to select your choice\n', TERM_FG_CYAN)
+        prompt = f'> {TERM_FG_GREEN[0]}{TERM_FG_GREEN[1]}'
+        assert capfd.readouterr().out == f'{listing}{prompt}\nagain\n\n{listing}{prompt}\ndone\n'
@@ -0,0 +1,73 @@
+from io import StringIO
+from pytest import CaptureFixture, MonkeyPatch
+import pytest
+from meteorite_filter.tui.pager import *
+from meteorite_filter.tui.table import TablePrinter
+
+
+def make_table(count: int) -> TablePrinter:
+    return TablePrinter(('', 'NAME', 'YEAR'), [(num, f'Meteorite {num}', 1900 + num) for num in range(1, count + 1)])
+
+
+class TestTablePrinter:
+    def test_page_matches_str(self):
+        table = make_table(12)
+        assert make_table(12).page(0, 12) == str(table)
+
+        lines = table.page(5, 8).splitlines()
+        assert lines[2:] == str(table).splitlines()[7:10]
+
+
+    def test_page_formats_only_range(self):
+        table = TablePrinter(('', 'NAME'), [(1, 'A'), (2, 'A much longer name')])
+        assert table.page(0, 1).splitlines()[0] == '     NAME'
+        assert table.page(1, 2).splitlines()[0] == '     NAME' + ' ' * 14 # Columns widen as longer values are shown
+
+
+class TestPager:
+    def test_navigation(self):
+        pager = Pager(make_table(25), page_size=10)
+        assert pager.page_count == 3
+        assert 'Rows 1-10 of 25 (page 1 of 3)' in pager.render()
+
+        assert pager.next() and pager.next()
+        assert not pager.next()
+        assert pager.start == 20
+        assert 'Rows 21-25 of 25 (page 3 of 3)' in pager.render()
+        assert 'Meteorite 25' in pager.render() and 'Meteorite 20' not in pager.render()
+
+        assert pager.prev()
+        assert pager.start == 10
+
+        pager.jump(1)
+        assert pager.start == 0
+        assert not pager.prev()
+
+        pager.jump(20)
+        assert pager.start == 10
+
+        with pytest.raises(ValueError):
+            pager.jump(26)
+
+        with pytest.raises(ValueError):
+            Pager(make_table(5), page_size=0)
+
+
+    def test_call(self, monkeypatch: MonkeyPatch, capfd: CaptureFixture[str]):
+        monkeypatch.setattr('sys.stdin', StringIO('n\n\np\n23\nb\n'))
+        Pager(make_table(25), page_size=10)()
+
+        statuses = [line for line in capfd.readouterr().out.splitlines() if 'Rows' in line]
+        assert [status[status.index('Rows'):status.index(' of')] for status in statuses] == ['Rows 1-10', 'Rows 11-20', 'Rows 21-25', 'Rows 11-20', 'Rows 21-25']
+
+
+    def test_call_past_last_page(self, monkeypatch: MonkeyPatch):
+        monkeypatch.setattr('sys.stdin', StringIO('\n\n'))
+        Pager(make_table(15), page_size=10)() # Returns without reading a third command
+
+
+    def test_call_quit(self, monkeypatch: MonkeyPatch):
+        monkeypatch.setattr('sys.stdin', StringIO('q\n'))
+
+        with pytest.raises(SystemExit):
+            Pager(make_table(15), page_size=10)()